@@ -0,0 +1,13 @@
+"""
+Throughput benchmarks of the simulator's hot paths, with a JSON history of runs.
+
+Usage (from the repository root):
+    PYTHONPATH=src python -m benchmarks [-k PATTERN] [--save] [--baseline LABEL] [--threshold 0.1]
+
+See benchmarks.cases for what is measured, benchmarks.runner for how, and
+benchmarks.history for the regression check.
+"""
+from .runner import Benchmark, Measurement, measure
+from .history import Comparison, compare, load_history, save_run
+
+__all__ = ["Benchmark", "Measurement", "measure", "Comparison", "compare", "load_history", "save_run"]
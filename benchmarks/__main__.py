@@ -0,0 +1,58 @@
+import argparse
+import fnmatch
+from pathlib import Path
+import sys
+
+from .cases import BENCHMARKS
+from .history import compare, find_run, load_history, save_run
+from .runner import measure
+
+DEFAULT_HISTORY = Path(__file__).with_name("history.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmarks, optionally save them and check them against a baseline.
+
+    Returns:
+        int: Exit status, 1 if a benchmark regressed past the threshold.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", "--select", default="*", help="glob pattern of the benchmark names to run")
+    parser.add_argument("--repeats", type=int, default=5, help="timed repeats per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per repeat")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--save", action="store_true", help="append this run to the history")
+    parser.add_argument("--label", help="label of the saved run")
+    parser.add_argument("--baseline", help="label of the baseline run (default: the latest saved run)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="tolerated relative slowdown")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    selected = [benchmark for benchmark in BENCHMARKS if fnmatch.fnmatch(benchmark.name, args.select)]
+    if args.list:
+        print("\n".join(benchmark.name for benchmark in selected))
+        return 0
+    baseline = find_run(load_history(args.history), args.baseline)
+    if args.baseline is not None and baseline is None:
+        parser.error(f"no saved run labelled {args.baseline!r} in {args.history}")
+
+    measurements = []
+    for benchmark in selected:
+        measurement = measure(benchmark, args.repeats, args.min_time)
+        measurements.append(measurement)
+        print(measurement, flush=True)
+
+    status = 0
+    if baseline is not None:
+        print(f"\n{'against ' + baseline['label']:<48}{'baseline':>16}{'current':>16}{'change':>9}")
+        for comparison in compare(measurements, baseline, args.threshold):
+            print(comparison)
+            status |= comparison.regressed
+    if args.save:
+        save_run(args.history, measurements, args.label)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
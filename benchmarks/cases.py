@@ -0,0 +1,146 @@
+"""
+The benchmarks of the hot paths, registered in BENCHMARKS in a stable order.
+
+Every operation count is chosen so that one call does enough work to dwarf the
+loop overhead of the runner, and all randomness is seeded, so successive runs
+time the same work.
+"""
+from cards import Card, Hand, RandomStream, Shoe, shoe_model
+from engine import Simulation
+from game import Dealer, Game, Player
+import strategies
+from strategies import CompiledStrategy, DeviationStrategy, PerfectStrategy
+
+from .runner import Benchmark
+
+# Hands dealt once and then replayed by the per-hand benchmarks
+DECISIONS: int = 1000
+# Rounds per call of the game benchmarks
+ROUNDS: int = 200
+
+PLAYER_COUNTS: tuple[int, ...] = (1, 3, 7)
+DECK_COUNTS: tuple[int, ...] = (1, 6, 8)
+# Alternatives to the shuffled shoe, see cards.shoe_models
+SHOE_MODELS: tuple[str, ...] = ("csm", "infinite")
+
+
+def _create_deck():
+    return Card.create_deck
+
+
+def _draw_card(num_decks: int, model: str = "shoe"):
+    def setup():
+        draw = shoe_model(model)(num_decks, rng=RandomStream(0)).draw_card
+        cards = range(DECISIONS)
+
+        def run():
+            for _ in cards:
+                draw()
+        return run
+    return setup
+
+
+def _reset(num_decks: int):
+    def setup():
+        return Shoe(num_decks, rng=RandomStream(0)).reset
+    return setup
+
+
+def _dealt_hands(num_hands: int, seed: int = 0) -> list[tuple[Hand, Card]]:
+    """
+    Two- and three-card hands with a dealer upcard, dealt from a seeded shoe; only
+    hands below 21, on which a player decides, are kept.
+    """
+    shoe = Shoe(6, rng=RandomStream(seed))
+    hands = []
+    while len(hands) < num_hands:
+        hand = Hand()
+        for _ in range(2 + len(hands) % 2):
+            hand.add_card(shoe.draw_card())
+        upcard = shoe.draw_card()
+        if hand.total < 21:
+            hands.append((hand, upcard))
+    return hands
+
+
+def _hand_value():
+    hands = [hand for hand, _ in _dealt_hands(DECISIONS)]
+
+    def run():
+        for hand in hands:
+            hand.value
+    return run
+
+
+def _next_move(make_strategy):
+    def setup():
+        strategy = make_strategy()
+        strategy.bind_rng(RandomStream(0))
+        strategy.bind_shoe(Shoe(6, rng=RandomStream(0)))
+        decisions = _dealt_hands(DECISIONS)
+        next_move = strategy.next_move
+
+        def run():
+            for hand, upcard in decisions:
+                next_move(hand, upcard)
+        return run
+    return setup
+
+
+def _dealer_play(hit_soft_17: bool):
+    def setup():
+        dealer = Dealer(hit_soft_17=hit_soft_17)
+        shoe = Shoe(6, rng=RandomStream(0))
+
+        def run():
+            dealer.reset_hand()
+            dealer.hand.add_card(shoe.draw_card())
+            dealer.hand.add_card(shoe.draw_card())
+            dealer.play(shoe)
+        return run
+    return setup
+
+
+def _game(num_players: int, num_decks: int) -> Game:
+    players = [Player(f"seat{i}", 0.0, PerfectStrategy()) for i in range(num_players)]
+    return Game(players=players, num_decks=num_decks, verbose=False, seed=0)
+
+
+def _play_round(num_players: int, num_decks: int):
+    def setup():
+        play_round = _game(num_players, num_decks).play_round
+        rounds = range(ROUNDS)
+
+        def run():
+            for _ in rounds:
+                play_round()
+        return run
+    return setup
+
+
+def _simulation_run():
+    simulation = Simulation(_game(1, 6))
+    return lambda: simulation.run(10 * ROUNDS, seed=0)
+
+
+# Strategies timed by strategy.next_move, by name
+STRATEGIES = {
+    **{name: getattr(strategies, name) for name in
+       ("RandomStrategy", "AggressiveStrategy", "SafeStrategy", "SplitStrategy", "BasicStrategy", "PerfectStrategy")},
+    "CompiledStrategy": lambda: CompiledStrategy(PerfectStrategy()),
+    "DeviationStrategy": DeviationStrategy,
+}
+
+BENCHMARKS: list[Benchmark] = [
+    Benchmark("card.create_deck", _create_deck),
+    *[Benchmark(f"shoe.draw_card[decks={decks}]", _draw_card(decks), DECISIONS) for decks in DECK_COUNTS],
+    *[Benchmark(f"shoe.reset[decks={decks}]", _reset(decks)) for decks in DECK_COUNTS],
+    *[Benchmark(f"shoe.draw_card[model={model},decks=6]", _draw_card(6, model), DECISIONS) for model in SHOE_MODELS],
+    Benchmark("hand.value", _hand_value, DECISIONS),
+    *[Benchmark(f"strategy.next_move[{name}]", _next_move(make), DECISIONS) for name, make in STRATEGIES.items()],
+    Benchmark("dealer.play[h17]", _dealer_play(True)),
+    Benchmark("dealer.play[s17]", _dealer_play(False)),
+    *[Benchmark(f"game.play_round[players={players},decks={decks}]", _play_round(players, decks), ROUNDS)
+      for players in PLAYER_COUNTS for decks in DECK_COUNTS],
+    Benchmark("simulation.run", _simulation_run, 10 * ROUNDS),
+]
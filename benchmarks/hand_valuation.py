@@ -0,0 +1,86 @@
+"""
+Per-round cost of hand valuation for the table-driven strategies.
+
+Plays the same number of rounds with the incremental Hand and with a Hand that
+re-sums its cards on every property access (how Hand.value used to work), and
+reports the time per round for PerfectStrategy and BasicStrategy.
+
+Usage:
+    PYTHONPATH=src python benchmarks/hand_valuation.py [rounds]
+"""
+import sys
+import time
+
+from cards import Hand
+from game import Game, Player
+import game.game
+from strategies import BasicStrategy, PerfectStrategy
+
+
+class RescanHand(Hand):
+    """A Hand that recomputes its value from the cards on every access."""
+
+    def _rescan(self) -> tuple[int, bool]:
+        total = sum(card.value for card in self.cards)
+        aces = sum(1 for card in self.cards if card.is_ace)
+        if aces and total + 10 <= 21:
+            return total + 10, True
+        return total, False
+
+    @property
+    def value(self) -> tuple[int, str]:
+        total, soft = self._rescan()
+        return total, "Soft" if soft else "Hard"
+
+    @property
+    def total(self) -> int:
+        return self._rescan()[0]
+
+    @property
+    def is_soft(self) -> bool:
+        return self._rescan()[1]
+
+    @property
+    def is_blackjack(self) -> bool:
+        return len(self.cards) == 2 and self._rescan()[0] == 21
+
+    @property
+    def is_bust(self) -> bool:
+        return self._rescan()[0] > 21
+
+    @property
+    def can_split(self) -> bool:
+        return len(self.cards) == 2 and self.cards[0].rank_index == self.cards[1].rank_index
+
+
+def time_per_round(strategy_cls, hand_cls, rounds: int, seed: int = 0) -> float:
+    """
+    Time Game.play_round for one player using the given Hand implementation.
+
+    Returns:
+        float: Mean seconds per round.
+    """
+    original = game.game.Hand
+    game.game.Hand = hand_cls
+    try:
+        blackjack_game = Game(players=[Player("bench", 0.0, strategy_cls())], verbose=False, seed=seed)
+        blackjack_game.dealer.hand = hand_cls(is_dealer=True)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            blackjack_game.play_round()
+        return (time.perf_counter() - start) / rounds
+    finally:
+        game.game.Hand = original
+
+
+def main(rounds: int = 50_000) -> None:
+    print(f"{'strategy':<18}{'rescan µs/round':>18}{'incremental µs/round':>23}{'saving':>9}")
+    for strategy_cls in (PerfectStrategy, BasicStrategy):
+        rescan = time_per_round(strategy_cls, RescanHand, rounds)
+        incremental = time_per_round(strategy_cls, Hand, rounds)
+        saving = 1 - incremental / rescan
+        print(f"{strategy_cls.__name__:<18}{rescan * 1e6:>18.2f}{incremental * 1e6:>23.2f}{saving:>9.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
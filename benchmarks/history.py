@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+
+from .runner import Measurement
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    Throughput of a benchmark against a baseline run.
+
+    Attributes:
+        name (str): Benchmark name.
+        baseline (float): Baseline ops/sec.
+        current (float): Current ops/sec.
+        threshold (float): Tolerated relative slowdown.
+    """
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the throughput, negative when slower."""
+        return self.current / self.baseline - 1
+
+    @property
+    def regressed(self) -> bool:
+        """Whether the throughput fell by more than the threshold."""
+        return self.change < -self.threshold
+
+    def __str__(self) -> str:
+        flag = "  REGRESSION" if self.regressed else ""
+        return f"{self.name:<48}{self.baseline:>16,.0f}{self.current:>16,.0f}{self.change:>+9.1%}{flag}"
+
+
+def load_history(path: str | os.PathLike) -> list[dict]:
+    """
+    Read the saved runs, oldest first.
+
+    Args:
+        path (str | PathLike): History file.
+
+    Returns:
+        list[dict]: Runs with keys label, timestamp, python, machine and results
+            (benchmark name -> Measurement.to_dict()); empty if the file does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path) as file:
+        return json.load(file)["runs"]
+
+
+def save_run(path: str | os.PathLike, measurements: list[Measurement], label: str | None = None) -> dict:
+    """
+    Append a run to the history file.
+
+    Args:
+        path (str | PathLike): History file, created if needed.
+        measurements (list[Measurement]): Results of the run.
+        label (str | None, optional): Name to refer to the run as a baseline. Defaults to its timestamp.
+
+    Returns:
+        dict: The saved run.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    run = {
+        "label": label or timestamp,
+        "timestamp": timestamp,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {measurement.name: measurement.to_dict() for measurement in measurements},
+    }
+    runs = load_history(path) + [run]
+    path = Path(path)
+    temporary = path.with_name(f"{path.name}-{os.getpid()}.tmp")
+    with open(temporary, "w") as file:
+        json.dump({"runs": runs}, file, indent=1)
+    os.replace(temporary, path)
+    return run
+
+
+def find_run(runs: list[dict], label: str | None = None) -> dict | None:
+    """
+    Pick the baseline run: the latest one with the label, or the latest run.
+
+    Args:
+        runs (list[dict]): Saved runs, see load_history.
+        label (str | None, optional): Label of the baseline. Defaults to None.
+
+    Returns:
+        dict | None: The run, or None if there is none.
+    """
+    matching = [run for run in runs if label is None or run["label"] == label]
+    return matching[-1] if matching else None
+
+
+def compare(measurements: list[Measurement], baseline: dict, threshold: float = 0.1) -> list[Comparison]:
+    """
+    Compare the median throughputs of a run with a baseline run.
+
+    Benchmarks missing from the baseline are skipped.
+
+    Args:
+        measurements (list[Measurement]): Current results.
+        baseline (dict): Baseline run, see load_history.
+        threshold (float, optional): Tolerated relative slowdown. Defaults to 0.1.
+
+    Returns:
+        list[Comparison]: One comparison per benchmark present in both runs.
+    """
+    results = baseline["results"]
+    return [Comparison(measurement.name, results[measurement.name]["ops_per_sec"],
+                       measurement.ops_per_sec, threshold)
+            for measurement in measurements if measurement.name in results]
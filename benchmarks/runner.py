@@ -0,0 +1,89 @@
+from dataclasses import dataclass, field
+import statistics
+import time
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    A timed operation.
+
+    Attributes:
+        name (str): Unique name, with any parameters in brackets, e.g.
+            "game.play_round[players=3,decks=6]".
+        setup (Callable[[], Callable[[], object]]): Builds the state and returns the
+            function to time; setup cost is never measured.
+        ops (int): Operations performed by one call of the timed function.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    ops: int = 1
+
+
+@dataclass
+class Measurement:
+    """
+    Throughput of a benchmark over several repeats.
+
+    Attributes:
+        name (str): Benchmark name.
+        samples (list[float]): Operations per second of each repeat.
+        calls (int): Calls of the timed function per repeat.
+    """
+    name: str
+    samples: list[float] = field(default_factory=list)
+    calls: int = 1
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Median throughput of the repeats, robust to a stray slow repeat."""
+        return statistics.median(self.samples)
+
+    @property
+    def spread(self) -> float:
+        """Relative median absolute deviation of the repeats."""
+        median = self.ops_per_sec
+        return statistics.median(abs(sample - median) for sample in self.samples) / median
+
+    def to_dict(self) -> dict:
+        return {"ops_per_sec": self.ops_per_sec, "spread": self.spread, "calls": self.calls,
+                "samples": self.samples}
+
+    def __str__(self) -> str:
+        return f"{self.name:<48}{self.ops_per_sec:>16,.0f} ops/s  ± {self.spread:>6.1%}"
+
+
+def measure(benchmark: Benchmark, repeats: int = 5, min_time: float = 0.1) -> Measurement:
+    """
+    Time a benchmark.
+
+    The number of calls per repeat is calibrated (doubling from one call) so that a
+    repeat takes at least min_time, which amortizes the timer overhead; the
+    calibration runs double as warm-up. Each repeat then yields one ops/sec sample.
+
+    Args:
+        benchmark (Benchmark): What to time.
+        repeats (int, optional): Number of timed repeats. Defaults to 5.
+        min_time (float, optional): Minimum seconds per repeat. Defaults to 0.1.
+
+    Returns:
+        Measurement: The samples.
+    """
+    run = benchmark.setup()
+    clock = time.perf_counter
+    calls = 1
+    while True:
+        start = clock()
+        for _ in range(calls):
+            run()
+        if clock() - start >= min_time:
+            break
+        calls *= 2
+    measurement = Measurement(benchmark.name, calls=calls)
+    for _ in range(repeats):
+        start = clock()
+        for _ in range(calls):
+            run()
+        measurement.samples.append(calls * benchmark.ops / (clock() - start))
+    return measurement
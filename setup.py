@@ -5,6 +5,9 @@ setup(
     name="blackjack-simulator",
     version="0.1.0",
     packages=find_packages(where="src"),
+    py_modules=["lazy"],
     package_dir={"": "src"},
-    install_requires=[],
+    python_requires=">=3.11",
+    install_requires=["numpy"],
+    entry_points={"console_scripts": ["blackjack-sim = engine.cli:main"]},
 )
\ No newline at end of file
@@ -1,22 +1,23 @@
-from cards import Card, Shoe, Hand
-from game import Action, Game, Dealer, Player
-from strategies import PerfectStrategy, BasicStrategy, SafeStrategy, AggressiveStrategy
-from engine import Simulation
+from lazy import lazy_exports
 
-__all__ = [
-    "Card",
-    "Shoe",
-    "Hand",
-    "Action",
-    "Game",
-    "Dealer",
-    "Player",
-    "Strategy", 
-    "RandomStrategy", 
-    "AggressiveStrategy", 
-    "SafeStrategy", 
-    "SplitStrategy", 
-    "BasicStrategy",
-    "PerfectStrategy"
-    "Simulation"
-]
\ No newline at end of file
+# Public names and the packages defining them, imported on first access
+_EXPORTS: dict[str, str] = {
+    "Card": "cards",
+    "Shoe": "cards",
+    "Hand": "cards",
+    "Action": "game",
+    "Game": "game",
+    "Dealer": "game",
+    "Player": "game",
+    "Strategy": "strategies",
+    "RandomStrategy": "strategies",
+    "AggressiveStrategy": "strategies",
+    "SafeStrategy": "strategies",
+    "SplitStrategy": "strategies",
+    "BasicStrategy": "strategies",
+    "PerfectStrategy": "strategies",
+    "Simulation": "engine",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
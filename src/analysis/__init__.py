@@ -0,0 +1,18 @@
+from lazy import lazy_exports
+
+# Public names and the submodules defining them, imported on first access
+_EXPORTS: dict[str, str] = {
+    "BankrollReport": ".bankroll",
+    "NetDistribution": ".bankroll",
+    "simulate_bankrolls": ".bankroll",
+    "DEALER_OUTCOMES": ".dealer",
+    "DealerProbabilities": ".dealer",
+    "ExactEV": ".exact",
+    "CacheInfo": ".lru",
+    "LRUCache": ".lru",
+    "load_tables": ".tables",
+    "optimal_tables": ".tables",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
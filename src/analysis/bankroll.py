@@ -0,0 +1,272 @@
+import numpy as np
+
+from cards import RandomStream
+
+# Bound on the elements of the (paths, rounds) arrays built at once
+_MAX_ELEMENTS = 1 << 23
+
+
+class NetDistribution:
+    """
+    Discrete distribution of the net result of a round, in initial wagers.
+
+    Attributes:
+        values (np.ndarray): Possible net results, sorted.
+        probabilities (np.ndarray): Probability of each value, summing to 1.
+    """
+    def __init__(self, values, probabilities) -> None:
+        """
+        Initialize a new NetDistribution, e.g. from an exact calculation.
+
+        Args:
+            values (array-like): Possible net results, in initial wagers.
+            probabilities (array-like): Probability (or relative weight) of each value.
+
+        Raises:
+            ValueError: If the arrays differ in length or a weight is negative.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        if values.shape != probabilities.shape or values.ndim != 1 or (probabilities < 0).any():
+            raise ValueError("values and probabilities must be 1-D arrays of the same length, "
+                             "with non-negative probabilities.")
+        order = np.argsort(values)
+        self.values: np.ndarray = values[order]
+        self.probabilities: np.ndarray = probabilities[order] / probabilities.sum()
+        self._alias: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_samples(cls, net: np.ndarray, bet_amount: float = 1.0) -> 'NetDistribution':
+        """
+        Empirical distribution of observed round results.
+
+        Args:
+            net (np.ndarray): Net result of each round, in money.
+            bet_amount (float, optional): Initial wager of the rounds. Defaults to 1.0.
+
+        Returns:
+            NetDistribution: The distribution of net / bet_amount.
+        """
+        values, counts = np.unique(np.asarray(net) / bet_amount, return_counts=True)
+        return cls(values, counts)
+
+    @classmethod
+    def from_result(cls, result, player: str | int = 0, bet_amount: float = 1.0) -> 'NetDistribution':
+        """
+        Empirical distribution of the rounds of a simulation.
+
+        Args:
+            result (SimulationResult | BatchResult): A BatchSimulation result, or a
+                Simulation result recorded with record=True or output=....
+            player (str | int, optional): Player of a SimulationResult. Defaults to the first.
+            bet_amount (float, optional): Initial wager of a SimulationResult's rounds. Defaults to 1.0.
+
+        Returns:
+            NetDistribution: The distribution of the per-round net results.
+
+        Raises:
+            ValueError: If a SimulationResult was not recorded.
+        """
+        if hasattr(result, "net"):
+            return cls.from_samples(result.net, result.bet_amount)
+        if result.outcomes is None:
+            raise ValueError("The simulation was not recorded; run it with record=True.")
+        table = result.outcomes
+        if not hasattr(table, "for_player"):
+            table = table.table()
+        return cls.from_samples(table.for_player(player).round_net(), bet_amount)
+
+    @property
+    def mean(self) -> float:
+        """Expected net result per round."""
+        return float(self.values @ self.probabilities)
+
+    @property
+    def variance(self) -> float:
+        """Variance of the net result per round."""
+        return float((self.values - self.mean) ** 2 @ self.probabilities)
+
+    @property
+    def n0(self) -> float:
+        """Rounds for the expected win to equal one standard deviation: variance / mean^2."""
+        return self.variance / self.mean ** 2 if self.mean else float("inf")
+
+    def sample(self, rng: RandomStream, shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Draw independent round results.
+
+        Args:
+            rng (RandomStream): Source of the draws.
+            shape (tuple[int, ...]): Shape of the result.
+
+        Returns:
+            np.ndarray: Net results, in initial wagers.
+        """
+        accept, alias = self._alias_table()
+        # One uniform picks both the column (integer part) and the coin (fraction)
+        scaled = rng.generator.random(shape) * len(self.values)
+        column = scaled.astype(np.intp)
+        column = np.where(scaled - column < accept[column], column, alias[column])
+        return self.values[column]
+
+    def _alias_table(self) -> tuple[np.ndarray, np.ndarray]:
+        """Walker's alias table of the distribution, for O(1) sampling per draw."""
+        if self._alias is None:
+            count = len(self.values)
+            scaled = self.probabilities * count
+            accept = np.ones(count)
+            alias = np.arange(count)
+            small = [i for i in range(count) if scaled[i] < 1.0]
+            large = [i for i in range(count) if scaled[i] >= 1.0]
+            while small and large:
+                low, high = small.pop(), large.pop()
+                accept[low], alias[low] = scaled[low], high
+                scaled[high] -= 1.0 - scaled[low]
+                (small if scaled[high] < 1.0 else large).append(high)
+            self._alias = (accept, alias)
+        return self._alias
+
+    def __repr__(self) -> str:
+        return f"NetDistribution(values={len(self.values)}, mean={self.mean:.5f}, variance={self.variance:.4f})"
+
+
+def _first_reached(levels: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    For every row of nondecreasing levels, the first index where each threshold is
+    reached (len(row) if never), with one searchsorted over all rows: shifting row i
+    by i * span keeps the flattened array sorted.
+    """
+    paths, rounds = levels.shape
+    low = min(levels.min(), thresholds.min())
+    span = max(levels.max(), thresholds.max()) - low + 1
+    row = np.arange(paths)[:, None]
+    flat = (levels - low + row * span).ravel()
+    queries = (thresholds[None, :] - low + row * span).ravel()
+    return np.searchsorted(flat, queries, side="left").reshape(paths, -1) - row * rounds
+
+
+class BankrollReport:
+    """
+    Risk measures of bankroll paths for a grid of starting bankrolls and bet units.
+    Arrays are indexed [bankroll, bet unit] (and quantile last).
+
+    Attributes:
+        bankrolls (np.ndarray): Starting bankrolls.
+        bet_units (np.ndarray): Initial wagers.
+        rounds (int): Rounds per path.
+        paths (int): Number of paths.
+        quantiles (np.ndarray): Quantile levels of drawdown and time_to_double.
+        ruin_probability (np.ndarray): Fraction of paths losing the bankroll within rounds.
+        double_probability (np.ndarray): Fraction of paths doubling the bankroll before ruin.
+        drawdown (np.ndarray): Quantiles of the largest peak-to-trough loss, in money, up to ruin.
+        time_to_double (np.ndarray): Quantiles of the rounds needed to double, among
+            the paths that double (nan if none does).
+    """
+    def __init__(self, bankrolls, bet_units, rounds, paths, quantiles, ruin_probability,
+                 double_probability, drawdown, time_to_double) -> None:
+        self.bankrolls = bankrolls
+        self.bet_units = bet_units
+        self.rounds = rounds
+        self.paths = paths
+        self.quantiles = quantiles
+        self.ruin_probability = ruin_probability
+        self.double_probability = double_probability
+        self.drawdown = drawdown
+        self.time_to_double = time_to_double
+
+    def rows(self) -> list[dict]:
+        """
+        The report as one dictionary per (bankroll, bet unit) cell.
+
+        Returns:
+            list[dict]: Keys bankroll, bet_unit, ruin_probability, double_probability,
+                drawdown_q<level> and time_to_double_q<level>.
+        """
+        rows = []
+        for i, bankroll in enumerate(self.bankrolls):
+            for j, unit in enumerate(self.bet_units):
+                row = {"bankroll": float(bankroll), "bet_unit": float(unit),
+                       "ruin_probability": float(self.ruin_probability[i, j]),
+                       "double_probability": float(self.double_probability[i, j])}
+                for k, level in enumerate(self.quantiles):
+                    row[f"drawdown_q{level:g}"] = float(self.drawdown[i, j, k])
+                for k, level in enumerate(self.quantiles):
+                    row[f"time_to_double_q{level:g}"] = float(self.time_to_double[i, j, k])
+                rows.append(row)
+        return rows
+
+    def __repr__(self) -> str:
+        return (f"BankrollReport(bankrolls={len(self.bankrolls)}, bet_units={len(self.bet_units)}, "
+                f"rounds={self.rounds}, paths={self.paths})")
+
+
+def simulate_bankrolls(
+    distribution: NetDistribution,
+    bankrolls,
+    bet_units,
+    rounds: int,
+    paths: int = 100_000,
+    quantiles=(0.5, 0.9, 0.99),
+    seed: int | RandomStream | None = None
+) -> BankrollReport:
+    """
+    Simulate independent bankroll paths and measure ruin, drawdown and time to double.
+
+    A path is the cumulative sum of rounds drawn from the distribution, in bet
+    units, so one set of paths serves the whole grid: a bankroll B betting u is
+    ruined when the path first falls to -B/u and doubles when it first reaches
+    +B/u. Since the running minimum and maximum of a path never reverse, those
+    first passage times are found for every threshold at once with a searchsorted,
+    and the drawdown up to ruin is read off the running maximum drawdown. Paths are
+    generated in blocks to bound memory.
+
+    Args:
+        distribution (NetDistribution): Distribution of the round results.
+        bankrolls (array-like): Starting bankrolls.
+        bet_units (array-like): Initial wagers.
+        rounds (int): Rounds per path.
+        paths (int, optional): Number of paths. Defaults to 100000.
+        quantiles (array-like, optional): Quantile levels. Defaults to (0.5, 0.9, 0.99).
+        seed (int | RandomStream | None, optional): Seed of the paths. Defaults to None.
+
+    Returns:
+        BankrollReport: Measures per (bankroll, bet unit).
+    """
+    bankrolls = np.atleast_1d(np.asarray(bankrolls, dtype=np.float64))
+    bet_units = np.atleast_1d(np.asarray(bet_units, dtype=np.float64))
+    quantiles = np.atleast_1d(np.asarray(quantiles, dtype=np.float64))
+    rng = seed if isinstance(seed, RandomStream) else RandomStream(seed)
+    # Bankroll in bet units of every cell, flattened
+    thresholds = (bankrolls[:, None] / bet_units[None, :]).ravel()
+    ruin_times = np.empty((paths, len(thresholds)), dtype=np.int64)
+    double_times = np.empty_like(ruin_times)
+    drawdowns = np.empty((paths, len(thresholds)))
+    block = max(1, _MAX_ELEMENTS // rounds)
+    rows = np.arange(block)[:, None]
+    for start in range(0, paths, block):
+        stop = min(start + block, paths)
+        cumulative = np.cumsum(distribution.sample(rng, (stop - start, rounds)), axis=1)
+        peak = np.maximum(np.maximum.accumulate(cumulative, axis=1), 0.0)
+        ruin = _first_reached(-np.minimum.accumulate(cumulative, axis=1), thresholds)
+        doubled = _first_reached(peak, thresholds)
+        max_drawdown = np.maximum.accumulate(peak - cumulative, axis=1)
+        ruin_times[start:stop] = ruin
+        double_times[start:stop] = np.where(doubled < ruin, doubled, rounds)
+        drawdowns[start:stop] = max_drawdown[rows[:stop - start], np.minimum(ruin, rounds - 1)]
+    shape = (len(bankrolls), len(bet_units))
+    ruined = ruin_times < rounds
+    doubled = double_times < rounds
+    drawdown = np.quantile(drawdowns, quantiles, axis=0).T * np.tile(bet_units, len(bankrolls))[:, None]
+    time_to_double = np.full((len(thresholds), len(quantiles)), np.nan)
+    for cell in range(len(thresholds)):
+        times = double_times[doubled[:, cell], cell]
+        if len(times):
+            # Rounds played when the bankroll first doubles, counting from 1
+            time_to_double[cell] = np.quantile(times + 1, quantiles)
+    return BankrollReport(
+        bankrolls, bet_units, rounds, paths, quantiles,
+        ruined.mean(axis=0).reshape(shape),
+        doubled.mean(axis=0).reshape(shape),
+        drawdown.reshape(*shape, len(quantiles)),
+        time_to_double.reshape(*shape, len(quantiles)),
+    )
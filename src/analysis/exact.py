@@ -0,0 +1,306 @@
+import numpy as np
+
+from game import Action, Rules
+from strategies import CompiledStrategy, Strategy
+from strategies.compiled_strategy import NUM_UPCARDS, state_index
+from .dealer import BLACKJACK, BUST, DEALER_OUTCOMES, NUM_VALUES, DealerProbabilities
+
+
+def _stand_payoffs() -> np.ndarray:
+    """Payoff of standing on each total (rows 0 to 21) against each dealer outcome."""
+    dealer_totals = np.array([17, 18, 19, 20, 21, 0, 21])
+    payoffs = np.zeros((22, len(DEALER_OUTCOMES)))
+    for total in range(22):
+        payoffs[total] = np.sign(total - dealer_totals)
+        payoffs[total, BUST] = 1.0
+    return payoffs
+
+
+_STAND_PAYOFFS = _stand_payoffs()
+
+
+class ExactEV:
+    """
+    Exact expected values of the player's decisions for one player against the
+    dealer, dealt from a fresh shoe of rules.num_decks decks.
+
+    Every expected value is computed by recursion over the cards drawn, each drawn
+    from the shoe composition left once the upcard and all cards of the hand are
+    removed, and memoized on (upcard, removed cards, hand). Standing uses the exact
+    dealer distribution for that composition (see DealerProbabilities). The game's
+    rules are followed: no hole-card peek, the dealer's drawing rule of Dealer.play,
+    automatic stand from 21, doubling on any two cards, doubling after splits,
+    unlimited resplits and two-card 21s after a split paid as blackjacks.
+
+    Split hands are valued one at a time from the composition with the pair cards
+    removed; the cards drawn to the sibling hands are not removed, the usual
+    approximation of exact calculators.
+
+    Expected values are in units of the initial wager. Decisions after the one
+    being valued are either optimal (strategy=None) or those of a strategy.
+
+    Attributes:
+        rules (Rules): House rules.
+        strategy (CompiledStrategy | None): Strategy followed, None for optimal play.
+        dealer (DealerProbabilities): Dealer outcome distributions.
+    """
+    def __init__(
+        self,
+        rules: Rules = Rules(),
+        strategy: Strategy | None = None,
+        dealer: DealerProbabilities | None = None
+    ) -> None:
+        """
+        Initialize a new ExactEV.
+
+        Args:
+            rules (Rules, optional): House rules. Defaults to Rules().
+            strategy (Strategy | None, optional): Deterministic strategy to follow; it is
+                compiled with CompiledStrategy. Defaults to None (optimal play).
+            dealer (DealerProbabilities | None, optional): Dealer distributions to share
+                between instances with the same rules. Defaults to new ones.
+        """
+        if strategy is not None and not isinstance(strategy, CompiledStrategy):
+            strategy = CompiledStrategy(strategy)
+        self.rules: Rules = rules
+        self.strategy: CompiledStrategy | None = strategy
+        self.dealer: DealerProbabilities = dealer if dealer is not None else DealerProbabilities(rules)
+        self._values: dict[tuple, float] = {}
+        self._splits: dict[tuple, float] = {}
+        # Chance that two ten-valued cards share a rank (and can be split), with the
+        # ten-valued cards dealt so far assumed spread evenly over the four ranks
+        tens = 16 * rules.num_decks
+        self._same_ten_rank: float = (tens // 4 - 1) / (tens - 1)
+
+    def _draw_probabilities(self, upcard: int, removed: tuple[int, ...]) -> list[tuple[int, float]]:
+        counts = self.dealer.composition(upcard, removed)
+        total = counts.sum()
+        return [(value, counts[value - 1] / total)
+                for value in range(1, NUM_VALUES + 1) if counts[value - 1] > 0]
+
+    def _stand(self, upcard: int, removed: tuple[int, ...], total: int, blackjack: bool) -> float:
+        distribution = self.dealer.distribution(upcard, removed)
+        if blackjack:
+            return self.rules.blackjack_multiplier * (1.0 - distribution[BLACKJACK])
+        return float(distribution @ _STAND_PAYOFFS[total])
+
+    def _action_evs(
+        self,
+        upcard: int,
+        removed: tuple[int, ...],
+        hard: int,
+        has_ace: bool,
+        cards: int,
+        pair: int
+    ) -> dict[Action, float]:
+        """EV of every allowed action for a hand with a total below 21."""
+        actions = [Action.STAND, Action.HIT]
+        if cards == 2:
+            actions.append(Action.DOUBLE_DOWN)
+        if pair:
+            actions.append(Action.SPLIT)
+        return {action: self._action_ev(action, upcard, removed, hard, has_ace, cards, pair)
+                for action in actions}
+
+    def _action_ev(
+        self,
+        action: Action,
+        upcard: int,
+        removed: tuple[int, ...],
+        hard: int,
+        has_ace: bool,
+        cards: int,
+        pair: int
+    ) -> float:
+        """EV of one action for a hand with a total below 21."""
+        if action == Action.STAND:
+            return self._final(upcard, removed, hard, has_ace, False)
+        if action == Action.SPLIT:
+            return 2 * self._split_hand(upcard, removed, pair)
+        ev = 0.0
+        for value, probability in self._draw_probabilities(upcard, removed):
+            after = _add(removed, value)
+            if action == Action.HIT:
+                ev += probability * self._value(upcard, after, hard + value, has_ace or value == 1, cards + 1, 0)
+            else:
+                ev += probability * self._final(upcard, after, hard + value, has_ace or value == 1, False)
+        return 2 * ev if action == Action.DOUBLE_DOWN else ev
+
+    def _final(self, upcard: int, removed: tuple[int, ...], hard: int, has_ace: bool, blackjack: bool) -> float:
+        """EV of a hand that takes no more cards."""
+        total = hard + 10 if has_ace and hard <= 11 else hard
+        if total > 21:
+            return -1.0
+        return self._stand(upcard, removed, total, blackjack and total == 21)
+
+    def _split_hand(self, upcard: int, removed: tuple[int, ...], pair: int) -> float:
+        """
+        EV of one hand of a split pair, before it draws its second card.
+
+        Resplits are valued at the composition of the first split: if the hand
+        draws the pair card again and resplits, each of the two new hands is worth
+        this same EV, so with a the EV over the other second cards and q the chance
+        of drawing a card that can be resplit, EV = a + q * 2 * EV, i.e.
+        EV = a / (1 - 2q). Optimal play takes the better of that and never resplitting.
+        """
+        key = (upcard, removed, pair)
+        value = self._splits.get(key)
+        if value is not None:
+            return value
+        other = q = 0.0
+        repaired = None
+        for second, probability in self._draw_probabilities(upcard, removed):
+            after = _add(removed, second)
+            if second != pair:
+                other += probability * self._two_cards(upcard, after, pair, second)
+                continue
+            q, repaired = probability, after
+            if pair == 10:
+                # Ten-valued cards of different ranks: a plain hard 20
+                same_rank = self._same_ten_rank
+                other += probability * (1 - same_rank) * self._value(upcard, after, 20, False, 2, 0)
+                q *= same_rank
+        value = None
+        if q and self._resplits(upcard, pair):
+            value = other / (1 - 2 * q)
+        if value is None or self.strategy is None:
+            # Playing on the re-dealt pair without resplitting
+            stay = other
+            if q:
+                stay += q * self._value(upcard, repaired, 2 * pair, pair == 1, 2, 0, state_pair=pair)
+            value = stay if value is None else max(value, stay)
+        self._splits[key] = value
+        return value
+
+    def _resplits(self, upcard: int, pair: int) -> bool:
+        """Whether a re-dealt pair may be split again: always when playing optimally."""
+        if self.strategy is None:
+            return True
+        soft = pair == 1
+        total = 2 * pair + 10 if soft else 2 * pair
+        code = self.strategy.codes[state_index(total, soft, True, pair) * NUM_UPCARDS + upcard]
+        return int(code) == Action.SPLIT.value
+
+    def _two_cards(self, upcard: int, removed: tuple[int, ...], first: int, second: int) -> float:
+        """
+        EV of a two-card hand. Two ten-valued cards only make a pair when they have
+        the same rank, which happens with probability _same_ten_rank.
+        """
+        hard, has_ace = first + second, first == 1 or second == 1
+        if first != second:
+            return self._value(upcard, removed, hard, has_ace, 2, 0)
+        paired = self._value(upcard, removed, hard, has_ace, 2, first)
+        if first != 10:
+            return paired
+        same_rank = self._same_ten_rank
+        return same_rank * paired + (1 - same_rank) * self._value(upcard, removed, hard, has_ace, 2, 0)
+
+    def _value(
+        self,
+        upcard: int,
+        removed: tuple[int, ...],
+        hard: int,
+        has_ace: bool,
+        cards: int,
+        pair: int,
+        state_pair: int = 0
+    ) -> float:
+        """
+        EV of a hand played on by the strategy (or optimally). A pair that may not
+        be split is passed with pair=0 and its value as state_pair, so the strategy
+        still looks it up as a pair.
+        """
+        soft = has_ace and hard <= 11
+        total = hard + 10 if soft else hard
+        if total >= 21:
+            return self._final(upcard, removed, hard, has_ace, cards == 2)
+        key = (upcard, removed, hard, has_ace, cards, pair, state_pair)
+        value = self._values.get(key)
+        if value is not None:
+            return value
+        if self.strategy is None:
+            value = max(self._action_evs(upcard, removed, hard, has_ace, cards, pair).values())
+        else:
+            state = state_index(total, soft, cards == 2, pair or state_pair)
+            code = int(self.strategy.codes[state * NUM_UPCARDS + upcard])
+            if (code == 0 or (code == Action.DOUBLE_DOWN.value and cards != 2)
+                    or (code == Action.SPLIT.value and not pair)):
+                raise ValueError(f"Strategy has no valid action for total {total} "
+                                 f"({'soft' if soft else 'hard'}, {cards} cards) vs {upcard}.")
+            value = self._action_ev(Action(code), upcard, removed, hard, has_ace, cards, pair)
+        self._values[key] = value
+        return value
+
+    def action_evs(self, cards: list[int], upcard: int) -> dict[Action, float]:
+        """
+        EV of every allowed action for an initial hand, with later decisions made by
+        the strategy (or optimally).
+
+        Args:
+            cards (list[int]): Values of the player's cards (Aces as 1).
+            upcard (int): Dealer upcard value, 2 to 11 (Ace as 11).
+
+        Returns:
+            dict[Action, float]: EV per action, in initial wagers; empty from 21 on,
+                where the hand stands automatically.
+        """
+        removed = (0,) * NUM_VALUES
+        for value in cards:
+            removed = _add(removed, value)
+        hard = sum(cards)
+        has_ace = 1 in cards
+        if (hard + 10 if has_ace and hard <= 11 else hard) >= 21:
+            return {}
+        pair = cards[0] if len(cards) == 2 and cards[0] == cards[1] else 0
+        # An explicit pair of ten-valued cards is taken to be of the same rank
+        return self._action_evs(upcard, removed, hard, has_ace, len(cards), pair)
+
+    def hand_ev(self, cards: list[int], upcard: int) -> float:
+        """
+        EV of an initial two-card hand played by the strategy (or optimally).
+
+        Args:
+            cards (list[int]): Values of the player's two cards (Aces as 1).
+            upcard (int): Dealer upcard value, 2 to 11 (Ace as 11).
+
+        Returns:
+            float: EV in initial wagers.
+        """
+        first, second = cards
+        return self._two_cards(upcard, _add(_add((0,) * NUM_VALUES, first), second), first, second)
+
+    def round_ev(self) -> float:
+        """
+        EV of a round from a fresh shoe: the average of hand_ev over every initial
+        deal, weighted by its probability.
+
+        Returns:
+            float: EV per round, in initial wagers.
+        """
+        shoe = self.dealer.shoe.astype(np.float64)
+        ev = 0.0
+        for first in range(1, NUM_VALUES + 1):
+            for second in range(first, NUM_VALUES + 1):
+                counts = shoe.copy()
+                probability = counts[first - 1] / counts.sum()
+                counts[first - 1] -= 1
+                probability *= counts[second - 1] / counts.sum()
+                counts[second - 1] -= 1
+                if first != second:
+                    probability *= 2
+                for upcard in range(1, NUM_VALUES + 1):
+                    upcard_probability = counts[upcard - 1] / counts.sum()
+                    upcard_value = 11 if upcard == 1 else upcard
+                    ev += probability * upcard_probability * self.hand_ev([first, second], upcard_value)
+        return ev
+
+    def __repr__(self) -> str:
+        strategy = type(self.strategy.strategy).__name__ if self.strategy is not None else "optimal"
+        return f"ExactEV(rules={self.rules}, strategy={strategy})"
+
+
+def _add(removed: tuple[int, ...], value: int) -> tuple[int, ...]:
+    """Add one card of a value to a composition tuple."""
+    index = value - 1
+    return removed[:index] + (removed[index] + 1,) + removed[index + 1:]
+
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Usage statistics of an LRUCache.
+
+    Attributes:
+        hits (int): Lookups that found their key.
+        misses (int): Lookups that did not.
+        evictions (int): Entries dropped to stay within maxsize.
+        size (int): Entries held.
+        maxsize (int): Capacity.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits, 0.0 before the first one."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """
+    A mapping bounded to maxsize entries that drops the least recently used one when
+    full, counting hits, misses and evictions.
+
+    Attributes:
+        maxsize (int): Capacity.
+        hits (int): Lookups that found their key.
+        misses (int): Lookups that did not.
+        evictions (int): Entries dropped so far.
+    """
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize a new, empty LRUCache.
+
+        Args:
+            maxsize (int): Capacity.
+
+        Raises:
+            ValueError: If maxsize is below 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look a key up, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The key.
+            default (Any, optional): Returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value as the most recently used, evicting the least recently used
+        entry if the cache is full.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        """
+        Snapshot of the cache's statistics.
+
+        Returns:
+            CacheInfo: Hits, misses, evictions and size.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"LRUCache(maxsize={self.maxsize}, size={len(self._entries)})"
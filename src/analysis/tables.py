@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from game import Action, Rules
+from .dealer import NUM_VALUES
+from .exact import ExactEV
+
+# Tables of PerfectStrategy, as int8 action codes (Action.value, 0 where undefined).
+# The split table is indexed by the value of the paired card (Aces as 1), the others
+# by the hand total; every table's columns are the dealer upcard values 2 to 11.
+TABLE_SHAPES: dict[str, tuple[int, int]] = {
+    "split_table": (11, 12),
+    "hard_double_allowed_table": (21, 12),
+    "hard_double_forbidden_table": (21, 12),
+    "soft_double_allowed_table": (21, 12),
+    "soft_double_forbidden_table": (21, 12),
+}
+
+# Bumped whenever the derivation changes, so cached tables are recomputed
+TABLE_VERSION: int = 2
+
+# Rules fields that change the optimal decisions; the penetration does not, since
+# the tables are derived from a fresh shoe
+_STRATEGY_FIELDS: tuple[str, ...] = ("num_decks", "dealer_hits_soft_17", "blackjack_multiplier")
+
+
+def rules_key(rules: Rules) -> str:
+    """
+    Key of the tables derived for a rule set.
+
+    Args:
+        rules (Rules): House rules.
+
+    Returns:
+        str: Hex digest of the fields that affect the decisions and of TABLE_VERSION.
+    """
+    fields = {name: getattr(rules, name) for name in _STRATEGY_FIELDS}
+    fields["version"] = TABLE_VERSION
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def default_cache_directory() -> Path:
+    """
+    Directory of the cached tables: $BLACKJACK_SIM_CACHE if set, otherwise
+    blackjack-simulator under $XDG_CACHE_HOME (~/.cache by default).
+    """
+    if "BLACKJACK_SIM_CACHE" in os.environ:
+        return Path(os.environ["BLACKJACK_SIM_CACHE"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "blackjack-simulator"
+
+
+def _two_card_hands(exact: ExactEV, upcard: int):
+    """
+    Every initial two-card hand against an upcard with its probability.
+
+    Yields:
+        tuple[int, int, float]: Values of the two cards (first <= second) and the
+            probability of being dealt them once the upcard is out.
+    """
+    counts = exact.dealer.composition(upcard).astype(np.float64)
+    cards = counts.sum()
+    for first in range(1, NUM_VALUES + 1):
+        for second in range(first, NUM_VALUES + 1):
+            probability = counts[first - 1] * (counts[second - 1] - (first == second)) / (cards * (cards - 1))
+            if first != second:
+                probability *= 2
+            if probability > 0:
+                yield first, second, probability
+
+
+def optimal_tables(rules: Rules = Rules(), exact: ExactEV | None = None) -> dict[str, np.ndarray]:
+    """
+    Derive the tables of PerfectStrategy for a rule set from exact expected values.
+
+    The split table takes the best action for each pair. The other tables depend on
+    the total only, so each cell takes the action with the best EV averaged over all
+    initial hands of that total, weighted by their probability: non-pairs for the
+    tables where doubling is allowed, and every two-card hand, choosing between
+    standing and hitting, for the tables of hands of three cards or more.
+
+    Args:
+        rules (Rules, optional): House rules. Defaults to Rules().
+        exact (ExactEV | None, optional): Optimal-play ExactEV for these rules, to
+            share its memoized values. Defaults to a new one.
+
+    Returns:
+        dict[str, np.ndarray]: Table name (see TABLE_SHAPES) -> int8 action codes.
+    """
+    exact = exact if exact is not None else ExactEV(rules)
+    tables = {name: np.zeros(shape, dtype=np.int8) for name, shape in TABLE_SHAPES.items()}
+    for upcard in range(2, 12):
+        # (table, total) -> action -> probability-weighted EV
+        sums: dict[tuple[str, int], dict[Action, float]] = {}
+        for first, second, probability in _two_card_hands(exact, upcard):
+            evs = exact.action_evs([first, second], upcard)
+            if not evs:
+                continue
+            if first == second:
+                tables["split_table"][first, upcard] = max(evs, key=evs.get).value
+            soft = first == 1 or second == 1
+            total = first + second + 10 if soft else first + second
+            kind = "soft" if soft else "hard"
+            cells = [(f"{kind}_double_forbidden_table", (Action.STAND, Action.HIT))]
+            # Two ten-valued cards of different ranks are not a pair
+            if first != second or first == 10:
+                cells.append((f"{kind}_double_allowed_table", (Action.STAND, Action.HIT, Action.DOUBLE_DOWN)))
+            for name, actions in cells:
+                cell = sums.setdefault((name, total), dict.fromkeys(actions, 0.0))
+                for action in actions:
+                    cell[action] += probability * evs[action]
+        for (name, total), cell in sums.items():
+            tables[name][total, upcard] = max(cell, key=cell.get).value
+    return tables
+
+
+def load_tables(
+    rules: Rules = Rules(),
+    cache_directory: str | os.PathLike | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Tables of PerfectStrategy for a rule set, derived once and then read from disk.
+
+    Args:
+        rules (Rules, optional): House rules. Defaults to Rules().
+        cache_directory (str | PathLike | None, optional): Directory of the cached
+            tables. Defaults to default_cache_directory().
+
+    Returns:
+        dict[str, np.ndarray]: Table name (see TABLE_SHAPES) -> int8 action codes.
+    """
+    directory = Path(cache_directory) if cache_directory is not None else default_cache_directory()
+    path = directory / f"tables-{rules_key(rules)}.npz"
+    if path.exists():
+        with np.load(path) as archive:
+            return {name: archive[name] for name in TABLE_SHAPES}
+    tables = optimal_tables(rules)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Written under a temporary name and renamed, so concurrent readers never see a partial file
+    temporary = path.with_name(f"{path.stem}-{os.getpid()}.tmp.npz")
+    np.savez(temporary, **tables)
+    os.replace(temporary, path)
+    return tables
@@ -1,5 +1,8 @@
 from .card import Card
 from .shoe import Shoe
+from .shoe_models import ContinuousShuffler, InfiniteShoe, SHOE_MODELS, shoe_model
 from .hand import Hand
+from .rng import RandomStream
+from .counting import CountingSystem, RunningCount, COUNTING_SYSTEMS, counting_system, register_counting_system
 
-__all__ = ["Card", "Shoe", "Hand"]
\ No newline at end of file
+__all__ = ["Card", "Shoe", "ContinuousShuffler", "InfiniteShoe", "SHOE_MODELS", "shoe_model", "Hand", "RandomStream", "CountingSystem", "RunningCount", "COUNTING_SYSTEMS", "counting_system", "register_counting_system"]
\ No newline at end of file
@@ -2,11 +2,23 @@ class Card:
     """
     Represents a playing card in a blackjack simulation.
 
+    Cards are interned flyweights: there is exactly one instance per rank/suit pair,
+    identified by a small integer ``code`` (``suit_index * 13 + rank_index``), and
+    ``Card(rank, suit)`` returns that shared instance. The blackjack values are
+    precomputed once so the hot path never touches the string rank or suit.
+
     Attributes:
         rank (str): Rank of the card, e.g., '2'-'10', 'J', 'Q', 'K', 'A'.
         suit (str): Suit of the card, e.g., 'Hearts', 'Diamonds', 'Clubs', 'Spades'.
+        code (int): Card code from 0 to 51, in fresh-deck order.
+        rank_index (int): Index of the rank in RANKS (0 for '2' through 12 for 'A').
+        value (int): Blackjack value, Aces count as 1.
+        upcard_value (int): Blackjack value as a dealer upcard, Aces count as 11.
+        is_ace (bool): Whether the card is an Ace.
     """
 
+    __slots__ = ("rank", "suit", "code", "rank_index", "value", "upcard_value", "is_ace")
+
     # Class-level constants
     SUITS: list[str] = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
     SYMBOLS: dict[str, str] = {'Hearts':'♥', 'Diamonds':'♦', 'Clubs':'♣', 'Spades':'♠'}
@@ -15,10 +27,18 @@ class Card:
         '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
         'J': 10, 'Q': 10, 'K': 10, 'A': 1 # Aces are counted as 1 by default
     }
+    NUM_CODES: int = 52
+
+    # Per-code lookup tables, filled once below the class definition
+    CODE_RANK_INDEX: tuple[int, ...] = ()
+    CODE_VALUES: tuple[int, ...] = ()
+    CODE_UPCARD_VALUES: tuple[int, ...] = ()
+    _BY_CODE: tuple['Card', ...] = ()
+    _INTERNED: dict[tuple[str, str], 'Card'] = {}
 
-    def __init__(self, rank: str, suit: str) -> None:
+    def __new__(cls, rank: str, suit: str) -> 'Card':
         """
-        Initialize a new Card instance.
+        Return the interned Card instance for a rank and suit.
 
         Args:
             rank (str): The rank of the card.
@@ -27,34 +47,50 @@ class Card:
         Raises:
             ValueError: If rank or suit is not valid.
         """
-        if rank not in self.RANKS:
-            raise ValueError(f"Invalid rank '{rank}'. Must be one of {self.RANKS}.")
-        if suit not in self.SUITS:
-            raise ValueError(f"Invalid suit '{suit}'. Must be one of {self.SUITS}.")
-        self.rank: str = rank
-        self.suit: str = suit
-
-    @property
-    def value(self) -> int:
-        """
-        Get the blackjack value of this card.
+        try:
+            return cls._INTERNED[(rank, suit)]
+        except (KeyError, TypeError):
+            pass
+        if rank not in cls.RANKS:
+            raise ValueError(f"Invalid rank '{rank}'. Must be one of {cls.RANKS}.")
+        raise ValueError(f"Invalid suit '{suit}'. Must be one of {cls.SUITS}.")
 
-        Note:
-            Aces count as 1 by default; adjusting to 11 should be handled in hand logic.
-        """
-        return self.VALUES[self.rank]
-    
-    @property
-    def upcard_value(self) -> int:
+    @classmethod
+    def _build(cls, code: int) -> 'Card':
+        """Create the single instance for a card code (used once at import time)."""
+        card = object.__new__(cls)
+        rank_index = code % len(cls.RANKS)
+        rank = cls.RANKS[rank_index]
+        value = cls.VALUES[rank]
+        setattr_ = object.__setattr__
+        setattr_(card, "rank", rank)
+        setattr_(card, "suit", cls.SUITS[code // len(cls.RANKS)])
+        setattr_(card, "code", code)
+        setattr_(card, "rank_index", rank_index)
+        setattr_(card, "value", value)
+        setattr_(card, "upcard_value", 11 if rank == 'A' else value)
+        setattr_(card, "is_ace", rank == 'A')
+        return card
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Card':
         """
-        Return the blackjack value of the dealer's upcard (first card) as an int from 2 to 11.
-        Treats Ace as 11.
+        Return the interned Card for a card code.
 
-        Raises:
-            ValueError: If the hand has no cards.
+        Args:
+            code (int): Card code from 0 to 51.
+
+        Returns:
+            Card: The card with that code.
         """
-        # Ace as 11, others use card.value
-        return 11 if self.rank == 'A' else self.value
+        return cls._BY_CODE[code]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card instances are immutable.")
+
+    def __reduce__(self):
+        # Unpickling goes back through __new__ so cards stay interned
+        return (Card, (self.rank, self.suit))
 
     def display(self) -> str:
         """
@@ -62,7 +98,7 @@ class Card:
 
         Returns:
             str: card symbols
-        """        
+        """
         return f"{self.rank}{self.SYMBOLS[self.suit]}"
 
     def __str__(self) -> str:
@@ -76,10 +112,10 @@ class Card:
     def __eq__(self, other):
         if not isinstance(other, Card):
             return NotImplemented
-        return self.rank == other.rank and self.suit == other.suit
+        return self is other
 
     def __hash__(self):
-        return hash((self.rank, self.suit))
+        return self.code
 
     @classmethod
     def create_deck(cls) -> list['Card']:
@@ -89,4 +125,11 @@ class Card:
         Returns:
             List[Card]: A list of all cards in a fresh deck.
         """
-        return [cls(rank, suit) for suit in cls.SUITS for rank in cls.RANKS]
\ No newline at end of file
+        return list(cls._BY_CODE)
+
+
+Card._BY_CODE = tuple(Card._build(code) for code in range(Card.NUM_CODES))
+Card._INTERNED = {(card.rank, card.suit): card for card in Card._BY_CODE}
+Card.CODE_RANK_INDEX = tuple(card.rank_index for card in Card._BY_CODE)
+Card.CODE_VALUES = tuple(card.value for card in Card._BY_CODE)
+Card.CODE_UPCARD_VALUES = tuple(card.upcard_value for card in Card._BY_CODE)
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+
+from .card import Card
+
+
+@dataclass(frozen=True)
+class CountingSystem:
+    """
+    A card-counting system: the weight added to the running count for every card seen.
+
+    Unbalanced systems (whose weights do not sum to zero over a deck) start from
+    an initial running count of -imbalance * (num_decks - 1), the usual KO
+    convention that puts the key count at 0 whatever the number of decks.
+
+    Attributes:
+        name (str): Name the system is registered under.
+        weights (tuple[float, ...]): Weight of each card value, Ace (1) to 10.
+    """
+    name: str
+    weights: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.weights) != 10:
+            raise ValueError(f"A counting system needs 10 weights (Ace to 10), got {len(self.weights)}.")
+
+    @property
+    def imbalance(self) -> float:
+        """Sum of the weights over a full deck: 0 for balanced systems."""
+        return sum(self.code_weights())
+
+    @property
+    def balanced(self) -> bool:
+        """Whether a full deck counts to zero."""
+        return self.imbalance == 0
+
+    def initial_count(self, num_decks: int) -> float:
+        """
+        Running count at the start of a shoe.
+
+        Args:
+            num_decks (int): Number of decks in the shoe.
+
+        Returns:
+            float: 0 for balanced systems, -imbalance * (num_decks - 1) otherwise.
+        """
+        return -self.imbalance * (num_decks - 1) if self.imbalance else 0
+
+    def code_weights(self) -> list[float]:
+        """
+        Weight of every card code, so that a draw updates a count with one lookup.
+
+        Returns:
+            list[float]: Card.NUM_CODES weights, indexed by Card.code.
+        """
+        return [self.weights[value - 1] for value in Card.CODE_VALUES]
+
+
+COUNTING_SYSTEMS: dict[str, CountingSystem] = {}
+
+
+def register_counting_system(system: CountingSystem) -> CountingSystem:
+    """
+    Make a counting system available by name, replacing any system of that name.
+
+    Args:
+        system (CountingSystem): The system to register.
+
+    Returns:
+        CountingSystem: The registered system.
+    """
+    COUNTING_SYSTEMS[system.name] = system
+    return system
+
+
+def counting_system(system: str | CountingSystem) -> CountingSystem:
+    """
+    Look up a registered counting system.
+
+    Args:
+        system (str | CountingSystem): Registered name, or a system returned as is.
+
+    Returns:
+        CountingSystem: The system.
+
+    Raises:
+        ValueError: If no system is registered under the name.
+    """
+    if isinstance(system, CountingSystem):
+        return system
+    try:
+        return COUNTING_SYSTEMS[system]
+    except KeyError:
+        raise ValueError(f"Unknown counting system '{system}', "
+                         f"expected one of {sorted(COUNTING_SYSTEMS)}.") from None
+
+
+#                                                 A   2  3  4  5  6  7  8   9  10
+HI_LO = register_counting_system(CountingSystem("hi-lo", (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1)))
+KO = register_counting_system(CountingSystem("ko", (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1)))
+OMEGA_II = register_counting_system(CountingSystem("omega-ii", (0, 1, 1, 2, 2, 2, 1, 0, -1, -2)))
+ZEN = register_counting_system(CountingSystem("zen", (-1, 1, 1, 2, 2, 2, 1, 0, 0, -2)))
+
+
+class RunningCount:
+    """
+    The running count of one counting system over the cards dealt from a shoe.
+
+    The shoe adds the weight of every card it deals to the count (see Shoe.track)
+    and restarts it when reshuffled, so reading the count never rescans the cards.
+
+    Attributes:
+        system (CountingSystem): The counting system.
+        shoe (Shoe): The shoe being counted.
+        weights (list[float]): Weight of every card code.
+        initial (float): Running count of a fresh shoe.
+    """
+    def __init__(self, system: CountingSystem, shoe) -> None:
+        """
+        Initialize a new RunningCount.
+
+        Args:
+            system (CountingSystem): The counting system.
+            shoe (Shoe): The shoe being counted.
+        """
+        self.system: CountingSystem = system
+        self.shoe = shoe
+        self.weights: list[float] = system.code_weights()
+        self.initial: float = system.initial_count(shoe.num_decks)
+        # Updated by Shoe.draw_card
+        self._running: float = self.initial
+
+    def reset(self) -> None:
+        """Restart the count for a fresh shoe."""
+        self._running = self.initial
+
+    @property
+    def running(self) -> float:
+        """
+        The running count. Once the shoe has reached its penetration, it reads as
+        the count of the fresh shoe the next card will come from.
+        """
+        if self.shoe.needs_reshuffle:
+            return self.initial
+        return self._running
+
+    @property
+    def decks_remaining(self) -> float:
+        """Number of decks left to deal, as seen by running."""
+        if self.shoe.needs_reshuffle:
+            return float(self.shoe.num_decks)
+        return self.shoe.remaining / Card.NUM_CODES
+
+    @property
+    def true_count(self) -> float:
+        """The running count per deck remaining."""
+        return self.running / self.decks_remaining
+
+    def __repr__(self) -> str:
+        return f"RunningCount(system={self.system.name!r}, running={self.running}, true_count={self.true_count:.2f})"
@@ -4,15 +4,49 @@ class Hand:
     """
     Represents a blackjack hand, for either a player or the dealer.
 
+    The hand keeps a running hard total, ace count and pair flag that are updated as
+    cards are added, so the total, soft/bust/blackjack/split checks are all O(1).
+
     Attributes:
         cards (list[Card]): Cards currently in the hand.
         is_dealer (bool): Whether this hand belongs to the dealer.
+        actions (int): Actions taken on the hand, packed by Game (see game.action.pack_action).
+        is_split (bool): Whether the hand was created by splitting a pair.
     """
 
     def __init__(self, is_dealer: bool = False, current_bet: float = 1.0):
         self.cards: list[Card] = []
         self.is_dealer: bool = is_dealer
         self.current_bet: float = current_bet
+        self.actions: int = 0
+        self.is_split: bool = False
+        # Running state, see _update()
+        self._hard_total: int = 0
+        self._aces: int = 0
+        self._total: int = 0
+        self._soft: bool = False
+        self._pair: bool = False
+
+    def _update(self, card: Card) -> None:
+        """
+        Fold a newly appended card into the running state.
+
+        Args:
+            card (Card): The card that was just appended to self.cards.
+        """
+        hard_total = self._hard_total + card.value
+        self._hard_total = hard_total
+        if card.is_ace:
+            self._aces += 1
+        # If there's at least one Ace and treating one as 11 doesn't bust, it's soft
+        if self._aces and hard_total <= 11:
+            self._total = hard_total + 10
+            self._soft = True
+        else:
+            self._total = hard_total
+            self._soft = False
+        cards = self.cards
+        self._pair = len(cards) == 2 and cards[0].rank_index == card.rank_index
 
     def add_card(self, card: Card) -> None:
         """
@@ -22,6 +56,7 @@ class Hand:
             card (Card): The card to add.
         """
         self.cards.append(card)
+        self._update(card)
 
     def add_cards(self, cards: list[Card]) -> None:
         """
@@ -30,13 +65,21 @@ class Hand:
         Args:
             cards (list[Card]): List of cards to add.
         """
-        self.cards.extend(cards)
+        for card in cards:
+            self.cards.append(card)
+            self._update(card)
 
     def reset(self) -> None:
         """
         Remove all cards from the hand.
         """
         self.cards.clear()
+        self.actions = 0
+        self._hard_total = 0
+        self._aces = 0
+        self._total = 0
+        self._soft = False
+        self._pair = False
 
     def win(self, multiplier: float = 1.0) -> float:
         """
@@ -72,50 +115,56 @@ class Hand:
     @property
     def value(self) -> tuple[int, str]:
         """
-        Calculate the best hand total and its type ("Hard" or "Soft").
+        The best hand total and its type ("Hard" or "Soft").
 
-        Uses Card.value() for individual card values (Aces count as 1) and adjusts
-        for a single Ace as 11 if it doesn't bust.
+        Aces count as 1, and a single Ace counts as 11 if it doesn't bust.
 
         Returns:
             tuple[int, str]: (total, "Hard"/"Soft").
         """
-        # Sum all card values, treating Aces as 1
-        total = sum(card.value for card in self.cards)
-        # Count Aces for potential soft adjustment
-        aces = sum(1 for card in self.cards if card.rank == 'A')
-        # If there's at least one Ace and treating one as 11 doesn't bust, it's soft
-        if aces and total + 10 <= 21:
-            return total + 10, "Soft"
-        return total, "Hard"
+        return self._total, "Soft" if self._soft else "Hard"
+
+    @property
+    def total(self) -> int:
+        """
+        The best hand total (same as value[0]).
+        """
+        return self._total
+
+    @property
+    def hard_total(self) -> int:
+        """
+        The hand total with every Ace counted as 1.
+        """
+        return self._hard_total
 
     @property
     def is_soft(self) -> bool:
         """
         True if the hand is soft.
         """
-        return self.value[1] == "Soft"
+        return self._soft
 
     @property
     def is_blackjack(self) -> bool:
         """
         True if the hand is a natural blackjack (two cards totaling 21).
         """
-        return len(self.cards) == 2 and self.value[0] == 21
+        return self._total == 21 and len(self.cards) == 2
 
     @property
     def is_bust(self) -> bool:
         """
         True if the hand value exceeds 21.
         """
-        return self.value[0] > 21
+        return self._total > 21
 
     @property
     def can_split(self) -> bool:
         """
         True if the hand can be split (exactly two cards of the same rank).
         """
-        return len(self.cards) == 2 and self.cards[0].rank == self.cards[1].rank
+        return self._pair
 
     def display(self) -> str:
         """
@@ -123,7 +172,7 @@ class Hand:
 
         Returns:
             str: Comma-separated card symbols
-        """        
+        """
         cards_str = ", ".join(str(c) for c in self.cards)
         total, hand_type = self.value
         return f"{cards_str} ({hand_type} {total})"
@@ -133,4 +182,4 @@ class Hand:
 
     def __str__(self) -> str:
         # Always show all cards when converting to str
-        return self.display()
\ No newline at end of file
+        return self.display()
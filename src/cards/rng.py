@@ -0,0 +1,147 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only for annotations: NumPy is imported by the first stream created
+    import numpy as np
+
+
+class RandomStream:
+    """
+    A seedable, splittable source of randomness backed by a NumPy Generator.
+
+    Streams are built from a SeedSequence, so they can be split in two ways:
+    spawn() hands out fresh independent streams (one per worker, say), and child(key)
+    derives the stream for a fixed key directly, without drawing anything from the
+    parent. The Shoe uses child(n) for the n-th shoe, which makes it possible to jump
+    straight to any shoe of a long run. The keys of child() are kept apart from the
+    indices of spawn(), so spawn(n)[k] and child(k) are never the same stream.
+
+    Attributes:
+        seed_sequence (np.random.SeedSequence): The seed material of this stream.
+        generator (np.random.Generator): The underlying generator.
+    """
+
+    # Number of uniforms generated at once for random()
+    BLOCK_SIZE: int = 4096
+
+    # Spawn key element ahead of every child() key; SeedSequence.spawn numbers its
+    # children from 0 and would have to hand out 2**32 - 1 of them to reach it
+    CHILD_TAG: int = 0xFFFFFFFF
+
+    def __init__(self, seed: 'int | np.random.SeedSequence | None' = None) -> None:
+        """
+        Initialize a new RandomStream.
+
+        Args:
+            seed (int | SeedSequence | None, optional): Root seed, or an existing seed
+                sequence. None draws fresh entropy from the OS. Defaults to None.
+        """
+        # NumPy is imported by the first stream created, not by importing the package
+        import numpy as np
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence: np.random.SeedSequence = seed
+        self.generator: np.random.Generator = np.random.Generator(np.random.PCG64(seed))
+        self._uniforms: np.ndarray = np.empty(0)
+        self._next: int = 0
+
+    @property
+    def entropy(self) -> int:
+        """The root entropy, enough to recreate the stream with RandomStream(entropy)."""
+        return self.seed_sequence.entropy
+
+    def spawn(self, n: int) -> list['RandomStream']:
+        """
+        Spawn independent child streams.
+
+        Args:
+            n (int): Number of streams.
+
+        Returns:
+            list[RandomStream]: The new streams; later calls return further streams.
+        """
+        return [RandomStream(child) for child in self.seed_sequence.spawn(n)]
+
+    def child(self, key: int) -> 'RandomStream':
+        """
+        Derive the child stream for a key, without consuming from this stream.
+
+        The same key always gives the same stream, whatever has been drawn before.
+
+        Args:
+            key (int): Non-negative key of the child.
+
+        Returns:
+            RandomStream: The child stream.
+        """
+        import numpy as np
+        sequence = self.seed_sequence
+        return RandomStream(np.random.SeedSequence(
+            sequence.entropy,
+            spawn_key=sequence.spawn_key + (self.CHILD_TAG, key),
+            pool_size=sequence.pool_size,
+        ))
+
+    def get_state(self) -> dict:
+        """
+        Capture the stream exactly: its seed material, the position of its generator
+        and the uniforms pregenerated for random() but not yet served.
+
+        Returns:
+            dict: Plain picklable state, see set_state.
+        """
+        sequence = self.seed_sequence
+        return {
+            "seed": (sequence.entropy, sequence.spawn_key, sequence.pool_size),
+            "generator": self.generator.bit_generator.state,
+            "uniforms": self._uniforms[self._next:].copy(),
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Put the stream back in a state captured by get_state, so it continues
+        with exactly the draws it would have made.
+
+        Args:
+            state (dict): State returned by get_state.
+        """
+        import numpy as np
+        entropy, spawn_key, pool_size = state["seed"]
+        self.seed_sequence = np.random.SeedSequence(entropy, spawn_key=spawn_key, pool_size=pool_size)
+        self.generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        self.generator.bit_generator.state = state["generator"]
+        self._uniforms = state["uniforms"]
+        self._next = 0
+
+    def shuffle(self, buffer) -> None:
+        """
+        Shuffle a writable buffer of bytes (an array('B'), a memoryview of one, or a
+        NumPy array) in place with one bulk call.
+
+        Args:
+            buffer: The buffer to permute.
+        """
+        import numpy as np
+        if not isinstance(buffer, np.ndarray):
+            buffer = np.asarray(memoryview(buffer))
+        self.generator.shuffle(buffer)
+
+    def random(self) -> float:
+        """
+        Return a uniform float in [0, 1), served from a pregenerated block.
+        """
+        if self._next >= len(self._uniforms):
+            self._uniforms = self.generator.random(self.BLOCK_SIZE)
+            self._next = 0
+        value = self._uniforms[self._next]
+        self._next += 1
+        return float(value)
+
+    def integers(self, low: int, high: int, size: int | None = None):
+        """
+        Draw integers in [low, high), see np.random.Generator.integers.
+        """
+        return self.generator.integers(low, high, size=size)
+
+    def __repr__(self) -> str:
+        return f"RandomStream(entropy={self.entropy}, spawn_key={self.seed_sequence.spawn_key})"
@@ -1,23 +1,45 @@
 from .card import Card
-import random
+from .counting import CountingSystem, RunningCount, counting_system
+from .rng import RandomStream
+from array import array
+
+# Card code -> index of its value in a composition (Aces first, ten-valued cards last)
+CODE_VALUE_INDEX: tuple[int, ...] = tuple((value - 1) % 10 for value in Card.CODE_UPCARD_VALUES)
 
 class Shoe:
     """
     Represents a dealer's shoe containing multiple decks of cards for blackjack.
 
+    The shoe is a preallocated buffer of uint8 card codes (see Card.code) read through
+    a cursor: drawing a card only advances the cursor, and reshuffling permutes the
+    buffer in place, so the cost of a draw does not depend on the number of decks.
+
+    The n-th shoe dealt (counting the initial one as 0) is shuffled with rng.child(n),
+    so any single shoe of a run can be reproduced with jump_to(n).
+
+    Card counts registered with track() are updated by every draw with one lookup
+    per counting system and restarted by every reset, and so are the counts of the
+    values left (see composition).
+
     Attributes:
         num_decks (int): Number of decks in the shoe (4 through 8).
         cards (list[Card]): The current stack of cards in the shoe.
+        rng (RandomStream): Source of the shuffles.
+        shoe_index (int): Number of the current shoe, incremented by every reset.
+        counts (dict[str, RunningCount]): Tracked counts, by counting system name.
     """
 
     MIN_DECKS: int = 1
     MAX_DECKS: int = 8
+    # Name of the shoe model in SHOE_MODELS (see cards.shoe_models)
+    model: str = "shoe"
 
     def __init__(
-            self, 
-            num_decks: int = 6, 
+            self,
+            num_decks: int = 6,
             shuffle_on_init: bool = True,
-            penetration_threshold: float = 0.75
+            penetration_threshold: float = 0.75,
+            rng: RandomStream | None = None
             ) -> None:
         """
         Initialize a new Shoe instance.
@@ -26,6 +48,7 @@ class Shoe:
             num_decks (int, optional): Number of decks to include (between 1 and 8). Defaults to 6.
             shuffle_on_init (bool, optional): Whether to shuffle the shoe upon creation. Defaults to True.
             penetration_threshold (float, optional): The penetration threshold for the shoe. Defaults to 0.75.
+            rng (RandomStream, optional): Source of the shuffles. Defaults to an unseeded stream.
 
         Raises:
             ValueError: If num_decks is outside the allowed range.
@@ -33,28 +56,43 @@ class Shoe:
         if not (self.MIN_DECKS <= num_decks <= self.MAX_DECKS):
             raise ValueError(f"num_decks must be between {self.MIN_DECKS} and {self.MAX_DECKS}.")
         self.num_decks: int = num_decks
-        # Build the shoe by repeating a 52-card deck
-        self._original_cards: list[Card] = Card.create_deck() * self.num_decks
-        self.cards: list[Card] = list(self._original_cards)
+        # Build the shoe by repeating the 52 card codes of a fresh deck
+        self._original_codes: array = array('B', range(Card.NUM_CODES)) * self.num_decks
+        self._buffer: array = array('B', self._original_codes)
+        # Index of the next card to deal
+        self._cursor: int = 0
+        # Cards of each value in a full shoe, and left in this one (see composition)
+        self._full_values: list[int] = [0] * 10
+        for code in self._original_codes:
+            self._full_values[CODE_VALUE_INDEX[code]] += 1
+        self._values: list[int] = list(self._full_values)
 
         # Calculate the penetration point
         if not (0 < penetration_threshold < 1):
             raise ValueError("penetration_threshold must be between 0 and 1.")
-        
+
         # Set the penetration point based on the threshold
         self.penetration_threshold: float = penetration_threshold
 
         # Calculate the number of cards to keep in the shoe based on penetration
-        self.penetration_cut_index: int = int(len(self.cards) * (1-penetration_threshold))
+        self.penetration_cut_index: int = int(len(self._buffer) * (1-penetration_threshold))
+        # Cursor position at which the shoe is reset before the next draw
+        self._reshuffle_at: int = len(self._buffer) - self.penetration_cut_index
+
+        self.rng: RandomStream = rng if rng is not None else RandomStream()
+        self.shoe_index: int = 0
+        self.counts: dict[str, RunningCount] = {}
+        # The same counts as a list, for the loop in draw_card
+        self._counts: list[RunningCount] = []
 
         # Shuffle the shoe if required
         self.shuffle_on_init: bool = shuffle_on_init
         if shuffle_on_init:
-            self.shuffle()
+            self.rng.child(self.shoe_index).shuffle(self._buffer)
 
     def shuffle(self) -> None:
-        """Shuffle the cards in the shoe."""
-        random.shuffle(self.cards)
+        """Shuffle the cards remaining in the shoe, in place, from the main stream of rng."""
+        self.rng.shuffle(memoryview(self._buffer)[self._cursor:])
 
     def draw_card(self) -> Card:
         """
@@ -66,26 +104,132 @@ class Shoe:
         Raises:
             IndexError: If the shoe is empty.
         """
-        if len(self.cards) <= self.penetration_cut_index:
+        cursor = self._cursor
+        if cursor >= self._reshuffle_at:
             self.reset(shuffle=self.shuffle_on_init)
+            cursor = 0
+        self._cursor = cursor + 1
+        code = self._buffer[cursor]
+        self._values[CODE_VALUE_INDEX[code]] -= 1
+        if self._counts:
+            for count in self._counts:
+                count._running += count.weights[code]
+        return Card._BY_CODE[code]
+
+    def end_round(self) -> None:
+        """
+        Called by Game once a round is settled. The cards of a physical shoe stay in
+        the discard tray until the next reset, so there is nothing to do.
+        """
+
+    def get_state(self) -> tuple:
+        """
+        Capture the order of the shoe and the position of the cursor.
+
+        Returns:
+            tuple: Plain picklable state, see set_state.
+        """
+        return (bytes(self._buffer), self._cursor, self.shoe_index)
+
+    def set_state(self, state: tuple) -> None:
+        """
+        Put the shoe back in a state captured by get_state. Tracked counts are
+        restored separately.
 
-        return self.cards.pop(0)
+        Args:
+            state (tuple): State returned by get_state.
+        """
+        buffer, self._cursor, self.shoe_index = state
+        self._buffer[:] = array('B', buffer)
+        self._values = [0] * 10
+        for code in self._buffer[self._cursor:]:
+            self._values[CODE_VALUE_INDEX[code]] += 1
+
+    def track(self, system: str | CountingSystem) -> RunningCount:
+        """
+        Keep a running count of the cards dealt under a counting system.
+
+        Args:
+            system (str | CountingSystem): A registered system name or a system.
+
+        Returns:
+            RunningCount: The count, shared by every caller tracking the same system
+                and including the cards already dealt from the current shoe.
+
+        Raises:
+            ValueError: If the system name is not registered.
+        """
+        system = counting_system(system)
+        count = self.counts.get(system.name)
+        if count is None or count.system != system:
+            count = RunningCount(system, self)
+            weights = count.weights
+            count._running += sum(weights[code] for code in self._buffer[:self._cursor])
+            self._counts = [other for other in self._counts if other.system.name != system.name]
+            self._counts.append(count)
+            self.counts[system.name] = count
+        return count
+
+    @property
+    def cards(self) -> list[Card]:
+        """The remaining cards in the shoe, top card first."""
+        return [Card._BY_CODE[code] for code in self._buffer[self._cursor:]]
+
+    def composition(self) -> tuple[int, ...]:
+        """
+        Count the remaining cards of each value, from counts kept by every draw and reset.
+
+        Returns:
+            tuple[int, ...]: Counts of values 1 (Ace) to 10, ten-valued cards together.
+        """
+        return tuple(self._values)
 
     @property
     def remaining(self) -> int:
         """Get the number of remaining cards in the shoe."""
-        return len(self.cards)
+        return len(self._buffer) - self._cursor
+
+    @property
+    def needs_reshuffle(self) -> bool:
+        """Whether the shoe has reached its penetration and resets on the next draw."""
+        return self._cursor >= self._reshuffle_at
+
+    @property
+    def penetration(self) -> float:
+        """Fraction of the shoe dealt since the last reset."""
+        return self._cursor / len(self._buffer)
 
     def reset(self, shuffle: bool = True) -> None:
         """
         Reset the shoe to its original full state.
 
+        The buffer is restored to the fresh-deck order (a copy of a few hundred bytes)
+        and then permuted in place with the stream of the next shoe, so the shuffled
+        order depends only on the seed and the shoe number.
+
         Args:
             shuffle (bool, optional): Whether to shuffle after resetting. Defaults to True.
         """
-        self.cards = list(self._original_cards)
+        self.shoe_index += 1
+        self._cursor = 0
+        self._buffer[:] = self._original_codes
+        self._values[:] = self._full_values
+        for count in self._counts:
+            count.reset()
         if shuffle:
-            self.shuffle()
+            self.rng.child(self.shoe_index).shuffle(self._buffer)
+
+    def jump_to(self, shoe_index: int, shuffle: bool = True) -> None:
+        """
+        Set up the shoe exactly as the given shoe of the run was dealt, without
+        replaying the shoes before it.
+
+        Args:
+            shoe_index (int): Number of the shoe (0 is the initial shoe).
+            shuffle (bool, optional): Whether that shoe was shuffled. Defaults to True.
+        """
+        self.shoe_index = shoe_index - 1
+        self.reset(shuffle=shuffle)
 
     def display(self) -> str:
         """
@@ -94,16 +238,16 @@ class Shoe:
         Returns:
             str: A string representation of the shoe.
         """
-        for i, card in enumerate(self.cards[:5]):
-            print(f"{i+1}: {card}")
-        return f"Shoe with {self.num_decks} decks, {len(self.cards)} cards remaining."
+        for i, code in enumerate(self._buffer[self._cursor:self._cursor + 5]):
+            print(f"{i+1}: {Card._BY_CODE[code]}")
+        return f"Shoe with {self.num_decks} decks, {self.remaining} cards remaining."
 
     def __len__(self) -> int:
-        return len(self.cards)
+        return len(self._buffer) - self._cursor
 
     def __repr__(self) -> str:
-        return f"Shoe(num_decks={self.num_decks}, remaining_cards={len(self.cards)})"
+        return f"Shoe(num_decks={self.num_decks}, remaining_cards={self.remaining})"
 
     def __str__(self) -> str:
         """Return a user-friendly string for the Shoe."""
-        return self.display()
\ No newline at end of file
+        return self.display()
@@ -0,0 +1,335 @@
+from .card import Card
+from .counting import CountingSystem, RunningCount
+from .rng import RandomStream
+from .shoe import Shoe
+
+NUM_RANKS: int = len(Card.RANKS)
+
+
+class ContinuousShuffler(Shoe):
+    """
+    A continuous shuffling machine (CSM): every card is drawn at random from the
+    per-rank counts of the cards in the machine, and the cards of a round go back in
+    once it is settled (see end_round), so every round is dealt from a full shoe.
+
+    Nothing is ever shuffled: a draw is one uniform from rng and a scan of the 13 rank
+    counts. Suits are nominal, taken from the same uniform.
+
+    Tracked counts follow the cards of the current round and restart when they are
+    returned. shoe_index counts the rounds returned, so statistics batched by shoe
+    (Simulation.run_until) get one batch per round.
+    """
+    model: str = "csm"
+
+    def __init__(
+            self,
+            num_decks: int = 6,
+            shuffle_on_init: bool = True,
+            penetration_threshold: float = 0.75,
+            rng: RandomStream | None = None
+            ) -> None:
+        """
+        Initialize a new ContinuousShuffler, loaded with every card.
+
+        Args:
+            num_decks (int, optional): Number of decks in the machine (between 1 and 8). Defaults to 6.
+            shuffle_on_init (bool, optional): Kept for GameConfig; the machine is always shuffled.
+                Defaults to True.
+            penetration_threshold (float, optional): Kept for Rules; cards are returned
+                every round. Defaults to 0.75.
+            rng (RandomStream, optional): Source of the draws. Defaults to an unseeded stream.
+
+        Raises:
+            ValueError: If num_decks is outside the allowed range.
+        """
+        super().__init__(num_decks, shuffle_on_init=False, penetration_threshold=penetration_threshold, rng=rng)
+        self.shuffle_on_init = shuffle_on_init
+        self._full: int = 4 * num_decks
+        self._ranks: list[int] = [self._full] * NUM_RANKS
+        self._in_machine: int = NUM_RANKS * self._full
+        # Codes of the cards dealt since the machine was last loaded
+        self._tray: list[int] = []
+
+    def shuffle(self) -> None:
+        """The machine is always shuffled: nothing to do."""
+
+    def draw_card(self) -> Card:
+        """
+        Draw a card from the machine, with a probability proportional to the number of
+        cards of its rank left in it.
+
+        Returns:
+            Card: The drawn card.
+        """
+        if not self._in_machine:
+            self.reset()
+        target = int(self.rng.random() * self._in_machine)
+        ranks = self._ranks
+        rank = 0
+        while target >= ranks[rank]:
+            target -= ranks[rank]
+            rank += 1
+        ranks[rank] -= 1
+        self._in_machine -= 1
+        code = (target & 3) * NUM_RANKS + rank
+        self._tray.append(code)
+        if self._counts:
+            for count in self._counts:
+                count._running += count.weights[code]
+        return Card._BY_CODE[code]
+
+    def end_round(self) -> None:
+        """Put the cards of the settled round back into the machine."""
+        self.reset()
+
+    def reset(self, shuffle: bool = True) -> None:
+        """
+        Load every card back into the machine.
+
+        Args:
+            shuffle (bool, optional): Ignored, the machine is always shuffled. Defaults to True.
+        """
+        self.shoe_index += 1
+        self._ranks = [self._full] * NUM_RANKS
+        self._in_machine = NUM_RANKS * self._full
+        self._tray = []
+        for count in self._counts:
+            count.reset()
+
+    def track(self, system: str | CountingSystem) -> RunningCount:
+        """
+        Keep a running count of the cards dealt in the current round under a counting system.
+
+        Args:
+            system (str | CountingSystem): A registered system name or a system.
+
+        Returns:
+            RunningCount: The count, shared by every caller tracking the same system.
+
+        Raises:
+            ValueError: If the system name is not registered.
+        """
+        count = super().track(system)
+        weights = count.weights
+        count._running = count.initial + sum(weights[code] for code in self._tray)
+        return count
+
+    def composition(self) -> tuple[int, ...]:
+        """
+        Count the cards of each value in the machine.
+
+        Returns:
+            tuple[int, ...]: Counts of values 1 (Ace) to 10, ten-valued cards together.
+        """
+        ranks = self._ranks
+        return (ranks[12], *ranks[:8], sum(ranks[8:12]))
+
+    def get_state(self) -> tuple:
+        """
+        Capture the cards in the machine and those dealt from it.
+
+        Returns:
+            tuple: Plain picklable state, see set_state.
+        """
+        return (tuple(self._ranks), bytes(self._tray), self.shoe_index)
+
+    def set_state(self, state: tuple) -> None:
+        """
+        Put the machine back in a state captured by get_state.
+
+        Args:
+            state (tuple): State returned by get_state.
+        """
+        ranks, tray, self.shoe_index = state
+        self._ranks = list(ranks)
+        self._in_machine = sum(ranks)
+        self._tray = list(tray)
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in the machine, in no particular order (suits are nominal)."""
+        return [Card._BY_CODE[(i & 3) * NUM_RANKS + rank]
+                for rank, count in enumerate(self._ranks) for i in range(count)]
+
+    @property
+    def remaining(self) -> int:
+        """Get the number of cards in the machine."""
+        return self._in_machine
+
+    @property
+    def needs_reshuffle(self) -> bool:
+        """A machine never waits for a reshuffle."""
+        return False
+
+    @property
+    def penetration(self) -> float:
+        """Fraction of the machine dealt in the current round."""
+        return len(self._tray) / (NUM_RANKS * self._full)
+
+    def display(self) -> str:
+        return f"Continuous shuffler with {self.num_decks} decks, {self.remaining} cards in the machine."
+
+    def __len__(self) -> int:
+        return self._in_machine
+
+    def __repr__(self) -> str:
+        return f"ContinuousShuffler(num_decks={self.num_decks}, remaining_cards={self.remaining})"
+
+
+class InfiniteShoe(Shoe):
+    """
+    An infinite deck: every card is drawn independently, each of the 52 cards equally
+    likely. Codes are pregenerated in blocks of BLOCK_SIZE with one bulk call to rng
+    and read through a cursor, so nothing is ever shuffled.
+
+    num_decks is nominal: it sets the initial and true counts of tracked systems,
+    which never move, since a card dealt tells nothing about the next. shoe_index
+    counts the rounds played (see end_round), as for ContinuousShuffler.
+    """
+    model: str = "infinite"
+
+    # Number of card codes generated at once
+    BLOCK_SIZE: int = 4096
+
+    def __init__(
+            self,
+            num_decks: int = 6,
+            shuffle_on_init: bool = True,
+            penetration_threshold: float = 0.75,
+            rng: RandomStream | None = None
+            ) -> None:
+        """
+        Initialize a new InfiniteShoe.
+
+        Args:
+            num_decks (int, optional): Nominal number of decks (between 1 and 8). Defaults to 6.
+            shuffle_on_init (bool, optional): Kept for GameConfig. Defaults to True.
+            penetration_threshold (float, optional): Kept for Rules. Defaults to 0.75.
+            rng (RandomStream, optional): Source of the draws. Defaults to an unseeded stream.
+
+        Raises:
+            ValueError: If num_decks is outside the allowed range.
+        """
+        super().__init__(num_decks, shuffle_on_init=False, penetration_threshold=penetration_threshold, rng=rng)
+        self.shuffle_on_init = shuffle_on_init
+        self._block: bytes = b""
+        self._next: int = 0
+
+    def shuffle(self) -> None:
+        """Draws are independent: nothing to do."""
+
+    def draw_card(self) -> Card:
+        """
+        Draw a card, independently of every card before it.
+
+        Returns:
+            Card: The drawn card.
+        """
+        index = self._next
+        if index >= len(self._block):
+            import numpy as np
+            self._block = self.rng.generator.integers(
+                0, Card.NUM_CODES, self.BLOCK_SIZE, dtype=np.uint8).tobytes()
+            index = 0
+        self._next = index + 1
+        return Card._BY_CODE[self._block[index]]
+
+    def end_round(self) -> None:
+        """Count the settled round in shoe_index."""
+        self.shoe_index += 1
+
+    def reset(self, shuffle: bool = True) -> None:
+        """
+        Start a new shoe: the pregenerated codes are dropped, so the next draw starts a
+        fresh block from rng.
+
+        Args:
+            shuffle (bool, optional): Ignored. Defaults to True.
+        """
+        self.shoe_index += 1
+        self._block = b""
+        self._next = 0
+
+    def composition(self) -> tuple[int, ...]:
+        """
+        The nominal composition of num_decks decks, in the proportions every draw follows.
+
+        Returns:
+            tuple[int, ...]: Counts of values 1 (Ace) to 10, ten-valued cards together.
+        """
+        return (4 * self.num_decks,) * 9 + (16 * self.num_decks,)
+
+    def get_state(self) -> tuple:
+        """
+        Capture the pregenerated codes not yet dealt.
+
+        Returns:
+            tuple: Plain picklable state, see set_state.
+        """
+        return (self._block[self._next:], self.shoe_index)
+
+    def set_state(self, state: tuple) -> None:
+        """
+        Put the shoe back in a state captured by get_state.
+
+        Args:
+            state (tuple): State returned by get_state.
+        """
+        self._block, self.shoe_index = state
+        self._next = 0
+
+    @property
+    def cards(self) -> list[Card]:
+        """The pregenerated cards still to be dealt, top card first."""
+        return [Card._BY_CODE[code] for code in self._block[self._next:]]
+
+    @property
+    def remaining(self) -> int:
+        """The nominal number of cards, num_decks full decks."""
+        return self.num_decks * Card.NUM_CODES
+
+    @property
+    def needs_reshuffle(self) -> bool:
+        """An infinite deck never runs out."""
+        return False
+
+    @property
+    def penetration(self) -> float:
+        """An infinite deck is never dealt into."""
+        return 0.0
+
+    def display(self) -> str:
+        return f"Infinite deck (counted as {self.num_decks} decks)."
+
+    def __len__(self) -> int:
+        return self.remaining
+
+    def __repr__(self) -> str:
+        return f"InfiniteShoe(num_decks={self.num_decks})"
+
+
+# Shoe models by name, as given by Rules.shoe_model
+SHOE_MODELS: dict[str, type[Shoe]] = {
+    Shoe.model: Shoe,
+    ContinuousShuffler.model: ContinuousShuffler,
+    InfiniteShoe.model: InfiniteShoe,
+}
+
+
+def shoe_model(name: str) -> type[Shoe]:
+    """
+    Look up a shoe model.
+
+    Args:
+        name (str): Name of the model, a key of SHOE_MODELS.
+
+    Returns:
+        type[Shoe]: The shoe class.
+
+    Raises:
+        ValueError: If there is no model of that name.
+    """
+    try:
+        return SHOE_MODELS[name]
+    except KeyError:
+        raise ValueError(f"Unknown shoe model '{name}', expected one of {sorted(SHOE_MODELS)}.") from None
@@ -1,3 +1,29 @@
-from .simulation import Simulation
+from lazy import lazy_exports
 
-__all__ = ["Simulation"]
\ No newline at end of file
+# Public names and the submodules defining them, imported on first access
+_EXPORTS: dict[str, str] = {
+    "Simulation": ".simulation",
+    "BatchSimulation": ".batch",
+    "BatchResult": ".batch",
+    "LockstepSimulation": ".lockstep",
+    "LockstepResult": ".lockstep",
+    "ResultCache": ".cache",
+    "Sweep": ".sweep",
+    "SweepCell": ".sweep",
+    "SweepResult": ".sweep",
+    "OutcomeRecorder": ".recorder",
+    "OutcomeTable": ".recorder",
+    "RunningMoments": ".moments",
+    "BatchMeans": ".moments",
+    "ResultSink": ".sinks",
+    "MemorySink": ".sinks",
+    "ChunkSink": ".sinks",
+    "NpzChunkSink": ".sinks",
+    "NpyChunkSink": ".sinks",
+    "ParquetChunkSink": ".sinks",
+    "OutcomeReader": ".sinks",
+    "open_sink": ".sinks",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,335 @@
+from cards import Card, RandomStream
+from game import Action, Rules
+from strategies import CompiledStrategy, Strategy
+from strategies.compiled_strategy import NUM_TOTALS, NUM_UPCARDS, PAIR_BASE
+
+import numpy as np
+
+# Rank index (Card.RANKS order) -> blackjack value with Aces as 1, and as a dealer upcard
+RANK_VALUES = np.array([Card.VALUES[rank] for rank in Card.RANKS], dtype=np.int16)
+UPCARD_VALUES = np.where(RANK_VALUES == 1, 11, RANK_VALUES).astype(np.int16)
+ACE = Card.RANKS.index('A')
+NUM_RANKS = len(Card.RANKS)
+
+HIT, STAND, DOUBLE_DOWN, SPLIT = (Action.HIT.value, Action.STAND.value,
+                                  Action.DOUBLE_DOWN.value, Action.SPLIT.value)
+
+# Names of the PerfectStrategy tables, in the order they are stacked for lookups
+TABLE_NAMES = (
+    "split_table",
+    "hard_double_allowed_table",
+    "hard_double_forbidden_table",
+    "soft_double_allowed_table",
+    "soft_double_forbidden_table",
+)
+
+
+def action_codes(table: np.ndarray) -> np.ndarray:
+    """
+    Convert a table of Action objects into Action.value codes.
+
+    Args:
+        table (np.ndarray): Object table as built by PerfectStrategy; empty cells are NaN.
+
+    Returns:
+        np.ndarray: int8 table of the same shape, 0 where no action is defined.
+    """
+    codes = np.zeros(table.shape, dtype=np.int8)
+    for index, action in np.ndenumerate(table):
+        if isinstance(action, Action):
+            codes[index] = action.value
+    return codes
+
+
+class BatchResult:
+    """
+    Net results of a batch of independent rounds.
+
+    Attributes:
+        net (np.ndarray): Net win or loss of each round, in money.
+        hands (np.ndarray): Number of hands played in each round (more than one after splits).
+        bet_amount (float): Initial wager of each round.
+    """
+    def __init__(self, net: np.ndarray, hands: np.ndarray, bet_amount: float) -> None:
+        self.net = net
+        self.hands = hands
+        self.bet_amount = bet_amount
+
+    @property
+    def rounds(self) -> int:
+        return len(self.net)
+
+    @property
+    def ev(self) -> float:
+        """Expected net result per round, as a fraction of the initial wager."""
+        return float(self.net.mean()) / self.bet_amount
+
+    @property
+    def variance(self) -> float:
+        """Variance of the per-round result, in units of the initial wager squared."""
+        return float(self.net.var(ddof=1)) / self.bet_amount ** 2
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of ev."""
+        return (self.variance / self.rounds) ** 0.5
+
+    def __repr__(self) -> str:
+        return f"BatchResult(rounds={self.rounds}, ev={self.ev:.5f} ± {self.standard_error:.5f})"
+
+
+class _RoundBatch:
+    """
+    State of a batch of rounds held as arrays, one row per round.
+
+    Each round is dealt from its own freshly shuffled shoe: cards are drawn without
+    replacement from per-row rank counts (with rules.shoe_model "infinite", ranks are
+    drawn independently instead). Player hands live in (rows, max_hands)
+    arrays; a split appends a hand to the row's next free slot.
+    """
+    def __init__(self, engine: 'BatchSimulation', rows: int) -> None:
+        self.engine = engine
+        self.rows = rows
+        self.rng = engine.rng
+        hands = engine.max_hands
+        self.counts = np.full((rows, NUM_RANKS), 4 * engine.rules.num_decks, dtype=np.int16)
+        self.remaining = np.full(rows, 52 * engine.rules.num_decks, dtype=np.int32)
+
+        self.hard = np.zeros((rows, hands), dtype=np.int16)
+        self.aces = np.zeros((rows, hands), dtype=np.int8)
+        self.ncards = np.zeros((rows, hands), dtype=np.int8)
+        self.first_rank = np.zeros((rows, hands), dtype=np.int8)
+        self.pair = np.zeros((rows, hands), dtype=bool)
+        self.bet = np.ones((rows, hands), dtype=np.float64)
+        self.done = np.zeros((rows, hands), dtype=bool)
+        self.num_hands = np.ones(rows, dtype=np.int8)
+
+        self.dealer_hard = np.zeros(rows, dtype=np.int16)
+        self.dealer_aces = np.zeros(rows, dtype=np.int8)
+        self.dealer_ncards = np.zeros(rows, dtype=np.int8)
+        self.upcard = np.zeros(rows, dtype=np.int16)
+
+    def draw(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Draw one card for each of the given rows (each row at most once).
+
+        Returns:
+            np.ndarray: Rank indices of the drawn cards.
+        """
+        if self.engine.rules.shoe_model == "infinite":
+            return self.rng.integers(0, NUM_RANKS, len(rows))
+        cumulative = np.cumsum(self.counts[rows], axis=1)
+        target = (self.rng.random(len(rows)) * self.remaining[rows]).astype(np.int32)
+        ranks = (cumulative <= target[:, None]).sum(axis=1)
+        self.counts[rows, ranks] -= 1
+        self.remaining[rows] -= 1
+        return ranks
+
+    def add_to_hands(self, rows: np.ndarray, slots, ranks: np.ndarray) -> None:
+        """Add drawn ranks to the player hands at (rows, slots)."""
+        self.hard[rows, slots] += RANK_VALUES[ranks]
+        self.aces[rows, slots] += ranks == ACE
+        self.ncards[rows, slots] += 1
+        ncards = self.ncards[rows, slots]
+        first = ncards == 1
+        self.first_rank[rows[first], np.broadcast_to(slots, rows.shape)[first]] = ranks[first]
+        self.pair[rows, slots] = (ncards == 2) & (self.first_rank[rows, slots] == ranks)
+
+    def add_to_dealer(self, rows: np.ndarray, ranks: np.ndarray) -> None:
+        """Add drawn ranks to the dealer hands of the given rows."""
+        self.dealer_hard[rows] += RANK_VALUES[ranks]
+        self.dealer_aces[rows] += ranks == ACE
+        self.dealer_ncards[rows] += 1
+
+    def deal(self) -> None:
+        """Deal two cards to the player and the dealer, in table order."""
+        rows = np.arange(self.rows)
+        for card in range(2):
+            self.add_to_hands(rows, 0, self.draw(rows))
+            ranks = self.draw(rows)
+            if card == 0:
+                self.upcard = UPCARD_VALUES[ranks]
+            self.add_to_dealer(rows, ranks)
+
+    def decide(self, rows: np.ndarray, slot: int, total: np.ndarray, soft: np.ndarray) -> np.ndarray:
+        """Look up the strategy action code for the hands at (rows, slot)."""
+        two_cards = self.ncards[rows, slot] == 2
+        # Resplitting stops once every hand slot of the row is in use
+        pair = self.pair[rows, slot] & (self.num_hands[rows] < self.engine.max_hands)
+        pair_value = RANK_VALUES[self.first_rank[rows, slot]]
+        state = np.where(pair, PAIR_BASE + pair_value, (soft * 2 + two_cards) * NUM_TOTALS + total)
+        return self.engine.codes[state * NUM_UPCARDS + self.upcard[rows]]
+
+    def play_players(self) -> None:
+        """Play every player hand, slot by slot, until all of them stand or bust."""
+        for slot in range(self.engine.max_hands):
+            while True:
+                rows = np.flatnonzero((self.num_hands > slot) & ~self.done[:, slot])
+                if not len(rows):
+                    break
+                hard = self.hard[rows, slot]
+                soft = (self.aces[rows, slot] > 0) & (hard <= 11)
+                total = hard + 10 * soft
+                # Auto-stand on 21 or higher
+                finished = total >= 21
+                self.done[rows[finished], slot] = True
+                rows, total, soft = rows[~finished], total[~finished], soft[~finished]
+                if not len(rows):
+                    continue
+
+                action = self.decide(rows, slot, total, soft)
+                if (action == 0).any():
+                    raise ValueError("Strategy table has no action for some hands.")
+                if ((action == DOUBLE_DOWN) & (self.ncards[rows, slot] != 2)).any():
+                    raise ValueError("Cannot double down with more than two cards.")
+                if ((action == SPLIT) & ~self.pair[rows, slot]).any():
+                    raise ValueError("Cannot split a hand that is not a pair.")
+
+                self.done[rows[action == STAND], slot] = True
+                doubled = rows[action == DOUBLE_DOWN]
+                self.bet[doubled, slot] *= 2
+                self.done[doubled, slot] = True
+
+                split = rows[action == SPLIT]
+                new_slots = self.num_hands[split].astype(np.intp)
+                self.num_hands[split] += 1
+                # Both hands keep one card of the pair and get a new second card
+                pair_rank = self.first_rank[split, slot]
+                self.hard[split, slot] = RANK_VALUES[pair_rank]
+                self.aces[split, slot] = pair_rank == ACE
+                self.ncards[split, slot] = 1
+                self.pair[split, slot] = False
+                self.hard[split, new_slots] = RANK_VALUES[pair_rank]
+                self.aces[split, new_slots] = pair_rank == ACE
+                self.ncards[split, new_slots] = 1
+                self.first_rank[split, new_slots] = pair_rank
+                self.bet[split, new_slots] = self.bet[split, slot]
+
+                drawing = rows[action != STAND]
+                slots = np.full(len(drawing), slot)
+                self.add_to_hands(drawing, slots, self.draw(drawing))
+                if len(split):
+                    self.add_to_hands(split, new_slots, self.draw(split))
+
+    def play_dealer(self) -> None:
+        """Play the dealer hands with the same drawing rule as Dealer.play."""
+        hits_soft_17 = self.engine.rules.dealer_hits_soft_17
+        while True:
+            soft = (self.dealer_aces > 0) & (self.dealer_hard <= 11)
+            total = self.dealer_hard + 10 * soft
+            hitting = total < 17
+            if hits_soft_17:
+                hitting |= soft & (total == 17)
+            rows = np.flatnonzero(hitting)
+            if not len(rows):
+                return
+            self.add_to_dealer(rows, self.draw(rows))
+
+    def settle(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Settle every hand against the dealer, following Game._settle_bets.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Net result per round (in wager units) and hands per round.
+        """
+        multiplier = self.engine.rules.blackjack_multiplier
+        soft = (self.aces > 0) & (self.hard <= 11)
+        total = self.hard + 10 * soft
+        blackjack = (total == 21) & (self.ncards == 2)
+
+        dealer_soft = (self.dealer_aces > 0) & (self.dealer_hard <= 11)
+        dealer_total = (self.dealer_hard + 10 * dealer_soft)[:, None]
+        dealer_blackjack = ((dealer_total[:, 0] == 21) & (self.dealer_ncards == 2))[:, None]
+
+        outcome = np.select(
+            [total > 21,
+             blackjack & ~dealer_blackjack,
+             dealer_total > 21,
+             total > dealer_total,
+             total < dealer_total],
+            [-1.0, multiplier, 1.0, 1.0, -1.0],
+            default=0.0,
+        )
+        in_play = np.arange(self.engine.max_hands) < self.num_hands[:, None]
+        net = (outcome * self.bet * in_play).sum(axis=1)
+        return net, self.num_hands.copy()
+
+
+class BatchSimulation:
+    """
+    Plays large batches of independent rounds as NumPy arrays.
+
+    Every round is one player against the dealer, dealt from a freshly shuffled shoe
+    of rules.num_decks decks (which is how a continuous shuffling machine deals, see
+    cards.ContinuousShuffler), with the decisions taken from a compiled strategy table:
+    either a CompiledStrategy, or a table-driven strategy (the split/hard/soft tables
+    of PerfectStrategy) which is compiled on construction. Dealing, decisions, dealer play
+    and settlement follow Game, so results agree with the object-based game up to the
+    effect of playing deeper into a shared shoe.
+
+    Attributes:
+        strategy (Strategy): Strategy providing the decisions.
+        codes (np.ndarray): Flat action codes of the compiled strategy.
+        rules (Rules): House rules to play under.
+        bet_amount (float): Initial wager of each round.
+        batch_size (int): Number of rounds played per vectorized batch.
+        max_hands (int): Maximum number of hands per round after resplits.
+    """
+    def __init__(
+        self,
+        strategy: Strategy,
+        rules: Rules = Rules(),
+        bet_amount: float = 1.0,
+        batch_size: int = 100_000,
+        max_hands: int = 8,
+        seed: int | RandomStream | None = None
+    ) -> None:
+        if not isinstance(strategy, CompiledStrategy):
+            missing = [name for name in TABLE_NAMES if not hasattr(strategy, name)]
+            if missing:
+                raise ValueError(f"{type(strategy).__name__} is not table-driven: missing {missing}; "
+                                 f"wrap it in a CompiledStrategy.")
+        self.strategy = strategy
+        self.rules = rules
+        self.bet_amount = bet_amount
+        self.batch_size = batch_size
+        self.max_hands = max_hands
+        compiled = strategy if isinstance(strategy, CompiledStrategy) else CompiledStrategy(strategy)
+        self.codes = compiled.codes
+        self.rng = (seed if isinstance(seed, RandomStream) else RandomStream(seed)).generator
+
+    def play_batch(self, rows: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Play one batch of independent rounds.
+
+        Args:
+            rows (int): Number of rounds in the batch.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Net result per round (in money) and hands per round.
+        """
+        batch = _RoundBatch(self, rows)
+        batch.deal()
+        batch.play_players()
+        batch.play_dealer()
+        net, hands = batch.settle()
+        return net * self.bet_amount, hands
+
+    def run(self, rounds: int) -> BatchResult:
+        """
+        Play a number of independent rounds in batches of batch_size.
+
+        Args:
+            rounds (int): Total number of rounds to play.
+
+        Returns:
+            BatchResult: Per-round net results.
+        """
+        nets, hands = [], []
+        for start in range(0, rounds, self.batch_size):
+            net, batch_hands = self.play_batch(min(self.batch_size, rounds - start))
+            nets.append(net)
+            hands.append(batch_hands)
+        if not nets:
+            return BatchResult(np.zeros(0), np.zeros(0, dtype=np.int8), self.bet_amount)
+        return BatchResult(np.concatenate(nets), np.concatenate(hands), self.bet_amount)
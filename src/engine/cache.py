@@ -0,0 +1,292 @@
+from dataclasses import asdict, dataclass
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+from pathlib import Path
+import pickle
+import zlib
+
+from cards import RandomStream, RunningCount, Shoe
+from game import Game, PlayerStatistics
+from strategies import Strategy
+from .batch import TABLE_NAMES
+from .checkpoint import capture_game, load_game_state
+from .results import SimulationResult
+
+
+# Total size of the cached runs above which the least recently used are evicted
+DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+# Packages whose sources make up the engine version
+_ENGINE_PACKAGES: tuple[str, ...] = ("cards", "game", "strategies", "engine")
+
+
+@functools.cache
+def engine_version() -> str:
+    """
+    Version of the simulation code: a digest of the sources of the cards, game,
+    strategies and engine packages, so that any change to them invalidates the
+    cached runs.
+
+    Returns:
+        str: The version digest.
+    """
+    import importlib
+    digest = hashlib.sha256()
+    for name in _ENGINE_PACKAGES:
+        directory = Path(importlib.import_module(name).__file__).parent
+        for path in sorted(directory.rglob("*.py")):
+            digest.update(path.relative_to(directory.parent).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class _FingerprintPickler(pickle.Pickler):
+    """Pickles a strategy with the streams, shoes and counts bound to it left out."""
+    def persistent_id(self, obj):
+        if isinstance(obj, (RandomStream, Shoe, RunningCount)):
+            return type(obj).__name__
+        return None
+
+
+def strategy_fingerprint(strategy: Strategy) -> str:
+    """
+    Identity of a strategy: its class, the source of the class, its decision tables
+    and its parameters, without the random stream and shoe Game binds to it.
+
+    Args:
+        strategy (Strategy): The strategy.
+
+    Returns:
+        str: A digest of the strategy.
+    """
+    cls = type(strategy)
+    digest = hashlib.sha256(f"{cls.__module__}.{cls.__qualname__}".encode())
+    try:
+        digest.update(inspect.getsource(cls).encode())
+    except (OSError, TypeError):
+        pass
+    buffer = io.BytesIO()
+    pickler = _FingerprintPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dump([getattr(strategy, name, None) for name in TABLE_NAMES])
+    pickler.dump(vars(strategy))
+    digest.update(buffer.getvalue())
+    return digest.hexdigest()[:16]
+
+
+def run_key(game: Game, seed: int, workers: int) -> str:
+    """
+    Content address of a run of a game, its round count aside: a digest of the
+    engine version, the rules, wager, shoe and counting systems, every player's name,
+    bankroll and strategy, the seed and the number of workers.
+
+    Args:
+        game (Game): The game, before the run.
+        seed (int): Root seed of the run.
+        workers (int): Worker processes of the run.
+
+    Returns:
+        str: The key.
+    """
+    spec = {
+        "version": engine_version(),
+        "rules": asdict(game.rules),
+        "bet_amount": game.bet_amount,
+        "shuffle_on_init": game.shoe.shuffle_on_init,
+        "counting_systems": [[count.system.name, list(count.system.weights)]
+                             for count in game.shoe.counts.values()],
+        "players": [[player.name, player.bankroll, strategy_fingerprint(player.strategy)]
+                    for player in game.players],
+        "seed": seed,
+        "workers": workers,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:32]
+
+
+@dataclass
+class CachedRun:
+    """
+    A run stored in a ResultCache.
+
+    Attributes:
+        rounds (int): Rounds played.
+        seed (int): Root seed.
+        workers (int): Worker processes.
+        players (dict[str, dict]): Tallies of the run per player (PlayerStatistics.as_dict).
+        state (dict | None): State of the game at the end of an in-process run
+            (see capture_game), from which the run can be extended.
+    """
+    rounds: int
+    seed: int
+    workers: int
+    players: dict[str, dict]
+    state: dict | None = None
+
+
+class ResultCache:
+    """
+    An on-disk cache of the results of Simulation.run, see Simulation.run(cache=...).
+
+    Runs are stored under their content address (run_key) and round count. A repeat
+    of a run returns its stored tallies, and leaves the game as the run would have:
+    the players' bankrolls and tallies are updated and, for an in-process run, the
+    shoe and random streams are put where the run left them. An in-process run of
+    more rounds than a stored one with the same seed restarts from the stored state
+    and only plays the rounds missing, with exactly the result of a full run.
+
+    Once the stored runs take more than max_bytes, the least recently used ones are
+    deleted.
+
+    Attributes:
+        directory (Path): Directory of the stored runs.
+        max_bytes (int): Size bound of the directory.
+        hits (int): Runs returned from the cache.
+        extensions (int): Runs extended from a shorter stored run.
+        misses (int): Runs played from scratch.
+    """
+    SUFFIX: str = ".run"
+
+    def __init__(self, directory: str | os.PathLike | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize a new ResultCache.
+
+        Args:
+            directory (str | PathLike | None, optional): Directory of the stored runs.
+                Defaults to runs/ under analysis.tables.default_cache_directory().
+            max_bytes (int, optional): Size bound of the directory. Defaults to DEFAULT_MAX_BYTES.
+        """
+        if directory is None:
+            from analysis.tables import default_cache_directory
+            directory = default_cache_directory() / "runs"
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+
+    def _path(self, key: str, rounds: int) -> Path:
+        return self.directory / f"{key}-{rounds}{self.SUFFIX}"
+
+    def _read(self, path: Path) -> CachedRun | None:
+        """A stored run, or None if it is missing or unreadable (and then deleted)."""
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            path.unlink(missing_ok=True)
+            return None
+        # Mark as recently used for eviction
+        os.utime(path)
+        return entry
+
+    def _write(self, key: str, entry: CachedRun) -> None:
+        """Store a run atomically, then evict down to max_bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key, entry.rounds)
+        temporary = path.with_name(f"{path.name}-{os.getpid()}.tmp")
+        temporary.write_bytes(zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)))
+        os.replace(temporary, path)
+        self.evict()
+
+    def _longest_prefix(self, key: str, rounds: int) -> CachedRun | None:
+        """The longest stored run of a key shorter than rounds, if any."""
+        stored = []
+        for path in self.directory.glob(f"{key}-*{self.SUFFIX}"):
+            count = path.name[len(key) + 1:-len(self.SUFFIX)]
+            if count.isdigit() and int(count) < rounds:
+                stored.append((int(count), path))
+        for _, path in sorted(stored, reverse=True):
+            entry = self._read(path)
+            if entry is not None and entry.state is not None:
+                return entry
+        return None
+
+    def _apply(self, game: Game, entry: CachedRun) -> SimulationResult:
+        """Leave the game as the stored run did, and return the run's result."""
+        if entry.state is not None:
+            load_game_state(game, entry.state)
+            game.rounds_played += entry.rounds
+        players = {}
+        for player in game.players:
+            stats = PlayerStatistics.from_dict(entry.players[player.name])
+            player.bankroll += stats.net
+            player.stats.merge(stats)
+            players[player.name] = stats
+        return SimulationResult(entry.rounds, players, entry.seed, entry.workers)
+
+    def run(self, simulation, rounds: int, workers: int, seed: int) -> SimulationResult:
+        """
+        Run a simulation through the cache.
+
+        Args:
+            simulation (Simulation): The simulation.
+            rounds (int): Rounds to play.
+            workers (int): Worker processes.
+            seed (int): Root seed.
+
+        Returns:
+            SimulationResult: The result, stored or played.
+        """
+        game = simulation.game
+        key = run_key(game, seed, workers)
+        entry = self._read(self._path(key, rounds))
+        if entry is not None:
+            self.hits += 1
+            return self._apply(game, entry)
+
+        prefix = self._longest_prefix(key, rounds) if workers == 1 else None
+        if prefix is not None:
+            self.extensions += 1
+            result = self._apply(game, prefix)
+            result.merge(simulation._run_in_process(rounds - prefix.rounds, None, False, None, None))
+            result.seed = seed
+        else:
+            self.misses += 1
+            result = simulation.run(rounds, workers=workers, seed=seed)
+        state = capture_game(game) if workers == 1 else None
+        players = {name: stats.as_dict() for name, stats in result.players.items()}
+        self._write(key, CachedRun(rounds, seed, workers, players, state))
+        return result
+
+    def size(self) -> int:
+        """
+        Total size of the stored runs.
+
+        Returns:
+            int: Bytes.
+        """
+        return sum(path.stat().st_size for path in self.directory.glob(f"*{self.SUFFIX}"))
+
+    def evict(self) -> int:
+        """
+        Delete the least recently used runs until the rest fit in max_bytes.
+
+        Returns:
+            int: Number of runs deleted.
+        """
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        """Delete every stored run."""
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        return f"ResultCache(directory='{self.directory}', max_bytes={self.max_bytes})"
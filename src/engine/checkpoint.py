@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import pickle
+import struct
+import zlib
+
+from cards import RandomStream
+from game import Game, GameConfig, PlayerStatistics
+
+# Bumped whenever the layout of the saved state changes
+CHECKPOINT_VERSION: int = 1
+
+# File header: magic bytes, version, length and CRC-32 of the compressed payload
+_MAGIC = b"BJSIMCKP"
+_HEADER = struct.Struct("<8sHII")
+
+
+@dataclass
+class Checkpoint:
+    """
+    Everything needed to continue a Simulation.run exactly where it stopped.
+
+    Attributes:
+        game (dict): State of the game, see capture_game.
+        rounds (int): Rounds of the whole run.
+        completed (int): Rounds already played.
+        seed (int | None): Seed the run was started with.
+        totals (list[dict]): Players' tallies from before the run (PlayerStatistics.as_dict).
+        every_rounds (int | None): Rounds between checkpoints.
+        every_seconds (float | None): Seconds between checkpoints.
+    """
+    game: dict
+    rounds: int
+    completed: int
+    seed: int | None
+    totals: list[dict]
+    every_rounds: int | None = None
+    every_seconds: float | None = None
+
+
+def _streams(game: Game) -> list[RandomStream]:
+    """Random streams of a game in a fixed order: the game's, the shoe's, then the strategies'."""
+    streams = [game.rng, game.shoe.rng]
+    streams += [player.strategy.rng for player in game.players
+                if isinstance(getattr(player.strategy, "rng", None), RandomStream)]
+    return streams
+
+
+def capture_game(game: Game) -> dict:
+    """
+    Capture the state of a game between rounds.
+
+    Args:
+        game (Game): The game.
+
+    Returns:
+        dict: Its configuration (with the strategies as they are), the state of every
+            random stream, the state of the shoe (see Shoe.get_state), the running
+            counts, the players' bankrolls and tallies, and the rounds played.
+    """
+    shoe = game.shoe
+    return {
+        "config": GameConfig.from_game(game),
+        "streams": [stream.get_state() for stream in _streams(game)],
+        "shoe": shoe.get_state(),
+        "counts": {name: count._running for name, count in shoe.counts.items()},
+        "players": [(player.bankroll, player.stats.as_dict()) for player in game.players],
+        "rounds_played": game.rounds_played,
+    }
+
+
+def restore_game(state: dict, verbose: bool = False) -> Game:
+    """
+    Rebuild a game captured by capture_game.
+
+    Args:
+        state (dict): The captured state.
+        verbose (bool, optional): Whether the game prints its progress. Defaults to False.
+
+    Returns:
+        Game: A game that plays on exactly as the captured one would have.
+    """
+    rng = RandomStream()
+    rng.set_state(state["streams"][0])
+    game = state["config"].build(verbose=verbose, rng=rng)
+    load_game_state(game, state)
+    for player, (bankroll, tallies) in zip(game.players, state["players"]):
+        player.bankroll = bankroll
+        player.stats = PlayerStatistics.from_dict(tallies)
+    game.rounds_played = state["rounds_played"]
+    return game
+
+
+def load_game_state(game: Game, state: dict) -> None:
+    """
+    Put the random streams, shoe and counts of an existing game back as they were in
+    a state captured by capture_game, leaving its players and round number alone.
+
+    Args:
+        game (Game): A game with the configuration of the captured one.
+        state (dict): The captured state.
+    """
+    for stream, stream_state in zip(_streams(game), state["streams"]):
+        stream.set_state(stream_state)
+    shoe = game.shoe
+    shoe.set_state(state["shoe"])
+    for name, running in state["counts"].items():
+        shoe.counts[name]._running = running
+
+
+def write_checkpoint(path: str | os.PathLike, checkpoint: Checkpoint) -> None:
+    """
+    Write a checkpoint as a header and a compressed pickle of its state.
+
+    The file is written under a temporary name, flushed to disk and renamed over
+    the previous checkpoint, so a process killed at any point leaves either the old
+    or the new checkpoint, never a partial one.
+
+    Args:
+        path (str | PathLike): Checkpoint file.
+        checkpoint (Checkpoint): State to save.
+    """
+    path = Path(path)
+    payload = zlib.compress(pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL))
+    temporary = path.with_name(f"{path.name}-{os.getpid()}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, CHECKPOINT_VERSION, len(payload), zlib.crc32(payload)))
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def read_checkpoint(path: str | os.PathLike) -> Checkpoint:
+    """
+    Read a checkpoint written by write_checkpoint.
+
+    Args:
+        path (str | PathLike): Checkpoint file.
+
+    Returns:
+        Checkpoint: The saved state.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of this version, or is corrupted.
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        payload = file.read()
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path} is not a simulation checkpoint.")
+    magic, version, length, crc = _HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a simulation checkpoint.")
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint version {version} is not supported (expected {CHECKPOINT_VERSION}).")
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ValueError(f"Checkpoint {path} is corrupted.")
+    return pickle.loads(zlib.decompress(payload))
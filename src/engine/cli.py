@@ -0,0 +1,213 @@
+"""
+The blackjack-sim command: run a simulation described by a TOML or JSON file.
+
+Example config (TOML; the JSON form has the same keys):
+
+    rounds = 1_000_000
+    workers = 4
+    seed = 42
+    bet_amount = 1.0
+    counting_systems = ["hi-lo"]
+    output = "runs/perfect"      # optional: stream per-hand records here
+    output_format = "npz"        # optional: one of engine.sinks.FORMATS
+    profile = false              # optional: print per-phase timings
+    checkpoint = "run.ckpt"      # optional: save the run's state as it goes
+
+    [rules]
+    num_decks = 6
+    dealer_hits_soft_17 = false
+
+    [[players]]
+    name = "Perfect"
+    strategy = "PerfectStrategy"
+
+    [[players]]
+    name = "Counter"
+    strategy = { class = "DeviationStrategy", system = "hi-lo" }
+
+Strategies are class names exported by the strategies package, or tables with a
+class key and keyword arguments for it. Only this module and the packages it
+describes are imported up front; the simulation engine, and NumPy with it, load
+once the config has been read.
+"""
+import argparse
+from dataclasses import dataclass, fields
+import json
+import os
+from pathlib import Path
+import sys
+import tomllib
+
+from game import GameConfig, PlayerConfig, Rules
+
+
+@dataclass(frozen=True)
+class RunConfig:
+    """
+    A simulation run as described by a config file.
+
+    Attributes:
+        game (GameConfig): Players, rules and wagers.
+        rounds (int): Rounds to play.
+        workers (int): Worker processes.
+        seed (int | None): Root seed.
+        output (str | None): Directory to stream per-hand records to.
+        output_format (str | None): Format of the records.
+        profile (bool): Whether to collect per-phase timings.
+        checkpoint (str | None): File to checkpoint the run to.
+    """
+    game: GameConfig
+    rounds: int
+    workers: int = 1
+    seed: int | None = None
+    output: str | None = None
+    output_format: str | None = None
+    profile: bool = False
+    checkpoint: str | None = None
+
+    @classmethod
+    def from_dict(cls, config: dict) -> 'RunConfig':
+        """
+        Build a run from the parsed contents of a config file.
+
+        Args:
+            config (dict): The config, see the module docstring.
+
+        Returns:
+            RunConfig: The run.
+
+        Raises:
+            ValueError: If a key is unknown or a required one (rounds, players) is missing.
+        """
+        config = dict(config)
+        rules_fields = {rule.name for rule in fields(Rules)}
+        unknown_rules = set(config.get("rules", {})) - rules_fields
+        if unknown_rules:
+            raise ValueError(f"Unknown rules {sorted(unknown_rules)}, expected some of {sorted(rules_fields)}.")
+        rules = Rules(**config.pop("rules", {}))
+        if "rounds" not in config or not config.get("players"):
+            raise ValueError("A run config needs rounds and at least one player.")
+        players = tuple(_player_config(player) for player in config.pop("players"))
+        game = GameConfig(
+            players=players,
+            rules=rules,
+            bet_amount=config.pop("bet_amount", 1.0),
+            counting_systems=tuple(config.pop("counting_systems", ())),
+        )
+        run_fields = {run_field.name for run_field in fields(cls)} - {"game"}
+        unknown = set(config) - run_fields
+        if unknown:
+            raise ValueError(f"Unknown config keys {sorted(unknown)}.")
+        return cls(game=game, **config)
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike) -> 'RunConfig':
+        """
+        Read a run from a .toml or .json file.
+
+        Args:
+            path (str | PathLike): The config file.
+
+        Returns:
+            RunConfig: The run.
+
+        Raises:
+            ValueError: If the file is neither TOML nor JSON, or describes an invalid run.
+        """
+        path = Path(path)
+        if path.suffix == ".toml":
+            with open(path, "rb") as file:
+                return cls.from_dict(tomllib.load(file))
+        if path.suffix == ".json":
+            with open(path) as file:
+                return cls.from_dict(json.load(file))
+        raise ValueError(f"Unsupported config file {path}: expected .toml or .json.")
+
+
+def _player_config(player: dict) -> PlayerConfig:
+    """A player seat from its config table."""
+    if "name" not in player:
+        raise ValueError("Every [[players]] table needs a name key.")
+    strategy = player.get("strategy", "BasicStrategy")
+    if isinstance(strategy, dict):
+        options = dict(strategy)
+        try:
+            name = options.pop("class")
+        except KeyError:
+            raise ValueError(f"Strategy table of player {player.get('name')!r} needs a class key.") from None
+        import strategies
+        strategy_cls = getattr(strategies, name, None)
+        if strategy_cls is None:
+            raise ValueError(f"Unknown strategy '{name}'.")
+        strategy = strategy_cls(**options)
+    return PlayerConfig(name=player["name"], bankroll=player.get("bankroll", 0.0), strategy=strategy)
+
+
+def result_dict(result) -> dict:
+    """
+    A SimulationResult as plain data, for --json.
+
+    Args:
+        result (SimulationResult): The result.
+
+    Returns:
+        dict: rounds, seed, workers, players (name -> tallies with ev_per_round and
+            standard_error) and profile (GameProfile.as_dict()) if collected.
+    """
+    players = {
+        name: {**stats.as_dict(), "ev_per_round": stats.ev_per_round, "standard_error": stats.standard_error}
+        for name, stats in result.players.items()
+    }
+    report = {"rounds": result.rounds, "seed": result.seed, "workers": result.workers, "players": players}
+    if result.profile is not None:
+        report["profile"] = result.profile.as_dict()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of blackjack-sim.
+
+    Args:
+        argv (list[str] | None, optional): Command-line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(prog="blackjack-sim", description="Run a blackjack simulation from a config file.")
+    parser.add_argument("config", type=Path, help="run config, .toml or .json")
+    parser.add_argument("--rounds", type=int, help="override the rounds of the config")
+    parser.add_argument("--workers", type=int, help="override the worker processes of the config")
+    parser.add_argument("--seed", type=int, help="override the seed of the config")
+    parser.add_argument("--output", help="override the output directory of the config")
+    parser.add_argument("--profile", action="store_true", help="collect and print per-phase timings")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        run = RunConfig.from_file(args.config)
+    except (OSError, ValueError, TypeError, tomllib.TOMLDecodeError) as error:
+        parser.error(str(error))
+    overrides = {key: getattr(args, key) for key in ("rounds", "workers", "seed", "output")
+                 if getattr(args, key) is not None}
+    if args.profile:
+        overrides["profile"] = True
+    run = RunConfig(**{**run.__dict__, **overrides})
+
+    from engine.simulation import Simulation
+    simulation = Simulation(run.game.build())
+    result = simulation.run(run.rounds, workers=run.workers, seed=run.seed, output=run.output,
+                            output_format=run.output_format, checkpoint=run.checkpoint, profile=run.profile)
+    if args.json:
+        json.dump(result_dict(result), sys.stdout, indent=2)
+        print()
+    else:
+        print(result.summary())
+        if result.profile is not None:
+            print()
+            print(result.profile.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
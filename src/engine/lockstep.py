@@ -0,0 +1,476 @@
+from math import floor
+
+import numpy as np
+
+from cards import Card, CountingSystem, RandomStream, counting_system
+from game import Rules
+from strategies import CompiledStrategy, DeviationStrategy, Strategy
+from strategies.compiled_strategy import NUM_TOTALS, NUM_UPCARDS, PAIR_BASE
+from .batch import ACE, DOUBLE_DOWN, HIT, RANK_VALUES, SPLIT, STAND, TABLE_NAMES, UPCARD_VALUES, BatchResult
+
+# Card code -> rank index (Card.RANKS order)
+CODE_RANKS = np.array(Card.CODE_RANK_INDEX, dtype=np.int8)
+
+
+class LockstepResult:
+    """
+    Net results of rounds played at many tables in lockstep.
+
+    Arrays are indexed [round, table, seat]. Rounds at one table share a shoe and
+    are therefore correlated; tables are independent, so standard errors are taken
+    over the per-table means.
+
+    Attributes:
+        net (np.ndarray): Net win or loss of each seat in each round, in money.
+        hands (np.ndarray): Hands played by each seat in each round.
+        bet_amount (float): Initial wager of each seat.
+        players (list[str]): Name of the strategy of each seat.
+        true_counts (dict[str, np.ndarray]): Counting system name -> true count of
+            each table at the start of each round (when bets are placed), indexed
+            [round, table]. Since every result scales with the initial wager, a
+            bet spread can be applied afterwards as net * spread(true_count).
+        shoes (np.ndarray): Number of reshuffles of each table during the run.
+    """
+    def __init__(self, net: np.ndarray, hands: np.ndarray, bet_amount: float, players: list[str],
+                 true_counts: dict[str, np.ndarray], shoes: np.ndarray) -> None:
+        self.net = net
+        self.hands = hands
+        self.bet_amount = bet_amount
+        self.players = players
+        self.true_counts = true_counts
+        self.shoes = shoes
+
+    @property
+    def rounds(self) -> int:
+        """Rounds played at each table."""
+        return self.net.shape[0]
+
+    @property
+    def tables(self) -> int:
+        return self.net.shape[1]
+
+    def ev(self, seat: int = 0) -> float:
+        """
+        Expected net result per round of a seat, as a fraction of the initial wager.
+
+        Args:
+            seat (int, optional): Seat index. Defaults to 0.
+        """
+        return float(self.net[:, :, seat].mean()) / self.bet_amount
+
+    def standard_error(self, seat: int = 0) -> float:
+        """
+        Standard error of ev, from the spread of the per-table means.
+
+        Args:
+            seat (int, optional): Seat index. Defaults to 0.
+        """
+        means = self.net[:, :, seat].mean(axis=0) / self.bet_amount
+        return float(means.std(ddof=1)) / len(means) ** 0.5
+
+    def for_seat(self, seat: int = 0) -> BatchResult:
+        """
+        The rounds of one seat, flattened, e.g. for NetDistribution.from_result.
+
+        Args:
+            seat (int, optional): Seat index. Defaults to 0.
+
+        Returns:
+            BatchResult: Per-round results, table-major.
+        """
+        return BatchResult(self.net[:, :, seat].T.ravel(), self.hands[:, :, seat].T.ravel(), self.bet_amount)
+
+    def __repr__(self) -> str:
+        return f"LockstepResult(rounds={self.rounds}, tables={self.tables}, players={self.players})"
+
+
+class LockstepSimulation:
+    """
+    Plays many tables of Game in lockstep, with every table's state held as arrays.
+
+    Each table has its own shoe of rules.num_decks decks, dealt through a cursor up
+    to its penetration and reshuffled on the draw that finds it exhausted, so tables
+    reshuffle at different times; the shoes are rows of one (tables, cards) array of
+    rank indices. Every phase of a round (deal, decisions, dealer play, settlement)
+    is one batched operation over the tables, and player hands live in
+    (tables, seats, max_hands) arrays. The ragged parts are handled with masks: each
+    table keeps the seat and hand it is playing, the tables still deciding are
+    compacted into an index array at every step, and a split inserts the new hand
+    into the table's playing order right after the current one, as Game does.
+
+    Table t deals the same shoes, in the same order, as a Game created with
+    rng=RandomStream(seed).child(t): its n-th shoe is shuffled with the stream
+    child(t).child(0).child(n). With the same deterministic strategies the tables
+    therefore replay such Games card for card, up to the max_hands cap on resplits
+    (a pair that can no longer be split is played by its total, hitting when the
+    strategy has no entry for it).
+
+    Running counts of the counting systems of DeviationStrategy seats and of
+    counting_systems are kept per table and updated by every draw; deviation seats
+    look up their decisions in the table of their true-count bucket. Wagers are flat
+    (Strategy.bet_size is not consulted); the true counts at the start of each round
+    are returned so bet spreads can be applied to the results.
+
+    Attributes:
+        strategies (list[Strategy]): Strategy of each seat, in playing order.
+        rules (Rules): House rules of every table.
+        tables (int): Number of tables.
+        bet_amount (float): Initial wager of each seat.
+        max_hands (int): Maximum number of hands per seat after resplits.
+        systems (list[CountingSystem]): Counting systems tracked at every table.
+        codes (np.ndarray): Action codes, indexed [seat, bucket, state * NUM_UPCARDS + upcard].
+    """
+    def __init__(
+        self,
+        strategies: Strategy | list[Strategy],
+        tables: int = 1000,
+        rules: Rules = Rules(),
+        bet_amount: float = 1.0,
+        max_hands: int = 8,
+        counting_systems: tuple[str | CountingSystem, ...] = (),
+        seed: int | RandomStream | None = None
+    ) -> None:
+        """
+        Initialize a new LockstepSimulation and shuffle the first shoe of every table.
+
+        Args:
+            strategies (Strategy | list[Strategy]): Strategy of each seat: table-driven
+                strategies, CompiledStrategy or DeviationStrategy.
+            tables (int, optional): Number of tables. Defaults to 1000.
+            rules (Rules, optional): House rules. Defaults to Rules().
+            bet_amount (float, optional): Initial wager of each seat. Defaults to 1.0.
+            max_hands (int, optional): Maximum hands per seat after resplits. Defaults to 8.
+            counting_systems (tuple[str | CountingSystem, ...], optional): Additional
+                systems to count, e.g. for the true counts of the result. Defaults to ().
+            seed (int | RandomStream | None, optional): Seed of the shoes. Defaults to None.
+
+        Raises:
+            ValueError: If a strategy is not table-driven, a counting system is unknown, or
+                the rules deal from another model than a shuffled shoe.
+        """
+        if rules.shoe_model != "shoe":
+            raise ValueError(f"LockstepSimulation deals from shuffled shoes, not '{rules.shoe_model}'.")
+        self.strategies: list[Strategy] = list(strategies) if isinstance(strategies, (list, tuple)) else [strategies]
+        self.rules = rules
+        self.tables = tables
+        self.bet_amount = bet_amount
+        self.max_hands = max_hands
+
+        # Every seat becomes a stack of bucket tables; plain strategies have one bucket
+        self.systems: list[CountingSystem] = []
+        tables_per_seat = []
+        # Per seat: counting system index (-1 if none), first and last bucket, width
+        self._seat_buckets: list[tuple[int, int, int, float]] = []
+        for strategy in self.strategies:
+            if isinstance(strategy, DeviationStrategy):
+                system = self._system_index(strategy.system)
+                tables_per_seat.append(strategy.bucket_codes)
+                width = strategy.bucket_width
+                self._seat_buckets.append((system, floor(strategy.min_count / width),
+                                           floor(strategy.max_count / width), width))
+            else:
+                if not isinstance(strategy, CompiledStrategy):
+                    missing = [name for name in TABLE_NAMES if not hasattr(strategy, name)]
+                    if missing:
+                        raise ValueError(f"{type(strategy).__name__} is not table-driven: missing {missing}; "
+                                         f"wrap it in a CompiledStrategy.")
+                    strategy = CompiledStrategy(strategy)
+                tables_per_seat.append(strategy.codes[None, :])
+                self._seat_buckets.append((-1, 0, 0, 1.0))
+        for system in counting_systems:
+            self._system_index(system)
+        buckets = max(len(codes) for codes in tables_per_seat)
+        self.codes = np.zeros((len(self.strategies), buckets, tables_per_seat[0].shape[1]), dtype=np.int8)
+        for seat, codes in enumerate(tables_per_seat):
+            self.codes[seat, :len(codes)] = codes
+
+        # Shoes: one row of rank indices per table, read through a per-table cursor
+        root = seed if isinstance(seed, RandomStream) else RandomStream(seed)
+        self._streams = [root.child(table).child(0) for table in range(tables)]
+        self._fresh = np.tile(np.arange(Card.NUM_CODES, dtype=np.uint8), rules.num_decks)
+        self.size = len(self._fresh)
+        self.reshuffle_at = self.size - int(self.size * (1 - rules.penetration_threshold))
+        self.ranks = np.empty((tables, self.size), dtype=np.int8)
+        self.cursor = np.zeros(tables, dtype=np.int64)
+        self.shoe_index = np.zeros(tables, dtype=np.int64)
+        for table in range(tables):
+            self._shuffle(table)
+
+        # Running counts, one row per system
+        self.weights = np.array([[system.weights[value - 1] for value in RANK_VALUES] for system in self.systems],
+                                dtype=np.float64).reshape(len(self.systems), len(RANK_VALUES))
+        self.initial = np.array([system.initial_count(rules.num_decks) for system in self.systems], dtype=np.float64)
+        self.running = np.repeat(self.initial[:, None], tables, axis=1)
+
+    def _system_index(self, system: str | CountingSystem) -> int:
+        """Index of a counting system in self.systems, adding it if new."""
+        system = counting_system(system)
+        for index, tracked in enumerate(self.systems):
+            if tracked == system:
+                return index
+        self.systems.append(system)
+        return len(self.systems) - 1
+
+    def _shuffle(self, table: int) -> None:
+        """Shuffle the current shoe of a table, as Shoe.reset does."""
+        codes = self._fresh.copy()
+        self._streams[table].child(int(self.shoe_index[table])).shuffle(codes)
+        self.ranks[table] = CODE_RANKS[codes]
+
+    def _draw(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Draw one card at each of the given tables (each at most once), reshuffling
+        the shoes that have reached their penetration first.
+
+        Returns:
+            np.ndarray: Rank indices of the drawn cards.
+        """
+        cursor = self.cursor[rows]
+        stale = rows[cursor >= self.reshuffle_at]
+        if len(stale):
+            for table in stale.tolist():
+                self.shoe_index[table] += 1
+                self._shuffle(table)
+            self.cursor[stale] = 0
+            self.running[:, stale] = self.initial[:, None]
+            cursor = self.cursor[rows]
+        ranks = self.ranks[rows, cursor]
+        self.cursor[rows] = cursor + 1
+        if len(self.systems):
+            self.running[:, rows] += self.weights[:, ranks]
+        return ranks
+
+    def true_count(self, system: int, rows: np.ndarray) -> np.ndarray:
+        """
+        True count of some tables under a tracked system, read as RunningCount does:
+        a shoe past its penetration reads as the fresh shoe it is about to become.
+
+        Args:
+            system (int): Index in self.systems.
+            rows (np.ndarray): Table indices.
+
+        Returns:
+            np.ndarray: The true counts.
+        """
+        cursor = self.cursor[rows]
+        stale = cursor >= self.reshuffle_at
+        running = np.where(stale, self.initial[system], self.running[system, rows])
+        decks = np.where(stale, float(self.rules.num_decks), (self.size - cursor) / Card.NUM_CODES)
+        return running / decks
+
+    def _new_round(self) -> None:
+        """Clear the hands of every table."""
+        shape = (self.tables, len(self.strategies), self.max_hands)
+        self.hard = np.zeros(shape, dtype=np.int16)
+        self.aces = np.zeros(shape, dtype=np.int8)
+        self.ncards = np.zeros(shape, dtype=np.int8)
+        self.first_rank = np.zeros(shape, dtype=np.int8)
+        self.pair = np.zeros(shape, dtype=bool)
+        self.bet = np.ones(shape, dtype=np.float64)
+        self.num_hands = np.ones(shape[:2], dtype=np.int8)
+        # Playing order of the hand slots of each seat, and the position being played
+        self.order = np.broadcast_to(np.arange(self.max_hands, dtype=np.intp), shape).copy()
+        self.seat = np.zeros(self.tables, dtype=np.intp)
+        self.position = np.zeros(self.tables, dtype=np.intp)
+
+        self.dealer_hard = np.zeros(self.tables, dtype=np.int16)
+        self.dealer_aces = np.zeros(self.tables, dtype=np.int8)
+        self.dealer_ncards = np.zeros(self.tables, dtype=np.int8)
+        self.upcard = np.zeros(self.tables, dtype=np.int16)
+
+    def _add_to_hands(self, rows: np.ndarray, seats, slots, ranks: np.ndarray) -> None:
+        """Add drawn ranks to the player hands at (rows, seats, slots)."""
+        index = (rows, seats, slots)
+        self.hard[index] += RANK_VALUES[ranks]
+        self.aces[index] += ranks == ACE
+        self.ncards[index] += 1
+        ncards = self.ncards[index]
+        self.first_rank[index] = np.where(ncards == 1, ranks, self.first_rank[index])
+        self.pair[index] = (ncards == 2) & (self.first_rank[index] == ranks)
+
+    def _add_to_dealer(self, rows: np.ndarray, ranks: np.ndarray) -> None:
+        """Add drawn ranks to the dealer hands of the given tables."""
+        self.dealer_hard[rows] += RANK_VALUES[ranks]
+        self.dealer_aces[rows] += ranks == ACE
+        self.dealer_ncards[rows] += 1
+
+    def _deal(self) -> None:
+        """Deal two cards to every seat and the dealer, in table order."""
+        rows = np.arange(self.tables)
+        for card in range(2):
+            for seat in range(len(self.strategies)):
+                self._add_to_hands(rows, seat, 0, self._draw(rows))
+            ranks = self._draw(rows)
+            if card == 0:
+                self.upcard = UPCARD_VALUES[ranks]
+            self._add_to_dealer(rows, ranks)
+
+    def _decide(self, rows, seats, slots, total, soft) -> np.ndarray:
+        """Look up the action codes of the hands at (rows, seats, slots)."""
+        index = (rows, seats, slots)
+        two_cards = self.ncards[index] == 2
+        # Resplitting stops once every hand slot of the seat is in use
+        capped = self.pair[index] & (self.num_hands[rows, seats] >= self.max_hands)
+        pair = self.pair[index] & ~capped
+        pair_value = RANK_VALUES[self.first_rank[index]]
+        state = np.where(pair, PAIR_BASE + pair_value, (soft * 2 + two_cards) * NUM_TOTALS + total)
+        bucket = np.zeros(len(rows), dtype=np.intp)
+        for seat, (system, first, last, width) in enumerate(self._seat_buckets):
+            if system < 0:
+                continue
+            at_seat = np.flatnonzero(seats == seat)
+            if len(at_seat):
+                buckets = np.floor(self.true_count(system, rows[at_seat]) / width)
+                bucket[at_seat] = np.clip(buckets, first, last) - first
+        action = self.codes[seats, bucket, state * NUM_UPCARDS + self.upcard[rows]]
+        # A capped pair of Aces or twos has a total no table covers: draw to it
+        return np.where(capped & (action == 0), HIT, action)
+
+    def _advance(self, rows: np.ndarray) -> None:
+        """Move the given tables on to their next hand, or next seat."""
+        self.position[rows] += 1
+        seats = self.seat[rows]
+        finished = rows[self.position[rows] >= self.num_hands[rows, seats]]
+        self.seat[finished] += 1
+        self.position[finished] = 0
+
+    def _play_players(self) -> None:
+        """Play the hands of every seat in order, one decision per table and step."""
+        num_seats = len(self.strategies)
+        rows = np.arange(self.tables)
+        while len(rows):
+            seats = self.seat[rows]
+            slots = self.order[rows, seats, self.position[rows]]
+            hard = self.hard[rows, seats, slots]
+            soft = (self.aces[rows, seats, slots] > 0) & (hard <= 11)
+            total = hard + 10 * soft
+            # Auto-stand on 21 or higher
+            finished = total >= 21
+            self._advance(rows[finished])
+            keep = ~finished
+            rows, seats, slots, total, soft = rows[keep], seats[keep], slots[keep], total[keep], soft[keep]
+
+            if len(rows):
+                action = self._decide(rows, seats, slots, total, soft)
+                if (action == 0).any():
+                    raise ValueError("Strategy table has no action for some hands.")
+                if ((action == DOUBLE_DOWN) & (self.ncards[rows, seats, slots] != 2)).any():
+                    raise ValueError("Cannot double down with more than two cards.")
+                if ((action == SPLIT) & ~self.pair[rows, seats, slots]).any():
+                    raise ValueError("Cannot split a hand that is not a pair.")
+
+                doubling = action == DOUBLE_DOWN
+                self.bet[rows[doubling], seats[doubling], slots[doubling]] *= 2
+
+                splitting = action == SPLIT
+                split, split_seats, split_slots = rows[splitting], seats[splitting], slots[splitting]
+                new_slots = self.num_hands[split, split_seats].astype(np.intp)
+                self.num_hands[split, split_seats] += 1
+                # Both hands keep one card of the pair and get a new second card
+                pair_rank = self.first_rank[split, split_seats, split_slots]
+                for target in (split_slots, new_slots):
+                    index = (split, split_seats, target)
+                    self.hard[index] = RANK_VALUES[pair_rank]
+                    self.aces[index] = pair_rank == ACE
+                    self.ncards[index] = 1
+                    self.first_rank[index] = pair_rank
+                    self.pair[index] = False
+                    self.bet[index] = self.bet[split, split_seats, split_slots]
+                # The second hand is played right after the first: insert it into the order
+                order = self.order[split, split_seats]
+                after = (self.position[split] + 1)[:, None]
+                columns = np.arange(self.max_hands)[None, :]
+                shifted = np.concatenate([order[:, :1], order[:, :-1]], axis=1)
+                order = np.where(columns > after, shifted, order)
+                self.order[split, split_seats] = np.where(columns == after, new_slots[:, None], order)
+
+                drawing = action != STAND
+                self._add_to_hands(rows[drawing], seats[drawing], slots[drawing], self._draw(rows[drawing]))
+                if len(split):
+                    self._add_to_hands(split, split_seats, new_slots, self._draw(split))
+                self._advance(rows[(action == STAND) | doubling])
+            rows = np.flatnonzero(self.seat < num_seats)
+
+    def _play_dealer(self) -> None:
+        """Play the dealer hands with the same drawing rule as Dealer.play."""
+        hits_soft_17 = self.rules.dealer_hits_soft_17
+        while True:
+            soft = (self.dealer_aces > 0) & (self.dealer_hard <= 11)
+            total = self.dealer_hard + 10 * soft
+            hitting = total < 17
+            if hits_soft_17:
+                hitting |= soft & (total == 17)
+            rows = np.flatnonzero(hitting)
+            if not len(rows):
+                return
+            self._add_to_dealer(rows, self._draw(rows))
+
+    def _settle(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Settle every hand against its dealer, following Game._settle_bets.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Net result (in wager units) and hands, per table and seat.
+        """
+        soft = (self.aces > 0) & (self.hard <= 11)
+        total = self.hard + 10 * soft
+        blackjack = (total == 21) & (self.ncards == 2)
+
+        dealer_soft = (self.dealer_aces > 0) & (self.dealer_hard <= 11)
+        dealer_total = self.dealer_hard + 10 * dealer_soft
+        dealer_blackjack = ((dealer_total == 21) & (self.dealer_ncards == 2))[:, None, None]
+        dealer_total = dealer_total[:, None, None]
+
+        outcome = np.select(
+            [total > 21,
+             blackjack & ~dealer_blackjack,
+             dealer_total > 21,
+             total > dealer_total,
+             total < dealer_total],
+            [-1.0, self.rules.blackjack_multiplier, 1.0, 1.0, -1.0],
+            default=0.0,
+        )
+        in_play = np.arange(self.max_hands) < self.num_hands[:, :, None]
+        return (outcome * self.bet * in_play).sum(axis=2), self.num_hands.copy()
+
+    def play_round(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Play one round at every table, continuing each table's shoe.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Net result (in money) and hands, indexed [table, seat].
+        """
+        self._new_round()
+        self._deal()
+        self._play_players()
+        self._play_dealer()
+        net, hands = self._settle()
+        return net * self.bet_amount, hands
+
+    def run(self, rounds: int) -> LockstepResult:
+        """
+        Play a number of rounds at every table.
+
+        Args:
+            rounds (int): Rounds per table.
+
+        Returns:
+            LockstepResult: Per-round, per-table, per-seat results.
+        """
+        seats = len(self.strategies)
+        net = np.zeros((rounds, self.tables, seats))
+        hands = np.zeros((rounds, self.tables, seats), dtype=np.int8)
+        true_counts = {system.name: np.zeros((rounds, self.tables)) for system in self.systems}
+        rows = np.arange(self.tables)
+        shoes = self.shoe_index.copy()
+        for round_index in range(rounds):
+            for index, system in enumerate(self.systems):
+                true_counts[system.name][round_index] = self.true_count(index, rows)
+            net[round_index], hands[round_index] = self.play_round()
+        players = [repr(strategy) if isinstance(strategy, DeviationStrategy) else type(strategy).__name__
+                   for strategy in self.strategies]
+        return LockstepResult(net, hands, self.bet_amount, players, true_counts, self.shoe_index - shoes)
+
+    def __repr__(self) -> str:
+        return (f"LockstepSimulation(tables={self.tables}, seats={len(self.strategies)}, "
+                f"num_decks={self.rules.num_decks}, systems={[system.name for system in self.systems]})")
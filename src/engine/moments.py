@@ -0,0 +1,161 @@
+from statistics import NormalDist
+
+import numpy as np
+
+class RunningMoments:
+    """
+    Count, mean and variance of a stream of samples, updated a batch at a time.
+
+    Batches are combined with the pairwise update of Chan et al., which stays
+    accurate over billions of samples where a running sum of squares would not.
+
+    Attributes:
+        count (int): Number of samples seen.
+        mean (float): Mean of the samples.
+    """
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        # Sum of squared deviations from the mean
+        self._m2: float = 0.0
+
+    def update(self, samples: np.ndarray) -> None:
+        """
+        Fold a batch of samples into the moments.
+
+        Args:
+            samples (np.ndarray): One-dimensional array of samples.
+        """
+        count = len(samples)
+        if count == 0:
+            return
+        mean = float(samples.mean())
+        m2 = float(((samples - mean) ** 2).sum())
+        self._combine(count, mean, m2)
+
+    def merge(self, other: 'RunningMoments') -> None:
+        """
+        Fold the moments of another stream into these ones.
+
+        Args:
+            other (RunningMoments): Moments of disjoint samples.
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other._m2)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0.0 with fewer than two samples."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the mean, 0.0 with fewer than two samples."""
+        if self.count < 2:
+            return 0.0
+        return (self.variance / self.count) ** 0.5
+
+    def confidence_interval(self, level: float = 0.95) -> tuple[float, float]:
+        """
+        Normal-approximation confidence interval of the mean.
+
+        Args:
+            level (float, optional): Confidence level. Defaults to 0.95.
+
+        Returns:
+            tuple[float, float]: Lower and upper bound.
+        """
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * self.standard_error
+        return self.mean - half_width, self.mean + half_width
+
+    def __repr__(self) -> str:
+        return f"RunningMoments(count={self.count}, mean={self.mean:.6f}, variance={self.variance:.6f})"
+
+
+class BatchMeans:
+    """
+    Ratio estimate of a mean per unit (e.g. net result per hand) from batch totals,
+    with a standard error that accounts for correlation within batches.
+
+    Consecutive rounds of a shoe are correlated through the cards left in it, so
+    treating hands as independent understates the error. Grouping the rounds by
+    shoe and treating each shoe's (total, units) as one observation gives the
+    classical ratio estimator total/units with delta-method variance. Batches are
+    folded in online with Welford-style co-moment updates.
+
+    Attributes:
+        batches (int): Number of batches seen.
+    """
+    def __init__(self) -> None:
+        self.batches: int = 0
+        self._mean_total: float = 0.0
+        self._mean_units: float = 0.0
+        # Exact sum of the units, which the running mean would only approximate
+        self._units: float = 0
+        # Co-moments of (total, units)
+        self._total_total: float = 0.0
+        self._units_units: float = 0.0
+        self._total_units: float = 0.0
+
+    def update(self, total: float, units: float) -> None:
+        """
+        Fold in one batch.
+
+        Args:
+            total (float): Sum of the quantity over the batch (e.g. net result).
+            units (float): Number of units in the batch (e.g. hands played).
+        """
+        self.batches += 1
+        self._units += units
+        delta_total = total - self._mean_total
+        delta_units = units - self._mean_units
+        self._mean_total += delta_total / self.batches
+        self._mean_units += delta_units / self.batches
+        self._total_total += delta_total * (total - self._mean_total)
+        self._units_units += delta_units * (units - self._mean_units)
+        self._total_units += delta_total * (units - self._mean_units)
+
+    @property
+    def units(self) -> float:
+        """Total number of units over all batches."""
+        return self._units
+
+    @property
+    def mean(self) -> float:
+        """Mean per unit, 0.0 before any unit."""
+        return self._mean_total / self._mean_units if self._mean_units else 0.0
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of mean, inf with fewer than two batches."""
+        if self.batches < 2 or not self._mean_units:
+            return float("inf")
+        ratio = self.mean
+        residual = self._total_total - 2 * ratio * self._total_units + ratio * ratio * self._units_units
+        variance = max(residual, 0.0) / (self.batches - 1)
+        return (variance / self.batches) ** 0.5 / self._mean_units
+
+    def confidence_interval(self, level: float = 0.95) -> tuple[float, float]:
+        """
+        Normal-approximation confidence interval of mean.
+
+        Args:
+            level (float, optional): Confidence level. Defaults to 0.95.
+
+        Returns:
+            tuple[float, float]: Lower and upper bound.
+        """
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * self.standard_error
+        return self.mean - half_width, self.mean + half_width
+
+    def __repr__(self) -> str:
+        return f"BatchMeans(batches={self.batches}, mean={self.mean:.6f}, standard_error={self.standard_error:.6f})"
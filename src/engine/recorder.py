@@ -0,0 +1,245 @@
+from statistics import NormalDist
+
+import numpy as np
+
+from cards import Hand
+from game import Action
+from game.action import ACTION_BITS
+
+# Column name -> dtype of the per-hand outcome records
+COLUMNS: dict[str, type] = {
+    "round": np.int64,          # round number, counted from the start of the run
+    "player": np.int16,         # index of the player at the table
+    "hand": np.int8,            # index of the hand within the player's round (after splits)
+    "initial_total": np.int8,   # total of the first two cards
+    "initial_soft": np.bool_,   # whether the first two cards make a soft total
+    "pair_value": np.int8,      # value of the pair in the first two cards, 0 if none
+    "dealer_upcard": np.int8,   # dealer upcard value, 2 to 11
+    "actions": np.int64,        # actions taken, packed with game.pack_action
+    "wager": np.float64,        # total amount wagered on the hand
+    "net": np.float64,          # net result of the hand
+    "split": np.bool_,          # whether the hand came from a split
+    "doubled": np.bool_,        # whether the hand was doubled down
+    "outcome": np.int8,         # index into OUTCOMES
+    "dealer_total": np.int8,    # dealer's final total
+}
+
+OUTCOMES: tuple[str, ...] = ("loss", "bust", "push", "win", "blackjack")
+OUTCOME_CODES: dict[str, int] = {name: code for code, name in enumerate(OUTCOMES)}
+
+_DOUBLE_DOWN = Action.DOUBLE_DOWN.value
+_LAST_ACTION_MASK = (1 << ACTION_BITS) - 1
+
+
+class OutcomeRecorder:
+    """
+    Collects one row per settled hand into NumPy columns.
+
+    Rows are buffered as tuples and handed to a sink a chunk at a time: by default a
+    MemorySink that keeps the columns in memory, or a ChunkSink that writes every
+    chunk to disk, in which case memory use stays bounded by the chunk size.
+    Attach a recorder to a Game by setting game.recorder.
+
+    Attributes:
+        chunk_size (int): Number of rows buffered before they are handed to the sink.
+        sink (ResultSink): Destination of the chunks.
+    """
+    def __init__(self, chunk_size: int = 65536, round_offset: int = 0, sink=None) -> None:
+        """
+        Initialize a new OutcomeRecorder.
+
+        Args:
+            chunk_size (int, optional): Rows per chunk. Defaults to 65536.
+            round_offset (int, optional): Subtracted from Game.rounds_played so the
+                recorded rounds count from the start of the run. Defaults to 0.
+            sink (ResultSink, optional): Destination of the chunks. Defaults to a new MemorySink.
+        """
+        if sink is None:
+            from .sinks import MemorySink
+            sink = MemorySink()
+        self.chunk_size = chunk_size
+        self.round_offset = round_offset
+        self.sink = sink
+        self._written = 0
+        self._pending: list[tuple] = []
+
+    def record(
+        self,
+        round_index: int,
+        player_index: int,
+        hand_index: int,
+        hand: Hand,
+        dealer_hand: Hand,
+        wager: float,
+        net: float,
+        outcome: str
+    ) -> None:
+        """
+        Record a settled hand.
+
+        Args:
+            round_index (int): Game.rounds_played when the hand was settled.
+            player_index (int): Index of the player at the table.
+            hand_index (int): Index of the hand among the player's hands.
+            hand (Hand): The settled hand.
+            dealer_hand (Hand): The dealer's final hand.
+            wager (float): Amount wagered on the hand.
+            net (float): Net result of the hand.
+            outcome (str): One of OUTCOMES.
+        """
+        first, second = hand.cards[0], hand.cards[1]
+        hard = first.value + second.value
+        soft = (first.is_ace or second.is_ace) and hard <= 11
+        self._pending.append((
+            round_index - self.round_offset,
+            player_index,
+            hand_index,
+            hard + 10 if soft else hard,
+            soft,
+            first.value if first.rank_index == second.rank_index else 0,
+            dealer_hand.cards[0].upcard_value,
+            hand.actions,
+            wager,
+            net,
+            hand.is_split,
+            (hand.actions & _LAST_ACTION_MASK) == _DOUBLE_DOWN,
+            OUTCOME_CODES[outcome],
+            dealer_hand.total,
+        ))
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the buffered rows to the sink as one chunk."""
+        rows = self._pending
+        if not rows:
+            return
+        chunk = {
+            name: np.array(values, dtype=COLUMNS[name])
+            for name, values in zip(COLUMNS, zip(*rows))
+        }
+        self.sink.write(chunk)
+        self._written += len(rows)
+        self._pending = []
+
+    def close(self) -> None:
+        """Flush the buffered rows and close the sink."""
+        self.flush()
+        self.sink.close()
+
+    def __len__(self) -> int:
+        return self._written + len(self._pending)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Return the recorded columns, when the sink keeps them in memory.
+
+        Returns:
+            dict[str, np.ndarray]: Column name -> array.
+
+        Raises:
+            TypeError: If the sink does not keep the columns in memory.
+        """
+        self.flush()
+        if not hasattr(self.sink, "columns"):
+            raise TypeError(f"{type(self.sink).__name__} does not keep the columns in memory.")
+        return self.sink.columns()
+
+
+class OutcomeTable:
+    """
+    Per-hand outcome columns of a run, with vectorized statistics.
+
+    Attributes:
+        columns (dict[str, np.ndarray]): Column name -> array, see COLUMNS.
+        players (list[str]): Player names, indexed by the "player" column.
+    """
+    def __init__(self, columns: dict[str, np.ndarray], players: list[str]) -> None:
+        self.columns = columns
+        self.players = players
+
+    @classmethod
+    def concatenate(cls, tables: list['OutcomeTable'], round_offsets: list[int]) -> 'OutcomeTable':
+        """
+        Stack the tables of consecutive runs, shifting their round numbers.
+
+        Args:
+            tables (list[OutcomeTable]): Tables with the same players.
+            round_offsets (list[int]): Number added to the rounds of each table.
+
+        Returns:
+            OutcomeTable: The combined table.
+        """
+        columns = {name: np.concatenate([t.columns[name] for t in tables]) for name in COLUMNS}
+        columns["round"] += np.repeat(round_offsets, [len(t) for t in tables]).astype(np.int64)
+        return cls(columns, tables[0].players)
+
+    def __len__(self) -> int:
+        return len(self.columns["round"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def for_player(self, player: str | int) -> 'OutcomeTable':
+        """
+        Return the rows of one player.
+
+        Args:
+            player (str | int): Player name or index.
+
+        Returns:
+            OutcomeTable: The filtered table.
+        """
+        index = self.players.index(player) if isinstance(player, str) else player
+        mask = self.columns["player"] == index
+        return OutcomeTable({name: column[mask] for name, column in self.columns.items()}, self.players)
+
+    def round_net(self) -> np.ndarray:
+        """
+        Net result of each (round, player), summed over the player's hands.
+
+        Returns:
+            np.ndarray: One value per round and player, ordered by round then player.
+        """
+        keys = self.columns["round"] * len(self.players) + self.columns["player"]
+        _, inverse = np.unique(keys, return_inverse=True)
+        return np.bincount(inverse, weights=self.columns["net"])
+
+    def _samples(self, per: str) -> np.ndarray:
+        if per == "hand":
+            return self.columns["net"]
+        if per == "round":
+            return self.round_net()
+        raise ValueError(f"per must be 'hand' or 'round', got {per!r}.")
+
+    def ev(self, per: str = "hand") -> float:
+        """Mean net result per hand or per round."""
+        return float(self._samples(per).mean())
+
+    def variance(self, per: str = "hand") -> float:
+        """Sample variance of the net result per hand or per round."""
+        return float(self._samples(per).var(ddof=1))
+
+    def standard_error(self, per: str = "hand") -> float:
+        """Standard error of ev(per)."""
+        samples = self._samples(per)
+        return float(samples.std(ddof=1) / np.sqrt(len(samples)))
+
+    def confidence_interval(self, level: float = 0.95, per: str = "hand") -> tuple[float, float]:
+        """
+        Normal-approximation confidence interval of ev(per).
+
+        Args:
+            level (float, optional): Confidence level. Defaults to 0.95.
+            per (str, optional): "hand" or "round". Defaults to "hand".
+
+        Returns:
+            tuple[float, float]: Lower and upper bound.
+        """
+        samples = self._samples(per)
+        mean = samples.mean()
+        half_width = NormalDist().inv_cdf(0.5 + level / 2) * samples.std(ddof=1) / np.sqrt(len(samples))
+        return float(mean - half_width), float(mean + half_width)
+
+    def __repr__(self) -> str:
+        return f"OutcomeTable(rows={len(self)}, players={self.players})"
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING
+
+from game import GameProfile, PlayerStatistics
+from .moments import BatchMeans
+from .recorder import OutcomeTable
+
+if TYPE_CHECKING:
+    # Only for annotations, so that loading results does not load the sinks
+    from .sinks import OutcomeReader
+
+class SimulationResult:
+    """
+    Aggregated outcome of a Simulation run.
+
+    Attributes:
+        rounds (int): Number of rounds played.
+        players (dict[str, PlayerStatistics]): Tallies per player name, in table order.
+        seed (int | None): Root seed of the run, if any.
+        workers (int): Number of worker processes the rounds were sharded over.
+        outcomes (OutcomeTable | OutcomeReader | None): Per-hand records, when the run
+            was recorded in memory or to an output directory.
+        estimates (dict[str, BatchMeans] | None): EV per hand of each player with its
+            shoe batch-means standard error, for runs made with Simulation.run_until.
+        stop_reason (str | None): Criterion that ended a run_until run: "precision",
+            "time" or "max_rounds".
+        profile (GameProfile | None): Phase timings of the run, when made with profile=True.
+    """
+    def __init__(
+        self,
+        rounds: int = 0,
+        players: dict[str, PlayerStatistics] | None = None,
+        seed: int | None = None,
+        workers: int = 1,
+        outcomes: 'OutcomeTable | OutcomeReader | None' = None,
+        estimates: dict[str, BatchMeans] | None = None,
+        stop_reason: str | None = None,
+        profile: GameProfile | None = None
+    ) -> None:
+        self.rounds = rounds
+        self.players = players if players is not None else {}
+        self.seed = seed
+        self.workers = workers
+        self.outcomes = outcomes
+        self.estimates = estimates
+        self.stop_reason = stop_reason
+        self.profile = profile
+
+    def merge(self, other: 'SimulationResult') -> None:
+        """
+        Add the rounds, per-player tallies, outcome records and profile of another result to
+        this one. The other result's rounds are numbered after this one's.
+
+        Args:
+            other (SimulationResult): Result of another shard or run.
+        """
+        if other.outcomes is not None:
+            if self.outcomes is None:
+                self.outcomes = OutcomeTable.concatenate([other.outcomes], [self.rounds])
+            else:
+                self.outcomes = OutcomeTable.concatenate([self.outcomes, other.outcomes], [0, self.rounds])
+        if other.profile is not None:
+            if self.profile is None:
+                self.profile = GameProfile()
+            self.profile.merge(other.profile)
+        self.rounds += other.rounds
+        for name, stats in other.players.items():
+            if name not in self.players:
+                self.players[name] = PlayerStatistics()
+            self.players[name].merge(stats)
+
+    def summary(self) -> str:
+        """
+        Format one line per player with hands played, net result and EV per round.
+
+        Returns:
+            str: The summary table.
+        """
+        lines = [f"{'player':<16}{'hands':>10}{'net':>12}{'ev/round':>12}{'± se':>10}"]
+        for name, stats in self.players.items():
+            lines.append(f"{name:<16}{stats.hands:>10}{stats.net:>12.2f}"
+                         f"{stats.ev_per_round:>12.5f}{stats.standard_error:>10.5f}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"SimulationResult(rounds={self.rounds}, players={list(self.players)}, workers={self.workers})"
@@ -1,4 +1,126 @@
-from game import Game
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import time
+from typing import TYPE_CHECKING
+
+from cards import RandomStream
+from game import Game, GameConfig, PlayerStatistics
+from .checkpoint import Checkpoint, capture_game, read_checkpoint, restore_game, write_checkpoint
+from .moments import BatchMeans
+from .recorder import OutcomeRecorder, OutcomeTable
+from .results import SimulationResult
+from .sinks import OutcomeReader, default_format, open_sink, write_manifest
+
+if TYPE_CHECKING:
+    # Only for annotations: callers that use a cache import engine.cache themselves
+    from .cache import ResultCache
+
+
+# Rounds between checkpoints when neither interval is given
+DEFAULT_CHECKPOINT_ROUNDS: int = 100_000
+
+
+def worker_streams(seed: int | None, workers: int) -> tuple[int, list[RandomStream]]:
+    """
+    Spawn one independent random stream per worker from a root seed.
+
+    Args:
+        seed (int | None): Root seed; None draws fresh entropy.
+        workers (int): Number of workers.
+
+    Returns:
+        tuple[int, list[RandomStream]]: The root entropy actually used and the worker streams.
+    """
+    root = RandomStream(seed)
+    return root.entropy, root.spawn(workers)
+
+
+def shard_rounds(rounds: int, workers: int) -> list[int]:
+    """Split rounds over workers as evenly as possible, earlier shards taking the remainder."""
+    base, extra = divmod(rounds, workers)
+    return [base + (1 if i < extra else 0) for i in range(workers)]
+
+
+def plan_batch(
+    rounds: int,
+    elapsed: float,
+    standard_error: float,
+    target_se: float | None = None,
+    time_left: float | None = None
+) -> int:
+    """
+    Number of rounds to play before checking the stop criteria of run_until again.
+
+    The batch at most doubles the run, and is cut to the rounds projected to reach
+    the target standard error (which shrinks as 1/sqrt(rounds)) or to fit in the
+    time left at the rate measured so far.
+
+    Args:
+        rounds (int): Rounds played so far.
+        elapsed (float): Seconds spent so far.
+        standard_error (float): Current standard error, inf if not yet known.
+        target_se (float | None, optional): Target standard error. Defaults to None.
+        time_left (float | None, optional): Seconds left in the budget. Defaults to None.
+
+    Returns:
+        int: Rounds in the next batch, at least 1.
+    """
+    batch = rounds
+    if target_se is not None and math.isfinite(standard_error) and standard_error > target_se:
+        batch = min(batch, math.ceil(rounds * ((standard_error / target_se) ** 2 - 1)))
+    if time_left is not None and elapsed > 0:
+        batch = min(batch, math.ceil(time_left * rounds / elapsed))
+    return max(batch, 1)
+
+
+def run_shard(
+    config: GameConfig,
+    rounds: int,
+    rng: RandomStream,
+    record: bool,
+    output: str | os.PathLike | None,
+    output_format: str | None,
+    part: int,
+    profile: bool = False
+) -> SimulationResult:
+    """
+    Play rounds of a game built from a config, as one shard of a parallel run.
+
+    Module-level so that it can be submitted to a process pool; the rounds played
+    depend only on the config, the round count and the stream.
+
+    Args:
+        config (GameConfig): Game to build.
+        rounds (int): Rounds to play.
+        rng (RandomStream): Random stream of the game.
+        record (bool): Whether to keep the outcome of every hand in memory.
+        output (str | PathLike | None): Destination of the outcomes, written as they
+            are played instead of kept in memory, or None.
+        output_format (str | None): Format of output (see open_sink).
+        part (int): Number of the shard, naming its part of output.
+        profile (bool, optional): Whether to time the phases of every round. Defaults to False.
+
+    Returns:
+        SimulationResult: Tallies of the shard.
+    """
+    game = config.build(rng=rng)
+    if profile:
+        game.enable_profiling()
+    if output is not None:
+        game.recorder = OutcomeRecorder(sink=open_sink(output, output_format, part))
+    elif record:
+        game.recorder = OutcomeRecorder()
+    for _ in range(rounds):
+        game.play_round()
+    outcomes = None
+    if output is not None:
+        game.recorder.close()
+    elif record:
+        outcomes = OutcomeTable(game.recorder.columns(), [player.name for player in game.players])
+    return SimulationResult(rounds, {player.name: player.stats for player in game.players},
+                            outcomes=outcomes, profile=game.profile)
+
 
 class Simulation:
     """
@@ -8,16 +130,346 @@ class Simulation:
         self.game = game
         self.verbose = verbose
 
-    def run(self, rounds: int) -> None:
+    def run(
+        self,
+        rounds: int,
+        workers: int = 1,
+        seed: int | None = None,
+        record: bool = False,
+        output: str | os.PathLike | None = None,
+        output_format: str | None = None,
+        checkpoint: str | os.PathLike | None = None,
+        checkpoint_rounds: int | None = None,
+        checkpoint_seconds: float | None = None,
+        profile: bool = False,
+        cache: 'ResultCache | None' = None
+    ) -> SimulationResult:
         """
         Run the simulation for a specified number of rounds.
+
+        With workers > 1 the rounds are sharded over a process pool. Every worker builds
+        its own copy of the game from a GameConfig and its own RandomStream spawned
+        from the root seed; shard results are merged in worker order and applied to the
+        players of this game, so a given seed and worker count always reproduces
+        the same result.
+
+        Args:
+            rounds (int): Number of rounds to play.
+            workers (int, optional): Number of worker processes. Defaults to 1 (in-process).
+            seed (int | None, optional): Root seed. In-process, a seed restarts the game's
+                randomness with Game.reseed. Defaults to None (unseeded).
+            record (bool, optional): Whether to record every settled hand into
+                result.outcomes. Defaults to False.
+            output (str | PathLike | None, optional): Directory to stream the per-hand
+                records to, in chunks, instead of keeping them in memory; result.outcomes
+                is then an OutcomeReader over it. Defaults to None.
+            output_format (str | None, optional): Chunk format, one of engine.sinks.FORMATS.
+                Defaults to Parquet when pyarrow is installed, compressed .npz otherwise.
+            checkpoint (str | PathLike | None, optional): File to save the full state of
+                the run to, every checkpoint_rounds rounds or checkpoint_seconds seconds
+                (DEFAULT_CHECKPOINT_ROUNDS rounds if neither is given) and at the end;
+                continue an interrupted run with Simulation.resume. In-process runs
+                without recording only. Defaults to None.
+            checkpoint_rounds (int | None, optional): Rounds between checkpoints. Defaults to None.
+            checkpoint_seconds (float | None, optional): Seconds between checkpoints. Defaults to None.
+            profile (bool, optional): Whether to time the phases of every round and the
+                strategies' decisions into result.profile (see Game.enable_profiling).
+                Defaults to False.
+            cache (ResultCache | None, optional): On-disk cache of run results: a run
+                stored there is not played again, and an in-process run is extended
+                from a shorter stored one (see engine.cache). Seeded runs without
+                recording, checkpoints or profiling only. Defaults to None.
+
+        Returns:
+            SimulationResult: Per-player tallies for the rounds played in this run.
+
+        Raises:
+            ValueError: If workers is below 1, a checkpoint is asked of a parallel
+                or recorded run, or a cache of an unseeded, recorded, checkpointed
+                or profiled one.
         """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if checkpoint is not None and (workers > 1 or record or output is not None):
+            raise ValueError("Checkpoints are only supported for in-process runs without recording.")
+        if cache is not None:
+            if seed is None or record or output is not None or checkpoint is not None or profile:
+                raise ValueError("Only seeded runs without recording, checkpoints or profiling can be cached.")
+            return cache.run(self, rounds, workers, seed)
         if self.verbose:
             print(f"Starting simulation for {rounds} rounds")
 
-        for _ in range(rounds):
-            self.game.play_round()
-            if self.verbose:
-                print(f"Completed round {_ + 1}")
+        if profile and workers == 1:
+            previous = self.game.profile
+            run_profile = self.game.enable_profiling()
+        try:
+            result = self._dispatch(rounds, workers, seed, record, output, output_format,
+                                    checkpoint, checkpoint_rounds, checkpoint_seconds, profile)
+        finally:
+            if profile and workers == 1:
+                self.game.disable_profiling()
+                if previous is not None:
+                    previous.merge(run_profile)
+                    self.game.enable_profiling(previous)
+        if profile and workers == 1:
+            result.profile = run_profile
+
+        if self.verbose:
+            print(f"Simulation completed")
+        return result
+
+    def _dispatch(
+        self,
+        rounds: int,
+        workers: int,
+        seed: int | None,
+        record: bool,
+        output: str | os.PathLike | None,
+        output_format: str | None,
+        checkpoint: str | os.PathLike | None,
+        checkpoint_rounds: int | None,
+        checkpoint_seconds: float | None,
+        profile: bool
+    ) -> SimulationResult:
+        """Play the rounds of run on the path its arguments call for."""
+        if checkpoint is not None:
+            if checkpoint_rounds is None and checkpoint_seconds is None:
+                checkpoint_rounds = DEFAULT_CHECKPOINT_ROUNDS
+            if seed is not None:
+                self.game.reseed(seed)
+            players = self.game.players
+            state = Checkpoint(game={}, rounds=rounds, completed=0, seed=seed,
+                               totals=[player.stats.as_dict() for player in players],
+                               every_rounds=checkpoint_rounds, every_seconds=checkpoint_seconds)
+            for player in players:
+                player.stats = PlayerStatistics()
+            result = self._run_checkpointed(checkpoint, state)
+        elif workers == 1:
+            result = self._run_in_process(rounds, seed, record, output, output_format)
+        else:
+            result = self._run_parallel(rounds, workers, seed, record, output, output_format, profile)
+        return result
+
+    @classmethod
+    def resume(cls, path: str | os.PathLike, verbose: bool = False) -> SimulationResult:
+        """
+        Continue a run from its checkpoint file, see run.
+
+        The game is rebuilt with the shoe, random streams, counts, bankrolls and
+        tallies it had when the checkpoint was written, so the run finishes exactly as
+        if it had never been interrupted, and keeps writing checkpoints to the same
+        file at the same interval.
+
+        Args:
+            path (str | PathLike): Checkpoint file of the run.
+            verbose (bool, optional): Whether to print progress. Defaults to False.
+
+        Returns:
+            SimulationResult: Per-player tallies of the whole run.
+
+        Raises:
+            ValueError: If the file is not a valid checkpoint.
+        """
+        state = read_checkpoint(path)
+        simulation = cls(restore_game(state.game), verbose)
+        return simulation._run_checkpointed(path, state)
+
+    def _run_checkpointed(self, path: str | os.PathLike, state: Checkpoint) -> SimulationResult:
+        """Play the rounds left in a run, saving its state to path as it goes."""
+        game = self.game
+        players = game.players
+        every_rounds = state.every_rounds or math.inf
+        every_seconds = state.every_seconds or math.inf
+        next_round = state.completed + every_rounds
+        deadline = time.perf_counter() + every_seconds
+        try:
+            while state.completed < state.rounds:
+                game.play_round()
+                state.completed += 1
+                if self.verbose:
+                    print(f"Completed round {state.completed}")
+                if state.completed >= next_round or time.perf_counter() >= deadline:
+                    state.game = capture_game(game)
+                    write_checkpoint(path, state)
+                    next_round = state.completed + every_rounds
+                    deadline = time.perf_counter() + every_seconds
+            state.game = capture_game(game)
+            write_checkpoint(path, state)
+        finally:
+            run_stats = {player.name: player.stats for player in players}
+            for player, tallies in zip(players, state.totals):
+                stats = PlayerStatistics.from_dict(tallies)
+                stats.merge(player.stats)
+                player.stats = stats
+        return SimulationResult(state.rounds, run_stats, state.seed)
+
+    def _run_in_process(
+        self,
+        rounds: int,
+        seed: int | None,
+        record: bool,
+        output: str | os.PathLike | None,
+        output_format: str | None
+    ) -> SimulationResult:
+        if seed is not None:
+            self.game.reseed(seed)
+        if output is not None:
+            sink = open_sink(output, output_format)
+            self.game.recorder = OutcomeRecorder(round_offset=self.game.rounds_played, sink=sink)
+        elif record:
+            self.game.recorder = OutcomeRecorder(round_offset=self.game.rounds_played)
+        players = self.game.players
+        # Collect this run's tallies separately, then fold them into the players' totals
+        saved = [player.stats for player in players]
+        for player in players:
+            player.stats = PlayerStatistics()
+        try:
+            for _ in range(rounds):
+                self.game.play_round()
+                if self.verbose:
+                    print(f"Completed round {_ + 1}")
+        finally:
+            run_stats = {player.name: player.stats for player in players}
+            for player, stats in zip(players, saved):
+                stats.merge(player.stats)
+                player.stats = stats
+            recorder, self.game.recorder = self.game.recorder, None
+        names = [player.name for player in players]
+        outcomes = None
+        if output is not None:
+            recorder.close()
+            write_manifest(output, sink.format, names, [0])
+            outcomes = OutcomeReader(output)
+        elif record:
+            outcomes = OutcomeTable(recorder.columns(), names)
+        return SimulationResult(rounds, run_stats, seed, outcomes=outcomes)
+
+    def _run_parallel(
+        self,
+        rounds: int,
+        workers: int,
+        seed: int | None,
+        record: bool,
+        output: str | os.PathLike | None,
+        output_format: str | None,
+        profile: bool = False
+    ) -> SimulationResult:
+        config = GameConfig.from_game(self.game)
+        entropy, streams = worker_streams(seed, workers)
+        shards = shard_rounds(rounds, workers)
+        if output is not None:
+            # Resolve the format once so every shard writes the same one
+            output_format = output_format or default_format()
+
+        result = SimulationResult(seed=entropy, workers=workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, which keeps the merge deterministic
+            for shard in executor.map(
+                run_shard, [config] * workers, shards, streams, [record] * workers,
+                [output] * workers, [output_format] * workers, range(workers), [profile] * workers
+            ):
+                result.merge(shard)
+        if output is not None:
+            offsets = [sum(shards[:part]) for part in range(workers)]
+            write_manifest(output, output_format, list(result.players), offsets)
+            result.outcomes = OutcomeReader(output)
+
+        for player in self.game.players:
+            stats = result.players[player.name]
+            player.bankroll += stats.net
+            player.stats.merge(stats)
+        return result
+
+    def run_until(
+        self,
+        target_se: float | None = None,
+        player: str | None = None,
+        time_budget: float | None = None,
+        max_rounds: int | None = None,
+        seed: int | None = None,
+        min_shoes: int = 20,
+        initial_rounds: int = 1000
+    ) -> SimulationResult:
+        """
+        Run the simulation in-process until a stop criterion is met.
+
+        Rounds are grouped by shoe, and each shoe's net result and hand count per
+        player is one batch of a BatchMeans estimate, so the standard error of the EV
+        per hand accounts for the correlation between rounds dealt from the same shoe.
+        The criteria are checked between batches of rounds sized by plan_batch; a
+        shoe is never cut short except by max_rounds.
+
+        Args:
+            target_se (float | None, optional): Stop once the standard error of the
+                EV per hand of the chosen player is at most this. Defaults to None.
+            player (str | None, optional): Player the target applies to. Defaults to
+                the first player.
+            time_budget (float | None, optional): Stop once this many seconds have
+                elapsed. Defaults to None.
+            max_rounds (int | None, optional): Never play more rounds than this. Defaults to None.
+            seed (int | None, optional): Restarts the game's randomness with Game.reseed.
+                Defaults to None.
+            min_shoes (int, optional): Shoes to play before the precision target can
+                stop the run. Defaults to 20.
+            initial_rounds (int, optional): Rounds before the first check. Defaults to 1000.
+
+        Returns:
+            SimulationResult: Per-player tallies, with the estimates and stop_reason set.
+
+        Raises:
+            ValueError: If no stop criterion is given, or the player is unknown.
+        """
+        if target_se is None and time_budget is None and max_rounds is None:
+            raise ValueError("Give at least one of target_se, time_budget or max_rounds.")
+        game = self.game
+        players = game.players
+        names = [p.name for p in players]
+        target = player if player is not None else names[0]
+        if target not in names:
+            raise ValueError(f"Unknown player '{target}'.")
+        if seed is not None:
+            game.reseed(seed)
+
+        limit = max_rounds if max_rounds is not None else math.inf
+        estimates = {name: BatchMeans() for name in names}
+        rounds, checkpoint = 0, min(initial_rounds, limit)
+        stop_reason = None
+        start = time.perf_counter()
+        saved = [p.stats for p in players]
+        for p in players:
+            p.stats = PlayerStatistics()
+        try:
+            while stop_reason is None:
+                while rounds < checkpoint:
+                    # Play out the current shoe as one batch
+                    shoe = game.shoe.shoe_index
+                    nets = [p.stats.net for p in players]
+                    hands = [p.stats.hands for p in players]
+                    while game.shoe.shoe_index == shoe and rounds < limit:
+                        game.play_round()
+                        rounds += 1
+                    for p, net, hand_count in zip(players, nets, hands):
+                        estimates[p.name].update(p.stats.net - net, p.stats.hands - hand_count)
 
-        print(f"Simulation completed")
\ No newline at end of file
+                elapsed = time.perf_counter() - start
+                estimate = estimates[target]
+                if (target_se is not None and estimate.batches >= min_shoes
+                        and estimate.standard_error <= target_se):
+                    stop_reason = "precision"
+                elif time_budget is not None and elapsed >= time_budget:
+                    stop_reason = "time"
+                elif rounds >= limit:
+                    stop_reason = "max_rounds"
+                else:
+                    time_left = time_budget - elapsed if time_budget is not None else None
+                    batch = plan_batch(rounds, elapsed, estimate.standard_error, target_se, time_left)
+                    checkpoint = min(rounds + batch, limit)
+                    if self.verbose:
+                        print(f"{rounds} rounds, {target} EV/hand {estimate.mean:.5f} "
+                              f"± {estimate.standard_error:.5f}")
+        finally:
+            run_stats = {p.name: p.stats for p in players}
+            for p, stats in zip(players, saved):
+                stats.merge(p.stats)
+                p.stats = stats
+        return SimulationResult(rounds, run_stats, seed, estimates=estimates, stop_reason=stop_reason)
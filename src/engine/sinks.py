@@ -0,0 +1,334 @@
+from abc import ABC, abstractmethod
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .moments import RunningMoments
+from .recorder import COLUMNS, OutcomeTable
+
+# Chunk file formats, see open_sink()
+FORMATS: tuple[str, ...] = ("npz", "npy", "parquet")
+MANIFEST_NAME: str = "manifest.json"
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_format() -> str:
+    """Parquet when pyarrow is installed, compressed .npz otherwise."""
+    return "parquet" if _has_pyarrow() else "npz"
+
+
+class ResultSink(ABC):
+    """
+    Destination of the chunks of per-hand outcome columns produced by an OutcomeRecorder.
+    """
+    @abstractmethod
+    def write(self, columns: dict[str, np.ndarray]) -> None:
+        """
+        Consume one chunk of rows.
+
+        Args:
+            columns (dict[str, np.ndarray]): Column name -> array, all of the same length.
+        """
+
+    def close(self) -> None:
+        """Finish writing; the sink receives no more chunks."""
+
+
+class MemorySink(ResultSink):
+    """
+    Keeps every chunk in memory, in columns that grow geometrically.
+    """
+    def __init__(self) -> None:
+        self._columns: dict[str, np.ndarray] = {
+            name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        self._size: int = 0
+
+    def write(self, columns: dict[str, np.ndarray]) -> None:
+        size, count = self._size, len(columns["round"])
+        capacity = len(self._columns["round"])
+        if size + count > capacity:
+            capacity = max(size + count, 2 * capacity)
+            for name, column in self._columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:size] = column[:size]
+                self._columns[name] = grown
+        for name, values in columns.items():
+            self._columns[name][size:size + count] = values
+        self._size = size + count
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Return the columns written so far, trimmed to the number of rows.
+
+        Returns:
+            dict[str, np.ndarray]: Column name -> array.
+        """
+        return {name: column[:self._size] for name, column in self._columns.items()}
+
+
+class ChunkSink(ResultSink):
+    """
+    Writes each chunk to its own file in a directory, so memory use is bounded by
+    the chunk size whatever the length of the run.
+
+    Files are named part-<part>-<chunk>.<suffix>; the part number tells apart the
+    shards of a parallel run writing to the same directory. Stale files of the same
+    part left by an earlier run are removed when the sink is created.
+
+    Attributes:
+        directory (Path): Output directory.
+        part (int): Part number of this sink.
+        chunks (int): Number of chunk files written.
+    """
+    format: str = ""
+    suffix: str = ""
+
+    def __init__(self, directory: str | os.PathLike, part: int = 0) -> None:
+        """
+        Initialize a new ChunkSink.
+
+        Args:
+            directory (str | PathLike): Output directory, created if needed.
+            part (int, optional): Part number. Defaults to 0.
+        """
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.part: int = part
+        self.chunks: int = 0
+        for stale in self.directory.glob(f"part-{part:03d}-*.{self.suffix}"):
+            stale.unlink()
+
+    def write(self, columns: dict[str, np.ndarray]) -> None:
+        path = self.directory / f"part-{self.part:03d}-{self.chunks:05d}.{self.suffix}"
+        self._write_chunk(path, columns)
+        self.chunks += 1
+
+    @abstractmethod
+    def _write_chunk(self, path: Path, columns: dict[str, np.ndarray]) -> None:
+        """Write one chunk to path."""
+
+
+class NpzChunkSink(ChunkSink):
+    """Writes every chunk as a compressed .npz archive, one member per column."""
+    format = "npz"
+    suffix = "npz"
+
+    def _write_chunk(self, path: Path, columns: dict[str, np.ndarray]) -> None:
+        np.savez_compressed(path, **columns)
+
+
+class NpyChunkSink(ChunkSink):
+    """
+    Writes every chunk uncompressed as a .npy record array, which readers can
+    memory-map instead of loading.
+    """
+    format = "npy"
+    suffix = "npy"
+
+    DTYPE = np.dtype([(name, dtype) for name, dtype in COLUMNS.items()])
+
+    def _write_chunk(self, path: Path, columns: dict[str, np.ndarray]) -> None:
+        records = np.empty(len(columns["round"]), dtype=self.DTYPE)
+        for name, values in columns.items():
+            records[name] = values
+        np.save(path, records)
+
+
+class ParquetChunkSink(ChunkSink):
+    """Writes every chunk as a compressed Parquet file. Requires pyarrow."""
+    format = "parquet"
+    suffix = "parquet"
+
+    def __init__(self, directory: str | os.PathLike, part: int = 0) -> None:
+        if not _has_pyarrow():
+            raise ImportError("ParquetChunkSink requires pyarrow.")
+        super().__init__(directory, part)
+
+    def _write_chunk(self, path: Path, columns: dict[str, np.ndarray]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.table(columns), path, compression="zstd")
+
+
+SINKS: dict[str, type[ChunkSink]] = {
+    sink.format: sink for sink in (NpzChunkSink, NpyChunkSink, ParquetChunkSink)
+}
+
+
+def open_sink(directory: str | os.PathLike, format: str | None = None, part: int = 0) -> ChunkSink:
+    """
+    Create the chunk sink for a format.
+
+    Args:
+        directory (str | PathLike): Output directory.
+        format (str | None, optional): One of FORMATS; None picks default_format().
+        part (int, optional): Part number of the sink. Defaults to 0.
+
+    Returns:
+        ChunkSink: The new sink.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    format = format or default_format()
+    if format not in SINKS:
+        raise ValueError(f"Unknown output format '{format}', expected one of {FORMATS}.")
+    return SINKS[format](directory, part)
+
+
+def write_manifest(
+    directory: str | os.PathLike,
+    format: str,
+    players: list[str],
+    round_offsets: list[int]
+) -> None:
+    """
+    Describe the chunks of a run so OutcomeReader can find them.
+
+    Args:
+        directory (str | PathLike): Output directory of the run.
+        format (str): Format of the chunk files.
+        players (list[str]): Player names, indexed by the "player" column.
+        round_offsets (list[int]): Number added to the rounds of each part.
+    """
+    manifest = {"format": format, "players": players, "round_offsets": round_offsets}
+    path = Path(directory) / MANIFEST_NAME
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(manifest, indent=2))
+    os.replace(temporary, path)
+
+
+class OutcomeReader:
+    """
+    Streams back the per-hand outcomes of a run written by chunk sinks.
+
+    Chunks are read one at a time (memory-mapped for the npy and Parquet formats),
+    so statistics over runs far larger than memory only ever hold one chunk.
+
+    Attributes:
+        directory (Path): Output directory of the run.
+        format (str): Format of the chunk files.
+        players (list[str]): Player names, indexed by the "player" column.
+        round_offsets (list[int]): Number added to the rounds of each part.
+    """
+    def __init__(self, directory: str | os.PathLike) -> None:
+        """
+        Initialize a new OutcomeReader.
+
+        Args:
+            directory (str | PathLike): Output directory of the run, holding manifest.json.
+        """
+        self.directory: Path = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST_NAME).read_text())
+        self.format: str = manifest["format"]
+        self.players: list[str] = manifest["players"]
+        self.round_offsets: list[int] = manifest["round_offsets"]
+
+    def _paths(self, part: int) -> list[Path]:
+        # By chunk number, not name: past the padding width the names no longer sort
+        paths = self.directory.glob(f"part-{part:03d}-*.{SINKS[self.format].suffix}")
+        return sorted(paths, key=lambda path: int(path.stem.rsplit("-", 1)[1]))
+
+    def _load(self, path: Path, names: list[str]) -> dict[str, np.ndarray]:
+        if self.format == "npz":
+            with np.load(path) as archive:
+                return {name: archive[name] for name in names}
+        if self.format == "npy":
+            records = np.load(path, mmap_mode="r")
+            return {name: records[name] for name in names}
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=names, memory_map=True)
+        return {name: table.column(name).to_numpy() for name in names}
+
+    def chunks(self, columns: list[str] | None = None):
+        """
+        Iterate over the chunks of the run, in round order.
+
+        Args:
+            columns (list[str] | None, optional): Columns to read. Defaults to all.
+
+        Yields:
+            dict[str, np.ndarray]: One chunk of columns, rounds counted from the start of the run.
+        """
+        names = list(columns) if columns is not None else list(COLUMNS)
+        load = names if "round" in names else names + ["round"]
+        for part, offset in enumerate(self.round_offsets):
+            for path in self._paths(part):
+                chunk = self._load(path, load)
+                if offset:
+                    chunk["round"] = chunk["round"] + offset
+                yield {name: chunk[name] for name in names}
+
+    def __len__(self) -> int:
+        return sum(len(chunk["player"]) for chunk in self.chunks(["player"]))
+
+    def table(self) -> OutcomeTable:
+        """
+        Load the whole run into memory.
+
+        Returns:
+            OutcomeTable: All the rows of the run.
+        """
+        chunks = list(self.chunks())
+        if not chunks:
+            columns = {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+        else:
+            columns = {name: np.concatenate([chunk[name] for chunk in chunks]) for name in COLUMNS}
+        return OutcomeTable(columns, self.players)
+
+    def moments(self, player: str | int | None = None, per: str = "hand") -> RunningMoments:
+        """
+        Stream the net results of the run into running moments.
+
+        Per round, the hands of a player in the same round are summed; a round split
+        across two chunks is held back until the next chunk is read.
+
+        Args:
+            player (str | int | None, optional): Player name or index; None for every player.
+            per (str, optional): "hand" or "round". Defaults to "hand".
+
+        Returns:
+            RunningMoments: Count, mean and variance of the net results.
+
+        Raises:
+            ValueError: If per is not "hand" or "round".
+        """
+        if per not in ("hand", "round"):
+            raise ValueError(f"per must be 'hand' or 'round', got {per!r}.")
+        index = self.players.index(player) if isinstance(player, str) else player
+        moments = RunningMoments()
+        num_players = len(self.players)
+        carry_keys, carry_net = np.empty(0, dtype=np.int64), np.empty(0)
+        for chunk in self.chunks(["round", "player", "net"]):
+            if index is not None:
+                mask = chunk["player"] == index
+                chunk = {name: column[mask] for name, column in chunk.items()}
+            if per == "hand":
+                moments.update(chunk["net"])
+                continue
+            if not len(chunk["round"]):
+                continue
+            keys = np.concatenate([carry_keys, chunk["round"] * num_players + chunk["player"]])
+            net = np.concatenate([carry_net, chunk["net"]])
+            # Rows of the last round may continue in the next chunk
+            complete = keys < chunk["round"][-1] * num_players
+            _, inverse = np.unique(keys[complete], return_inverse=True)
+            moments.update(np.bincount(inverse, weights=net[complete]))
+            carry_keys, carry_net = keys[~complete], net[~complete]
+        if len(carry_keys):
+            _, inverse = np.unique(carry_keys, return_inverse=True)
+            moments.update(np.bincount(inverse, weights=carry_net))
+        return moments
+
+    def __repr__(self) -> str:
+        return f"OutcomeReader(directory='{self.directory}', format='{self.format}')"
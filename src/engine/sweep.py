@@ -0,0 +1,349 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import csv
+from dataclasses import asdict, dataclass, fields, replace
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+from cards import CountingSystem, RandomStream, counting_system
+from game import GameConfig, PlayerConfig, PlayerStatistics, Rules
+from strategies import Strategy
+from .cache import strategy_fingerprint
+from .simulation import run_shard
+
+
+# Rounds of a cell played by one task; cells are split into tasks of this size so
+# that idle workers keep taking work until the whole grid is done
+DEFAULT_CHUNK_ROUNDS: int = 20_000
+
+
+def cell_key(
+    rules: Rules,
+    strategy: str,
+    fingerprint: str,
+    counting_systems: tuple[str | CountingSystem, ...] = ()
+) -> str:
+    """
+    Stable identifier of a sweep cell, independent of the grid it belongs to.
+
+    Args:
+        rules (Rules): Rules of the cell.
+        strategy (str): Label of the strategy.
+        fingerprint (str): Fingerprint of the strategy (see engine.cache.strategy_fingerprint),
+            so that a label reused for another strategy names another cell.
+        counting_systems (tuple[str | CountingSystem, ...], optional): Systems tracked
+            by the shoes. Defaults to ().
+
+    Returns:
+        str: The key.
+    """
+    return json.dumps({"rules": asdict(rules), "strategy": strategy, "fingerprint": fingerprint,
+                       "counting_systems": _systems_spec(counting_systems)}, sort_keys=True)
+
+
+def _systems_spec(counting_systems: tuple[str | CountingSystem, ...]) -> list[list]:
+    """Names and weights of counting systems, as stored with a cell."""
+    return [[system.name, list(system.weights)] for system in map(counting_system, counting_systems)]
+
+
+def _cell_stream(root: RandomStream, key: str) -> RandomStream:
+    """The random stream of a cell, derived from its key rather than its position in the grid."""
+    digest = hashlib.sha256(key.encode()).digest()
+    return root.child(int.from_bytes(digest[:8], "little"))
+
+
+@dataclass(frozen=True)
+class SweepCell:
+    """
+    The result of one strategy under one set of rules.
+
+    Attributes:
+        rules (Rules): Rules of the cell.
+        strategy (str): Label of the strategy.
+        stats (PlayerStatistics): Tallies of the rounds played.
+        cached (bool): Whether the cell was read from the store instead of played.
+    """
+    rules: Rules
+    strategy: str
+    stats: PlayerStatistics
+    cached: bool = False
+
+    @property
+    def ev(self) -> float:
+        """EV per round, in money."""
+        return self.stats.ev_per_round
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of ev."""
+        return self.stats.standard_error
+
+
+class SweepResult:
+    """
+    The cells of a sweep, one row per cell in grid order.
+
+    Attributes:
+        parameters (tuple[str, ...]): Rules fields varied by the grid.
+        cells (list[SweepCell]): Cells in grid order, strategies varying fastest.
+        seed (int | None): Seed of the sweep.
+    """
+    def __init__(self, parameters: tuple[str, ...], cells: list[SweepCell], seed: int | None = None) -> None:
+        self.parameters = parameters
+        self.cells = cells
+        self.seed = seed
+
+    def rows(self) -> list[dict[str, Any]]:
+        """
+        The sweep as a tidy table: one dict per cell with the varied parameters, the
+        strategy, the rounds and hands played, and the EV with its standard error.
+
+        Returns:
+            list[dict[str, Any]]: The rows.
+        """
+        return [
+            {**{name: getattr(cell.rules, name) for name in self.parameters},
+             "strategy": cell.strategy, "rounds": cell.stats.rounds, "hands": cell.stats.hands,
+             "ev": cell.ev, "standard_error": cell.standard_error}
+            for cell in self.cells
+        ]
+
+    def write_csv(self, path: str | os.PathLike) -> None:
+        """
+        Write the rows to a CSV file.
+
+        Args:
+            path (str | PathLike): Destination file.
+        """
+        rows = self.rows()
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=[*self.parameters, "strategy", "rounds", "hands",
+                                                      "ev", "standard_error"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def summary(self) -> str:
+        """
+        Format one line per cell with EV ± SE.
+
+        Returns:
+            str: The table.
+        """
+        widths = [max(len(name), 6) + 2 for name in self.parameters]
+        header = "".join(f"{name:<{width}}" for name, width in zip(self.parameters, widths))
+        lines = [f"{header}{'strategy':<20}{'rounds':>10}{'ev/round':>12}{'± se':>10}"]
+        for row in self.rows():
+            values = "".join(f"{str(row[name]):<{width}}" for name, width in zip(self.parameters, widths))
+            lines.append(f"{values}{row['strategy']:<20}{row['rounds']:>10}"
+                         f"{row['ev']:>12.5f}{row['standard_error']:>10.5f}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"SweepResult(parameters={self.parameters}, cells={len(self.cells)})"
+
+
+class Sweep:
+    """
+    Prices every combination of a grid of rules against a list of strategies.
+
+    Every cell (one set of rules and one strategy) is a single player playing
+    rounds rounds, split into tasks of chunk_rounds rounds. The tasks of all cells
+    go to one worker pool, and a worker takes the next task as soon as it is free,
+    so cells of very different cost (one deck against eight, say) keep every worker
+    busy to the end.
+
+    The stream of every task derives from the seed, the cell's key (its rules,
+    strategy label and fingerprint, and counting systems) and the task's number,
+    never from the grid or the worker count, so a cell's result is the same
+    whichever grid it is part of and however it is scheduled. With a store, finished cells are appended to a JSON-lines file as
+    they complete, and a later run (with a larger grid, or after an interruption)
+    reads them back instead of playing them again.
+
+    Attributes:
+        grid (dict[str, tuple]): Values of each Rules field to vary.
+        strategies (dict[str, str | Strategy]): Strategies by label.
+        rounds (int): Rounds per cell.
+        rules (Rules): Rules the grid varies from.
+        bet_amount (float): Wager per round.
+        seed (int | None): Root seed.
+        chunk_rounds (int): Rounds per task.
+        counting_systems (tuple[str | CountingSystem, ...]): Systems tracked by the shoes.
+    """
+    def __init__(
+        self,
+        grid: dict[str, Sequence],
+        strategies: Sequence[str | Strategy] | dict[str, str | Strategy],
+        rounds: int,
+        rules: Rules = Rules(),
+        bet_amount: float = 1.0,
+        seed: int | None = None,
+        chunk_rounds: int = DEFAULT_CHUNK_ROUNDS,
+        counting_systems: tuple[str | CountingSystem, ...] = ()
+    ) -> None:
+        """
+        Initialize a new Sweep.
+
+        Args:
+            grid (dict[str, Sequence]): Values of each Rules field to vary, e.g.
+                {"num_decks": [1, 2, 6, 8], "blackjack_multiplier": [1.5, 1.2]}.
+            strategies (Sequence[str | Strategy] | dict[str, str | Strategy]): Strategies,
+                as class names of the strategies package or instances (labelled by their
+                class name), or by label.
+            rounds (int): Rounds per cell.
+            rules (Rules, optional): Rules the grid varies from. Defaults to Rules().
+            bet_amount (float, optional): Wager per round. Defaults to 1.0.
+            seed (int | None, optional): Root seed. Defaults to None (fresh entropy).
+            chunk_rounds (int, optional): Rounds per task. Defaults to DEFAULT_CHUNK_ROUNDS.
+            counting_systems (tuple[str | CountingSystem, ...], optional): Systems tracked
+                by the shoes. Defaults to ().
+
+        Raises:
+            ValueError: If a grid key is not a Rules field, a label is repeated, or
+                rounds or chunk_rounds is below 1.
+        """
+        names = {rule.name for rule in fields(Rules)}
+        unknown = set(grid) - names
+        if unknown:
+            raise ValueError(f"Unknown rules {sorted(unknown)}, expected some of {sorted(names)}.")
+        if rounds < 1 or chunk_rounds < 1:
+            raise ValueError("rounds and chunk_rounds must be at least 1.")
+        if not isinstance(strategies, dict):
+            labelled = {}
+            for strategy in strategies:
+                label = strategy if isinstance(strategy, str) else type(strategy).__name__
+                if label in labelled:
+                    raise ValueError(f"Strategy label '{label}' is used twice; pass a dict of labels.")
+                labelled[label] = strategy
+            strategies = labelled
+        self.grid: dict[str, tuple] = {name: tuple(values) for name, values in grid.items()}
+        self.strategies: dict[str, str | Strategy] = dict(strategies)
+        self.rounds = rounds
+        self.rules = rules
+        self.bet_amount = bet_amount
+        self.seed = seed
+        self.chunk_rounds = chunk_rounds
+        self.counting_systems = counting_systems
+
+    @property
+    def cells(self) -> list[tuple[Rules, str]]:
+        """Rules and strategy label of every cell, in grid order with strategies varying fastest."""
+        names = list(self.grid)
+        return [(replace(self.rules, **dict(zip(names, values))), label)
+                for values in itertools.product(*self.grid.values())
+                for label in self.strategies]
+
+    def fingerprints(self) -> dict[str, str]:
+        """
+        Fingerprint of every strategy, built as the cells' games build it.
+
+        Returns:
+            dict[str, str]: Label -> strategy_fingerprint.
+        """
+        return {label: strategy_fingerprint(PlayerConfig(label, strategy=strategy).build_strategy())
+                for label, strategy in self.strategies.items()}
+
+    def _settings(self) -> dict[str, Any]:
+        """Settings of the sweep that a stored cell must have been played with."""
+        return {"seed": self.seed, "rounds": self.rounds, "bet_amount": self.bet_amount,
+                "chunk_rounds": self.chunk_rounds, "counting_systems": _systems_spec(self.counting_systems)}
+
+    def _record(self, key: str, rules: Rules, label: str, fingerprint: str, stats: PlayerStatistics) -> dict:
+        """The stored line of a finished cell."""
+        return {"key": key, "rules": asdict(rules), "strategy": label, "fingerprint": fingerprint,
+                **self._settings(), "stats": stats.as_dict()}
+
+    def _finished(self, store: Path | None) -> dict[str, PlayerStatistics]:
+        """Cells of the store played with this sweep's settings, by key."""
+        finished = {}
+        if store is None or not store.exists():
+            return finished
+        settings = self._settings()
+        with open(store) as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if all(record.get(name) == value for name, value in settings.items()):
+                    finished[record["key"]] = PlayerStatistics.from_dict(record["stats"])
+        return finished
+
+    def run(self, workers: int = 1, store: str | os.PathLike | None = None) -> SweepResult:
+        """
+        Play every cell not already in the store.
+
+        Args:
+            workers (int, optional): Worker processes. Defaults to 1 (in-process).
+            store (str | PathLike | None, optional): JSON-lines file of finished cells,
+                read to skip them and appended to as cells finish. Defaults to None.
+
+        Returns:
+            SweepResult: Every cell of the grid, in grid order.
+
+        Raises:
+            ValueError: If workers is below 1.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        store = Path(store) if store is not None else None
+        finished = self._finished(store)
+        root = RandomStream(self.seed)
+        chunks = [self.chunk_rounds] * (self.rounds // self.chunk_rounds)
+        if self.rounds % self.chunk_rounds:
+            chunks.append(self.rounds % self.chunk_rounds)
+
+        # Tasks of the cells left to play: (cell index, chunk index, config, rounds, stream)
+        cells = self.cells
+        fingerprints = self.fingerprints()
+        keys = [cell_key(rules, label, fingerprints[label], self.counting_systems) for rules, label in cells]
+        tasks = []
+        for index, (rules, label) in enumerate(cells):
+            key = keys[index]
+            if key in finished:
+                continue
+            config = GameConfig(players=(PlayerConfig(label, strategy=self.strategies[label]),), rules=rules,
+                                bet_amount=self.bet_amount, counting_systems=self.counting_systems)
+            stream = _cell_stream(root, key)
+            tasks += [(index, chunk, config, rounds, stream.child(chunk)) for chunk, rounds in enumerate(chunks)]
+
+        results: dict[int, list[PlayerStatistics | None]] = {}
+
+        def collect(index: int, chunk: int, stats: PlayerStatistics) -> None:
+            parts = results.setdefault(index, [None] * len(chunks))
+            parts[chunk] = stats
+            if all(part is not None for part in parts):
+                # Merge in chunk order, so the total does not depend on the scheduling
+                total = PlayerStatistics()
+                for part in parts:
+                    total.merge(part)
+                rules, label = cells[index]
+                finished[keys[index]] = total
+                if store is not None:
+                    record = self._record(keys[index], rules, label, fingerprints[label], total)
+                    with open(store, "a") as file:
+                        file.write(json.dumps(record) + "\n")
+
+        fresh = {index for index, *_ in tasks}
+        if workers == 1:
+            for index, chunk, config, rounds, stream in tasks:
+                shard = run_shard(config, rounds, stream, False, None, None, 0)
+                collect(index, chunk, next(iter(shard.players.values())))
+        elif tasks:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = {executor.submit(run_shard, config, rounds, stream, False, None, None, 0): (index, chunk)
+                           for index, chunk, config, rounds, stream in tasks}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, chunk = pending.pop(future)
+                        collect(index, chunk, next(iter(future.result().players.values())))
+
+        swept = [SweepCell(rules, label, finished[keys[index]], cached=index not in fresh)
+                 for index, (rules, label) in enumerate(cells)]
+        return SweepResult(tuple(self.grid), swept, self.seed)
+
+    def __repr__(self) -> str:
+        return (f"Sweep(grid={self.grid}, strategies={list(self.strategies)}, rounds={self.rounds}, "
+                f"cells={len(self.cells)})")
@@ -1,6 +1,26 @@
-from .action import Action
-from .game import Game
-from .dealer import Dealer
-from .player import Player
+from lazy import lazy_exports
 
-__all__ = ["Action", "Game", "Dealer", "Player"]
\ No newline at end of file
+# Public names and the submodules defining them, imported on first access
+_EXPORTS: dict[str, str] = {
+    "Action": ".action",
+    "pack_action": ".action",
+    "unpack_actions": ".action",
+    "Rules": ".rules",
+    "Game": ".game",
+    "Dealer": ".dealer",
+    "Player": ".player",
+    "PlayerStatistics": ".statistics",
+    "GameConfig": ".config",
+    "PlayerConfig": ".config",
+    "EVENT_KINDS": ".events",
+    "GameEvent": ".events",
+    "EventSink": ".events",
+    "EventLogger": ".events",
+    "EventCounter": ".events",
+    "EventRecorder": ".events",
+    "PHASES": ".profiling",
+    "GameProfile": ".profiling",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
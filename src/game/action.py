@@ -8,4 +8,39 @@ class Action(Enum):
     STAND = auto()
     DOUBLE_DOWN = auto()
     SPLIT = auto()
-    #SURRENDER = auto()
\ No newline at end of file
+    #SURRENDER = auto()
+
+# Number of bits used per action when packing an action sequence into an int
+ACTION_BITS: int = 3
+
+
+def pack_action(actions: int, action: Action) -> int:
+    """
+    Append an action to a packed action sequence.
+
+    Args:
+        actions (int): The packed sequence so far (0 when empty).
+        action (Action): The action to append.
+
+    Returns:
+        int: The packed sequence including the new action.
+    """
+    return (actions << ACTION_BITS) | action.value
+
+
+def unpack_actions(actions: int) -> list[Action]:
+    """
+    Decode a packed action sequence.
+
+    Args:
+        actions (int): The packed sequence.
+
+    Returns:
+        list[Action]: The actions, in the order they were taken.
+    """
+    mask = (1 << ACTION_BITS) - 1
+    decoded = []
+    while actions:
+        decoded.append(Action(actions & mask))
+        actions >>= ACTION_BITS
+    return decoded[::-1]
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+import copy
+
+from cards import CountingSystem, RandomStream
+from strategies import Strategy
+from .game import Game
+from .player import Player
+from .rules import Rules
+
+@dataclass(frozen=True)
+class PlayerConfig:
+    """
+    Picklable description of a player seat.
+
+    Attributes:
+        name (str): The player's name.
+        bankroll (float): Starting bankroll.
+        strategy (Strategy | str): A strategy instance, or the name of a class exported
+            by the strategies package (e.g. "PerfectStrategy").
+    """
+    name: str
+    bankroll: float = 0.0
+    strategy: Strategy | str = "BasicStrategy"
+
+    def build_strategy(self) -> Strategy:
+        """Return a fresh strategy instance for this seat."""
+        if isinstance(self.strategy, str):
+            import strategies
+            try:
+                strategy_cls = getattr(strategies, self.strategy)
+            except AttributeError:
+                raise ValueError(f"Unknown strategy '{self.strategy}'.") from None
+            return strategy_cls()
+        return copy.deepcopy(self.strategy)
+
+    def build(self) -> Player:
+        """Return a new Player for this seat."""
+        return Player(name=self.name, bankroll=self.bankroll, strategy=self.build_strategy())
+
+
+@dataclass(frozen=True)
+class GameConfig:
+    """
+    Picklable description of a Game, used to rebuild independent copies of it
+    (for instance one per worker process).
+
+    Attributes:
+        players (tuple[PlayerConfig, ...]): Player seats, in table order.
+        rules (Rules): House rules.
+        shuffle_on_init (bool): Whether the shoe is shuffled.
+        bet_amount (float): Default wager per round.
+        counting_systems (tuple[str | CountingSystem, ...]): Counting systems tracked by the shoe.
+    """
+    players: tuple[PlayerConfig, ...] = ()
+    rules: Rules = field(default_factory=Rules)
+    shuffle_on_init: bool = True
+    bet_amount: float = 1.0
+    counting_systems: tuple[str | CountingSystem, ...] = ()
+
+    @classmethod
+    def from_game(cls, game: Game) -> 'GameConfig':
+        """
+        Describe an existing game, using the players' current bankrolls and strategies.
+
+        Args:
+            game (Game): The game to describe.
+
+        Returns:
+            GameConfig: A config that builds an equivalent game.
+        """
+        players = tuple(
+            PlayerConfig(name=player.name, bankroll=player.bankroll, strategy=player.strategy)
+            for player in game.players
+        )
+        return cls(
+            players=players,
+            rules=game.rules,
+            shuffle_on_init=game.shoe.shuffle_on_init,
+            bet_amount=game.bet_amount,
+            counting_systems=tuple(count.system for count in game.shoe.counts.values()),
+        )
+
+    def build(self, verbose: bool = False, rng: RandomStream | None = None) -> Game:
+        """
+        Build a new Game with fresh players, dealer and shoe.
+
+        Args:
+            verbose (bool): Whether the game prints its progress.
+            rng (RandomStream, optional): Random stream of the game. Defaults to an unseeded stream.
+
+        Returns:
+            Game: The new game.
+        """
+        rules = self.rules
+        return Game(
+            players=[player.build() for player in self.players],
+            dealer_hits_soft_17=rules.dealer_hits_soft_17,
+            num_decks=rules.num_decks,
+            shuffle_on_init=self.shuffle_on_init,
+            penetration_threshold=rules.penetration_threshold,
+            shoe_model=rules.shoe_model,
+            blackjack_multiplier=rules.blackjack_multiplier,
+            bet_amount=self.bet_amount,
+            verbose=verbose,
+            rng=rng,
+            counting_systems=self.counting_systems,
+        )
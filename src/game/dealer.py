@@ -20,19 +20,19 @@ class Dealer:
         Args:
             shoe (Shoe): The shoe to draw cards from.
         """
-        # Dealer must draw until reaching at least 17
-        total, kind = self.hand.value
-        while True:
-            total, kind = self.hand.value
-            # Stop if hard 17 or higher
-            if total >= 17 and (kind == "Hard" or not self.hit_soft_17):
-                break
-            # If soft 17 and house stands, break
-            if total == 17 and kind == "Soft" and not self.hit_soft_17:
-                break
-            # Otherwise, hit
+        while self.must_hit():
             self.hand.add_card(shoe.draw_card())
 
+    def must_hit(self) -> bool:
+        """
+        Whether the house rules make the dealer draw on the current hand (the rule
+        Dealer.play applies).
+        """
+        # Dealer must draw until reaching at least 17; with hit_soft_17 the dealer
+        # also draws on soft 17
+        hand = self.hand
+        return hand.total < 17 or (self.hit_soft_17 and hand.is_soft and hand.total == 17)
+
     def reset_hand(self) -> None:
         """
         Clear the dealer's hand for the next round.
@@ -0,0 +1,128 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from typing import Callable
+
+# Kinds of events a Game emits, in the order they occur within a round
+EVENT_KINDS: tuple[str, ...] = ("deal", "decision", "split", "double", "dealer_draw", "settle")
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """
+    Something that happened during a round, as plain data.
+
+    Attributes:
+        kind (str): One of EVENT_KINDS.
+        round (int): Number of the round (Game.rounds_played when it started).
+        data (dict): Details of the event, JSON-serializable; see Game for the keys of each kind.
+    """
+    kind: str
+    round: int
+    data: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """
+        Flatten the event into one dictionary.
+
+        Returns:
+            dict: {"kind": ..., "round": ..., **data}.
+        """
+        return {"kind": self.kind, "round": self.round, **self.data}
+
+    def __str__(self) -> str:
+        details = " ".join(f"{key}={value}" for key, value in self.data.items())
+        return f"[round {self.round}] {self.kind} {details}"
+
+
+class EventSink(ABC):
+    """
+    Subscriber to the events of a Game, see Game.subscribe.
+    """
+    @abstractmethod
+    def handle(self, event: GameEvent) -> None:
+        """
+        Consume one event.
+
+        Args:
+            event (GameEvent): The event.
+        """
+
+
+class EventLogger(EventSink):
+    """
+    Writes every event as one line of text, to a logger or any callable (print, say).
+
+    Attributes:
+        log (Callable[[str], None]): Receives the line of each event.
+    """
+    def __init__(self, log: Callable[[str], None] | None = None) -> None:
+        """
+        Initialize a new EventLogger.
+
+        Args:
+            log (Callable[[str], None] | None, optional): Line consumer. Defaults to the
+                debug method of the "blackjack" logger.
+        """
+        self.log: Callable[[str], None] = log if log is not None else logging.getLogger("blackjack").debug
+
+    def handle(self, event: GameEvent) -> None:
+        self.log(str(event))
+
+
+class EventCounter(EventSink):
+    """
+    Tallies the events by kind, and the decisions by action.
+
+    Attributes:
+        counts (Counter): Event kind -> number of events.
+        actions (Counter): Action name -> number of decisions.
+    """
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self.actions: Counter = Counter()
+
+    def handle(self, event: GameEvent) -> None:
+        self.counts[event.kind] += 1
+        if event.kind == "decision":
+            self.actions[event.data["action"]] += 1
+
+
+class EventRecorder(EventSink):
+    """
+    Keeps every event, for traces that can be inspected or written as JSON lines.
+
+    Attributes:
+        events (list[GameEvent]): Events in the order they were emitted.
+    """
+    def __init__(self) -> None:
+        self.events: list[GameEvent] = []
+
+    def handle(self, event: GameEvent) -> None:
+        self.events.append(event)
+
+    def of_kind(self, kind: str) -> list[GameEvent]:
+        """
+        Return the recorded events of one kind.
+
+        Args:
+            kind (str): One of EVENT_KINDS.
+
+        Returns:
+            list[GameEvent]: The matching events, in order.
+        """
+        return [event for event in self.events if event.kind == kind]
+
+    def write_jsonl(self, path: str | os.PathLike) -> None:
+        """
+        Write the events to a file, one JSON object per line (see GameEvent.to_dict).
+
+        Args:
+            path (str | PathLike): Output file.
+        """
+        with open(path, "w") as file:
+            for event in self.events:
+                file.write(json.dumps(event.to_dict()) + "\n")
@@ -1,12 +1,36 @@
-from cards import Card, Shoe, Hand
-from .action import Action
+from time import perf_counter_ns
+
+from cards import Card, CountingSystem, Hand, RandomStream, shoe_model as shoe_class
+from .action import Action, pack_action
 from .dealer import Dealer
+from .events import EventLogger, EventSink, GameEvent
+from .rules import Rules
 from .player import Player
+from .profiling import GameProfile, TimedDecision
 
 class Game:
     """
     Orchestrates the flow of a blackjack game, handling dealing, player decisions,
     dealer play, and bet resolution.
+
+    All randomness comes from one RandomStream: the shoe draws from rng.child(0) and
+    the strategy of the i-th player from rng.child(i + 1).
+
+    Observers subscribe EventSinks (see game.events) to receive a structured event
+    for every card dealt, decision, split, double, dealer draw and settled hand. The
+    path a round takes is chosen when the subscribers change: with none, rounds run
+    code that holds no instrumentation at all. verbose=True subscribes an EventLogger
+    printing every event.
+
+    enable_profiling() switches rounds to a path that also times each phase and
+    every strategy decision into a GameProfile (see game.profiling).
+
+    Card counts of the counting_systems are kept by the shoe (see Shoe.track) next to
+    any count the strategies ask for, and read from game.shoe.counts.
+
+    shoe_model picks how cards are dealt (see cards.shoe_models): a shuffled shoe, a
+    continuous shuffling machine or an infinite deck. The shoe is told when each
+    round is settled, which is when a machine takes the round's cards back.
     """
     def __init__(
         self,
@@ -17,18 +41,130 @@ class Game:
         penetration_threshold: float = 0.75,
         blackjack_multiplier: float = 1.5,
         bet_amount: float = 1.0,
-        verbose: bool = True
+        verbose: bool = True,
+        seed: int | None = None,
+        rng: RandomStream | None = None,
+        counting_systems: tuple[str | CountingSystem, ...] = (),
+        shoe_model: str = "shoe"
     ) -> None:
         self.players = players
         self.dealer = Dealer(hit_soft_17=dealer_hits_soft_17)
-        self.shoe = Shoe(
+        self.rng = rng if rng is not None else RandomStream(seed)
+        self.shoe = shoe_class(shoe_model)(
             num_decks=num_decks,
             shuffle_on_init=shuffle_on_init,
-            penetration_threshold=penetration_threshold
+            penetration_threshold=penetration_threshold,
+            rng=self.rng.child(0)
         )
+        for system in counting_systems:
+            self.shoe.track(system)
+        self._bind_strategies()
         self.blackjack_multiplier = blackjack_multiplier
         self.bet_amount = bet_amount
         self.verbose = verbose
+        self.rounds_played = 0
+        # Optional per-hand outcome recorder, see engine.recorder.OutcomeRecorder
+        self.recorder = None
+        # Event subscribers; without any, rounds take the uninstrumented path
+        self.sinks: list[EventSink] = []
+        if verbose:
+            self.sinks.append(EventLogger(print))
+        # Timings of the rounds, while profiling is enabled
+        self.profile: GameProfile | None = None
+        self._select_path()
+
+    def _bind_strategies(self) -> None:
+        for i, player in enumerate(self.players):
+            player.strategy.bind_rng(self.rng.child(i + 1))
+            player.strategy.bind_shoe(self.shoe)
+
+    def reseed(self, seed: int | RandomStream | None) -> None:
+        """
+        Restart the game's randomness from a seed: the shoe is dealt again from its
+        first shoe and every strategy gets a fresh child stream.
+
+        Args:
+            seed (int | RandomStream | None): New root seed or stream.
+        """
+        self.rng = seed if isinstance(seed, RandomStream) else RandomStream(seed)
+        self.shoe.rng = self.rng.child(0)
+        self.shoe.jump_to(0, shuffle=self.shoe.shuffle_on_init)
+        self._bind_strategies()
+
+    @property
+    def rules(self) -> Rules:
+        """The house rules this game is played under."""
+        return Rules(
+            num_decks=self.shoe.num_decks,
+            dealer_hits_soft_17=self.dealer.hit_soft_17,
+            blackjack_multiplier=self.blackjack_multiplier,
+            penetration_threshold=self.shoe.penetration_threshold,
+            shoe_model=self.shoe.model
+        )
+
+    def subscribe(self, sink: EventSink) -> None:
+        """
+        Send the game's events to a sink. Rounds are played on the instrumented path
+        from the next one on.
+
+        Args:
+            sink (EventSink): The subscriber.
+        """
+        self.sinks.append(sink)
+        self._select_path()
+
+    def unsubscribe(self, sink: EventSink) -> None:
+        """
+        Stop sending events to a sink; without subscribers, rounds go back to the
+        uninstrumented path.
+
+        Args:
+            sink (EventSink): A subscribed sink.
+        """
+        self.sinks.remove(sink)
+        self._select_path()
+
+    def enable_profiling(self, profile: GameProfile | None = None) -> GameProfile:
+        """
+        Time the phases of every round and the strategies' decisions from the next
+        round on, and count reshuffles, splits and doubles.
+
+        Args:
+            profile (GameProfile | None, optional): Profile to add to. Defaults to a new one.
+
+        Returns:
+            GameProfile: The profile being filled.
+        """
+        self.disable_profiling()
+        self.profile = profile if profile is not None else GameProfile()
+        for player in self.players:
+            player.decide = TimedDecision(player, self.profile)
+        self._select_path()
+        return self.profile
+
+    def disable_profiling(self) -> GameProfile | None:
+        """
+        Go back to unprofiled rounds.
+
+        Returns:
+            GameProfile | None: The profile collected, if profiling was enabled.
+        """
+        profile, self.profile = self.profile, None
+        for player in self.players:
+            player.__dict__.pop("decide", None)
+        self._select_path()
+        return profile
+
+    def _select_path(self) -> None:
+        if self.profile is not None:
+            self._play_round = self._play_round_profiled
+        else:
+            self._play_round = self._play_round_traced if self.sinks else self._play_round_fast
+
+    def _emit(self, kind: str, **data) -> None:
+        event = GameEvent(kind, self.rounds_played, data)
+        for sink in self.sinks:
+            sink.handle(event)
 
     def play_round(self, bet_amount: float = None) -> None:
         """
@@ -37,164 +173,265 @@ class Game:
         Args:
             bet_amount (float): Amount each player bets; if None, uses default self.bet_amount.
         """
+        self._play_round(bet_amount)
+
+    def _play_round_fast(self, bet_amount: float = None) -> None:
         if bet_amount is None:
-            if self.verbose:
-                print(f"Beginning of round with default bet amount: {self.bet_amount}")
             bet_amount = self.bet_amount
-
         self._reset_and_place_bets(bet_amount)
         self.dealer.reset_hand()
         self._deal_initial_cards()
-
         dealer_upcard = self.dealer.upcard()
-        if self.verbose:
-            print(f"Dealer's upcard: {dealer_upcard}")
-
         self._handle_player_turns(dealer_upcard)
         self._handle_dealer_turn()
-        if self.verbose:
-            print(f"Dealer's hand: {self.dealer.hand}")
-        self._settle_bets()
+        self._settle_bets(self.recorder)
+        self.shoe.end_round()
+        self.rounds_played += 1
+
+    def _play_round_traced(self, bet_amount: float = None) -> None:
+        if bet_amount is None:
+            bet_amount = self.bet_amount
+        self._reset_and_place_bets(bet_amount)
+        self.dealer.reset_hand()
+        self._deal_initial_cards_traced()
+        dealer_upcard = self.dealer.upcard()
+        self._handle_player_turns_traced(dealer_upcard)
+        self._handle_dealer_turn_traced()
+        self._settle_bets(_SettleEvents(self, self.recorder))
+        self.shoe.end_round()
+        self.rounds_played += 1
+
+    def _play_round_profiled(self, bet_amount: float = None) -> None:
+        if bet_amount is None:
+            bet_amount = self.bet_amount
+        traced = bool(self.sinks)
+        shoe_index = self.shoe.shoe_index
+        start = perf_counter_ns()
+        self._reset_and_place_bets(bet_amount)
+        self.dealer.reset_hand()
+        bets = perf_counter_ns()
+        if traced:
+            self._deal_initial_cards_traced()
+        else:
+            self._deal_initial_cards()
+        dealer_upcard = self.dealer.upcard()
+        deal = perf_counter_ns()
+        if traced:
+            self._handle_player_turns_traced(dealer_upcard)
+        else:
+            self._handle_player_turns(dealer_upcard)
+        players = perf_counter_ns()
+        if traced:
+            self._handle_dealer_turn_traced()
+        else:
+            self._handle_dealer_turn()
+        dealer = perf_counter_ns()
+        self._settle_bets(_SettleEvents(self, self.recorder) if traced else self.recorder)
+        settle = perf_counter_ns()
+        self.rounds_played += 1
+
+        profile = self.profile
+        profile.rounds += 1
+        phase_ns = profile.phase_ns
+        phase_ns[0] += bets - start
+        phase_ns[1] += deal - bets
+        phase_ns[2] += players - deal
+        phase_ns[3] += dealer - players
+        phase_ns[4] += settle - dealer
+        profile.reshuffles += self.shoe.shoe_index - shoe_index
+        # After the count above: a machine taking a round's cards back is no reshuffle
+        self.shoe.end_round()
 
     def _reset_and_place_bets(self, bet_amount: float) -> None:
         for player in self.players:
-            if self.verbose:
-                print(f"Resetting hands for player {player.name}")
             player.reset_hands()
+            bet = player.strategy.bet_size(bet_amount)
             try:
-                if self.verbose:
-                    print(f"Player {player.name} placing bet: {bet_amount}")
-                player.place_bet(bet_amount)
+                player.place_bet(bet)
             except ValueError as e:
                 print(f"Player {player.name} cannot bet: {e}")
                 continue
-            player.add_hand(Hand(is_dealer=False))
+            player.add_hand(Hand(is_dealer=False, current_bet=bet))
 
     def _deal_initial_cards(self) -> None:
         for _ in range(2):
             for player in self.players:
                 if player.current_bet > 0 and player.hands:
-                    if self.verbose:
-                        print(f"Dealing card to player {player.name}")
                     player.hands[0].add_card(self.shoe.draw_card())
-            if self.verbose:
-                print(f"Dealing card to dealer")
             self.dealer.hand.add_card(self.shoe.draw_card())
 
+    def _deal_initial_cards_traced(self) -> None:
+        for _ in range(2):
+            for player in self.players:
+                if player.current_bet > 0 and player.hands:
+                    card = self.shoe.draw_card()
+                    player.hands[0].add_card(card)
+                    self._emit("deal", player=player.name, hand=0, card=str(card))
+            card = self.shoe.draw_card()
+            self.dealer.hand.add_card(card)
+            self._emit("deal", player=None, hand=0, card=str(card))
+
     def _handle_player_turns(self, dealer_upcard) -> None:
         for player in self.players:
-            if self.verbose:
-                print(f"Starting turns for player {player.name}")
             i = 0
             while i < len(player.hands):
                 hand = player.hands[i]
-                if self.verbose:
-                    print(f"Player {player.name}'s turn with hand: {hand}")
                 has_split = False
-                while True:
-                    if self.verbose:
-                        print(f"Player {player.name} is considering hand: {hand}")
-                    # Auto-stand on 21 or higher
-                    if hand.value[0] >= 21:
-                        if self.verbose:
-                            print(f"Player {player.name} auto-stands with hand: {hand}")
-                        break
-
+                # Auto-stand on 21 or higher
+                while hand.total < 21:
                     action = player.decide(hand, dealer_upcard)
+                    hand.actions = pack_action(hand.actions, action)
                     if action == Action.HIT:
-                        if self.verbose:
-                            print(f"Player {player.name} chooses to HIT")
                         hand.add_card(self.shoe.draw_card())
-
                     elif action == Action.STAND:
-                        if self.verbose:
-                            print(f"Player {player.name} chooses to STAND")
                         break
-
                     elif action == Action.DOUBLE_DOWN:
-                        if self.verbose:
-                            print(f"Player {player.name} chooses to DOUBLE DOWN")
-                        if len(hand) == 2:
-                            player.place_bet(player.current_bet)
-                            hand.add_card(self.shoe.draw_card())
-                        else:
-                            raise ValueError(f"Cannot double down with hand: {hand}")
+                        self._double_down(player, hand)
                         break
-
                     elif action == Action.SPLIT:
-                        if self.verbose:
-                            print(f"Player {player.name} chooses to SPLIT")
-                        # Only allow split on two cards of the same rank
-                        if len(hand) != 2:
-                            raise ValueError(f"Cannot split hand with {len(hand)} cards: {hand}")
-                        card1, card2 = hand.cards
-                        if card1.rank != card2.rank:
-                            raise ValueError(f"Cannot split hand with different ranks: {card1}, {card2}")
-                        # Place additional bet for the split hand
-                        player.place_bet(player.current_bet)
-                        # Create two new hands
-                        new_hand1 = Hand(is_dealer=False)
-                        new_hand1.add_card(card1)
-                        new_hand1.add_card(self.shoe.draw_card())
-                        new_hand2 = Hand(is_dealer=False)
-                        new_hand2.add_card(card2)
-                        new_hand2.add_card(self.shoe.draw_card())
-                        # Replace current hand with first new hand and insert second after
-                        player.hands[i] = new_hand1
-                        player.hands.insert(i + 1, new_hand2)
+                        self._split(player, i, hand)
                         has_split = True
                         break
-
                     else:
                         raise ValueError(f"Unknown action: {action}")
                 # If we didn't split, move to next hand; if we did, process new_hand1 before moving on
                 if not has_split:
                     i += 1
 
+    def _handle_player_turns_traced(self, dealer_upcard) -> None:
+        emit = self._emit
+        for player in self.players:
+            i = 0
+            while i < len(player.hands):
+                hand = player.hands[i]
+                has_split = False
+                while hand.total < 21:
+                    action = player.decide(hand, dealer_upcard)
+                    emit("decision", player=player.name, hand=i, total=hand.total, soft=hand.is_soft,
+                         cards=len(hand.cards), upcard=dealer_upcard.upcard_value, action=action.name)
+                    hand.actions = pack_action(hand.actions, action)
+                    if action == Action.HIT:
+                        card = self.shoe.draw_card()
+                        hand.add_card(card)
+                        emit("deal", player=player.name, hand=i, card=str(card))
+                    elif action == Action.STAND:
+                        break
+                    elif action == Action.DOUBLE_DOWN:
+                        self._double_down(player, hand)
+                        emit("double", player=player.name, hand=i, wager=hand.current_bet)
+                        emit("deal", player=player.name, hand=i, card=str(hand.cards[-1]))
+                        break
+                    elif action == Action.SPLIT:
+                        self._split(player, i, hand)
+                        emit("split", player=player.name, hand=i, rank=hand.cards[0].rank)
+                        for index in (i, i + 1):
+                            emit("deal", player=player.name, hand=index, card=str(player.hands[index].cards[1]))
+                        has_split = True
+                        break
+                    else:
+                        raise ValueError(f"Unknown action: {action}")
+                if not has_split:
+                    i += 1
+
+    def _double_down(self, player: Player, hand: Hand) -> None:
+        if len(hand) != 2:
+            raise ValueError(f"Cannot double down with hand: {hand}")
+        player.place_bet(hand.current_bet)
+        player.stats.doubles += 1
+        hand.current_bet *= 2
+        hand.add_card(self.shoe.draw_card())
+
+    def _split(self, player: Player, i: int, hand: Hand) -> None:
+        # Only allow split on two cards of the same rank
+        if len(hand) != 2:
+            raise ValueError(f"Cannot split hand with {len(hand)} cards: {hand}")
+        card1, card2 = hand.cards
+        if card1.rank_index != card2.rank_index:
+            raise ValueError(f"Cannot split hand with different ranks: {card1}, {card2}")
+        # Place additional bet for the split hand
+        player.place_bet(hand.current_bet)
+        player.stats.splits += 1
+        # Create two new hands, each carrying the original wager
+        new_hand1 = Hand(is_dealer=False, current_bet=hand.current_bet)
+        new_hand1.add_card(card1)
+        new_hand1.add_card(self.shoe.draw_card())
+        new_hand2 = Hand(is_dealer=False, current_bet=hand.current_bet)
+        new_hand2.add_card(card2)
+        new_hand2.add_card(self.shoe.draw_card())
+        new_hand1.is_split = new_hand2.is_split = True
+        # Replace current hand with first new hand and insert second after
+        player.hands[i] = new_hand1
+        player.hands.insert(i + 1, new_hand2)
+
     def _handle_dealer_turn(self) -> None:
         self.dealer.play(self.shoe)
 
-    def _settle_bets(self) -> None:
-        dealer_total, _ = self.dealer.hand.value
-        for player in self.players:
-            for hand in player.hands:
-                total, _ = hand.value
+    def _handle_dealer_turn_traced(self) -> None:
+        dealer = self.dealer
+        while dealer.must_hit():
+            card = self.shoe.draw_card()
+            dealer.hand.add_card(card)
+            self._emit("dealer_draw", card=str(card), total=dealer.hand.total)
+
+    def _settle_bets(self, recorder) -> None:
+        dealer_hand = self.dealer.hand
+        dealer_total = dealer_hand.total
+        for player_index, player in enumerate(self.players):
+            if not player.hands:
+                continue
+            stats = player.stats
+            round_wager = 0.0
+            round_payout = 0.0
+            for hand_index, hand in enumerate(player.hands):
+                total = hand.total
+                wager = hand.current_bet
+                round_wager += wager
+                stats.hands += 1
+                payout = 0.0
                 if hand.is_bust:
-                    if self.verbose:
-                        print(f"Player {player.name} busts with hand {hand}")
-                    player.lose()
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after bust: {player.bankroll}")
-                elif hand.is_blackjack and not self.dealer.hand.is_blackjack:
-                    if self.verbose:
-                        print(f"Player {player.name} has blackjack with hand {hand}")
-                    player.win(multiplier=self.blackjack_multiplier)
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after blackjack: {player.bankroll}")
-                elif self.dealer.hand.is_bust:
-                    if self.verbose:
-                        print(f"Dealer busts, player {player.name} wins with hand {hand}")
-                    player.win()
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after win: {player.bankroll}")
-                elif total > dealer_total:
-                    if self.verbose:
-                        print(f"Player {player.name} wins with hand {hand}")
-                    player.win()
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after win: {player.bankroll}")
+                    hand.lose()
+                    outcome = "bust"
+                    stats.busts += 1
+                    stats.losses += 1
+                elif hand.is_blackjack and not dealer_hand.is_blackjack:
+                    payout = hand.win(multiplier=self.blackjack_multiplier)
+                    player.collect(payout)
+                    outcome = "blackjack"
+                    stats.blackjacks += 1
+                    stats.wins += 1
+                elif dealer_hand.is_bust or total > dealer_total:
+                    payout = hand.win()
+                    player.collect(payout)
+                    outcome = "win"
+                    stats.wins += 1
                 elif total < dealer_total:
-                    if self.verbose:
-                        print(f"Player {player.name} loses with hand {hand}")
-                    player.lose()
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after loss: {player.bankroll}")
+                    hand.lose()
+                    outcome = "loss"
+                    stats.losses += 1
                 else:
-                    if self.verbose:
-                        print(f"Player {player.name} pushes with hand {hand}")
-                    player.push()
-                    if self.verbose:
-                        print(f"Player {player.name} bankroll after push: {player.bankroll}")
+                    payout = hand.push()
+                    player.collect(payout)
+                    outcome = "push"
+                    stats.pushes += 1
+                round_payout += payout
+                if recorder is not None:
+                    recorder.record(self.rounds_played, player_index, hand_index, hand,
+                                    dealer_hand, wager, payout - wager, outcome)
+            stats.record_round(round_payout - round_wager, round_wager)
 
     def __repr__(self) -> str:
-        return f"Game(players={self.players}, dealer={self.dealer}, shoe={self.shoe})"
\ No newline at end of file
+        return f"Game(players={self.players}, dealer={self.dealer}, shoe={self.shoe})"
+
+
+class _SettleEvents:
+    """Passed to Game._settle_bets as its recorder: emits a settle event per hand."""
+    def __init__(self, game: Game, recorder) -> None:
+        self.game = game
+        self.recorder = recorder
+
+    def record(self, round_index, player_index, hand_index, hand, dealer_hand, wager, net, outcome) -> None:
+        self.game._emit("settle", player=self.game.players[player_index].name, hand=hand_index,
+                        total=hand.total, dealer_total=dealer_hand.total, wager=wager, net=net,
+                        outcome=outcome)
+        if self.recorder is not None:
+            self.recorder.record(round_index, player_index, hand_index, hand, dealer_hand, wager, net, outcome)
@@ -1,6 +1,12 @@
+from typing import TYPE_CHECKING
+
 from cards import Card, Hand 
 from .action import Action
-from strategies import Strategy
+from .statistics import PlayerStatistics
+
+if TYPE_CHECKING:
+    # Only for annotations: strategies import game, so game does not import strategies
+    from strategies import Strategy
 
 class Player:
     """
@@ -12,13 +18,15 @@ class Player:
         strategy (Strategy): The strategy object that dictates betting and play decisions.
         hands (List[Hand]): Current list of active hands (supporting splits).
         current_bet (float): The amount wagered on the current hand.
+        stats (PlayerStatistics): Tallies of the hands the player has played.
     """
-    def __init__(self, name: str, bankroll: float, strategy: Strategy) -> None:
+    def __init__(self, name: str, bankroll: float, strategy: 'Strategy') -> None:
         self.name: str = name
         self.bankroll: float = bankroll
-        self.strategy: Strategy = strategy
+        self.strategy: 'Strategy' = strategy
         self.hands: list[Hand] = []
         self.current_bet: float = 0.0
+        self.stats: PlayerStatistics = PlayerStatistics()
 
     def place_bet(self, amount: float) -> None:
         """
@@ -58,6 +66,15 @@ class Player:
         """
         return self.strategy.next_move(hand, dealer_upcard)
 
+    def collect(self, amount: float) -> None:
+        """
+        Add a payout returned by a settled hand to the bankroll.
+
+        Args:
+            amount (float): Amount returned by Hand.win() or Hand.push().
+        """
+        self.bankroll += amount
+
     def win(self, multiplier: float = 1.0) -> None:
         """
         Award winnings to the player's bankroll.
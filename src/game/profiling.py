@@ -0,0 +1,128 @@
+from time import perf_counter_ns
+
+from cards import Card, Hand
+from .action import Action
+
+# Phases of a round, in the order Game plays them
+PHASES: tuple[str, ...] = ("bets", "deal", "players", "dealer", "settle")
+
+
+class GameProfile:
+    """
+    Time spent in each phase of Game.play_round and in each strategy's next_move,
+    with counts of the events that make rounds expensive.
+
+    Times are perf_counter_ns nanoseconds. Every phase runs once per round, and
+    the players phase includes the time of the next_move calls made during it.
+    Splits and doubles are counted from the decisions, so they are only seen for
+    players present when profiling was enabled.
+
+    Attributes:
+        rounds (int): Rounds profiled.
+        phase_ns (list[int]): Total time of each phase, in PHASES order.
+        next_move_ns (dict[str, int]): Strategy class name -> total time in next_move.
+        next_move_calls (dict[str, int]): Strategy class name -> next_move calls.
+        reshuffles (int): Shoes reshuffled.
+        splits (int): Pairs split.
+        doubles (int): Hands doubled down.
+    """
+    def __init__(self) -> None:
+        self.rounds: int = 0
+        self.phase_ns: list[int] = [0] * len(PHASES)
+        self.next_move_ns: dict[str, int] = {}
+        self.next_move_calls: dict[str, int] = {}
+        self.reshuffles: int = 0
+        self.splits: int = 0
+        self.doubles: int = 0
+
+    def merge(self, other: 'GameProfile') -> None:
+        """
+        Add the timings and counts of another profile, e.g. of a parallel shard.
+
+        Args:
+            other (GameProfile): Profile to add.
+        """
+        self.rounds += other.rounds
+        self.phase_ns = [mine + theirs for mine, theirs in zip(self.phase_ns, other.phase_ns)]
+        for name, elapsed in other.next_move_ns.items():
+            self.next_move_ns[name] = self.next_move_ns.get(name, 0) + elapsed
+            self.next_move_calls[name] = self.next_move_calls.get(name, 0) + other.next_move_calls[name]
+        self.reshuffles += other.reshuffles
+        self.splits += other.splits
+        self.doubles += other.doubles
+
+    @property
+    def total_ns(self) -> int:
+        """Time spent in profiled rounds."""
+        return sum(self.phase_ns)
+
+    def as_dict(self) -> dict:
+        """
+        The profile as plain data.
+
+        Returns:
+            dict: rounds, total_ns, reshuffles, splits, doubles, and phases and
+                next_move mapping each name to its ns, calls and ns_per_call.
+        """
+        def entry(elapsed: int, calls: int) -> dict:
+            return {"ns": elapsed, "calls": calls, "ns_per_call": elapsed / calls if calls else 0.0}
+
+        return {
+            "rounds": self.rounds,
+            "total_ns": self.total_ns,
+            "phases": {phase: entry(elapsed, self.rounds) for phase, elapsed in zip(PHASES, self.phase_ns)},
+            "next_move": {name: entry(elapsed, self.next_move_calls[name])
+                          for name, elapsed in self.next_move_ns.items()},
+            "reshuffles": self.reshuffles,
+            "splits": self.splits,
+            "doubles": self.doubles,
+        }
+
+    def summary(self) -> str:
+        """
+        Format the profile as a table: time per call and share of the round time of
+        every phase and strategy, then the event counts.
+
+        Returns:
+            str: The table.
+        """
+        total = self.total_ns or 1
+        lines = [f"{'section':<32}{'calls':>12}{'total ms':>12}{'ns/call':>10}{'share':>8}"]
+        rows = [(phase, self.rounds, elapsed) for phase, elapsed in zip(PHASES, self.phase_ns)]
+        rows += [(f"next_move[{name}]", self.next_move_calls[name], elapsed)
+                 for name, elapsed in self.next_move_ns.items()]
+        for name, calls, elapsed in rows:
+            per_call = elapsed / calls if calls else 0.0
+            lines.append(f"{name:<32}{calls:>12}{elapsed / 1e6:>12.1f}{per_call:>10.0f}{elapsed / total:>8.1%}")
+        lines.append(f"{self.rounds} rounds, {self.reshuffles} reshuffles, "
+                     f"{self.splits} splits, {self.doubles} doubles")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"GameProfile(rounds={self.rounds}, total_ms={self.total_ns / 1e6:.1f})"
+
+
+class TimedDecision:
+    """
+    Stands in for Player.decide while a game is profiled, timing the strategy's
+    next_move and counting the splits and doubles it decides.
+    """
+    def __init__(self, player, profile: GameProfile) -> None:
+        self.strategy = player.strategy
+        self.name = type(player.strategy).__name__
+        self.profile = profile
+        profile.next_move_ns.setdefault(self.name, 0)
+        profile.next_move_calls.setdefault(self.name, 0)
+
+    def __call__(self, hand: Hand, dealer_upcard: Card) -> Action:
+        start = perf_counter_ns()
+        action = self.strategy.next_move(hand, dealer_upcard)
+        elapsed = perf_counter_ns() - start
+        profile = self.profile
+        profile.next_move_ns[self.name] += elapsed
+        profile.next_move_calls[self.name] += 1
+        if action is Action.SPLIT:
+            profile.splits += 1
+        elif action is Action.DOUBLE_DOWN:
+            profile.doubles += 1
+        return action
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    The house rules a blackjack game is played under.
+
+    Attributes:
+        num_decks (int): Number of decks in the shoe.
+        dealer_hits_soft_17 (bool): Whether the dealer hits soft 17 (see Dealer.play).
+        blackjack_multiplier (float): Payout multiplier for a natural blackjack.
+        penetration_threshold (float): Fraction of the shoe dealt before a reshuffle.
+        shoe_model (str): How cards are dealt, a key of cards.SHOE_MODELS: "shoe" for a
+            shuffled shoe dealt to the cut card, "csm" for a continuous shuffling
+            machine, "infinite" for an infinite deck.
+    """
+    num_decks: int = 8
+    dealer_hits_soft_17: bool = True
+    blackjack_multiplier: float = 1.5
+    penetration_threshold: float = 0.75
+    shoe_model: str = "shoe"
@@ -0,0 +1,109 @@
+class PlayerStatistics:
+    """
+    Running tallies of a player's results, updated by Game as hands are settled.
+
+    Tallies from independent runs can be combined with merge(), which is how the
+    shards of a parallel Simulation are put back together.
+
+    Attributes:
+        rounds (int): Rounds in which the player had at least one hand.
+        hands (int): Hands settled, counting each hand of a split.
+        wins (int): Hands won, including blackjacks.
+        losses (int): Hands lost, including busts.
+        pushes (int): Hands pushed.
+        blackjacks (int): Hands paid as a blackjack.
+        busts (int): Hands that went over 21.
+        doubles (int): Hands doubled down.
+        splits (int): Pairs split.
+        wagered (float): Total amount wagered, including doubles and splits.
+        net (float): Total net result.
+        net_squared (float): Sum of the squared net result of each round.
+    """
+    FIELDS: tuple[str, ...] = (
+        "rounds", "hands", "wins", "losses", "pushes", "blackjacks", "busts",
+        "doubles", "splits", "wagered", "net", "net_squared",
+    )
+
+    def __init__(self) -> None:
+        self.rounds: int = 0
+        self.hands: int = 0
+        self.wins: int = 0
+        self.losses: int = 0
+        self.pushes: int = 0
+        self.blackjacks: int = 0
+        self.busts: int = 0
+        self.doubles: int = 0
+        self.splits: int = 0
+        self.wagered: float = 0.0
+        self.net: float = 0.0
+        self.net_squared: float = 0.0
+
+    def record_round(self, net: float, wagered: float) -> None:
+        """
+        Record the outcome of one round.
+
+        Args:
+            net (float): Net result of the round over all of the player's hands.
+            wagered (float): Total amount wagered in the round.
+        """
+        self.rounds += 1
+        self.wagered += wagered
+        self.net += net
+        self.net_squared += net * net
+
+    def merge(self, other: 'PlayerStatistics') -> None:
+        """
+        Add the tallies of another run to this one.
+
+        Args:
+            other (PlayerStatistics): Tallies to add.
+        """
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    @property
+    def ev_per_round(self) -> float:
+        """Mean net result per round."""
+        return self.net / self.rounds if self.rounds else 0.0
+
+    @property
+    def variance_per_round(self) -> float:
+        """Sample variance of the net result per round."""
+        if self.rounds < 2:
+            return 0.0
+        mean = self.net / self.rounds
+        return (self.net_squared - self.rounds * mean * mean) / (self.rounds - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of ev_per_round, treating rounds as independent."""
+        return (self.variance_per_round / self.rounds) ** 0.5 if self.rounds else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the tallies as a plain dict."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, tallies: dict[str, float]) -> 'PlayerStatistics':
+        """
+        Rebuild tallies saved with as_dict.
+
+        Args:
+            tallies (dict[str, float]): Field name -> value.
+
+        Returns:
+            PlayerStatistics: The tallies.
+        """
+        stats = cls()
+        for field in cls.FIELDS:
+            setattr(stats, field, tallies[field])
+        return stats
+
+    def __eq__(self, other):
+        if not isinstance(other, PlayerStatistics):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return (f"PlayerStatistics(rounds={self.rounds}, hands={self.hands}, "
+                f"net={self.net:.2f}, ev_per_round={self.ev_per_round:.5f})")
@@ -0,0 +1,37 @@
+from importlib import import_module
+from typing import Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Module __getattr__ and __dir__ functions that import a package's public names
+    from their submodules on first access (PEP 562), so importing the package itself
+    costs nothing and heavy dependencies such as NumPy load only when used.
+
+    Usage, in a package's __init__.py:
+        __getattr__, __dir__ = lazy_exports(__name__, {"Game": ".game", ...})
+
+    Args:
+        package (str): Name of the package (its __name__).
+        exports (dict[str, str]): Public name -> module defining it, relative to the
+            package when it starts with a dot.
+
+    Returns:
+        tuple: The __getattr__ and __dir__ functions of the package.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> object:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(import_module(module, package), name)
+        # Cache the name so later accesses are plain attribute lookups
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
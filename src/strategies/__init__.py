@@ -1,11 +1,19 @@
-from .strategy import Strategy
-from .basic_strategies import RandomStrategy, AggressiveStrategy, SafeStrategy, SplitStrategy, BasicStrategy
-from .advanced_strategies import PerfectStrategy
+from lazy import lazy_exports
 
-__all__ = ["Strategy", 
-           "RandomStrategy", 
-           "AggressiveStrategy", 
-           "SafeStrategy", 
-           "SplitStrategy", 
-           "BasicStrategy",
-           "PerfectStrategy"]
\ No newline at end of file
+# Public names and the submodules defining them, imported on first access
+_EXPORTS: dict[str, str] = {
+    "Strategy": ".strategy",
+    "RandomStrategy": ".basic_strategies",
+    "AggressiveStrategy": ".basic_strategies",
+    "SafeStrategy": ".basic_strategies",
+    "SplitStrategy": ".basic_strategies",
+    "BasicStrategy": ".basic_strategies",
+    "PerfectStrategy": ".advanced_strategies",
+    "CompiledStrategy": ".compiled_strategy",
+    "Deviation": ".deviation_strategy",
+    "DeviationStrategy": ".deviation_strategy",
+    "ILLUSTRIOUS_18": ".deviation_strategy",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
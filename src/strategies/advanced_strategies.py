@@ -1,5 +1,6 @@
 from cards import Card, Hand
 from game.action import Action
+from game.rules import Rules
 from .strategy import Strategy
 
 import numpy as np
@@ -7,8 +8,20 @@ import numpy as np
 class PerfectStrategy(Strategy):
     """
     The perfect blackjack strategy as known from charts with 4-8 decks and dealer hits on soft 17.
+
+    Given a rule set, the tables are instead derived for those rules from exact
+    expected values (see analysis.tables); they are computed once per rule set and
+    cached on disk.
     """
-    def __init__(self):
+    def __init__(self, rules: Rules | None = None):
+        """
+        Initialize a new PerfectStrategy.
+
+        Args:
+            rules (Rules | None, optional): Rules to derive the tables for. Defaults to
+                None (the hand-written chart).
+        """
+        self.rules: Rules | None = rules
         # SPLIT table: rows index first-card value (1–10), Aces count as 1, cols index dealer upcard value (2–11)
         self.split_table = np.full((11, 12), np.nan, dtype=object)
         # HARD totals table: rows index total 0–20, cols index dealer upcard value 2–11
@@ -20,7 +33,10 @@ class PerfectStrategy(Strategy):
         # SOFT totals table: rows index total 0–20, cols index dealer upcard value 2–11
         self.soft_double_forbidden_table = np.full((21, 12), np.nan, dtype=object)
 
-        self.fill_tables()
+        if rules is None:
+            self.fill_tables()
+        else:
+            self.load_tables(rules)
 
 
     def fill_tables(self):
@@ -145,10 +161,24 @@ class PerfectStrategy(Strategy):
         self.soft_double_forbidden_table[13:15, 2:] = Action.HIT
 
 
+    def load_tables(self, rules: Rules):
+        """
+        Fill the strategy tables with the optimal actions for a rule set.
+
+        Args:
+            rules (Rules): House rules.
+        """
+        # Imported here: the analysis package itself depends on strategies
+        from analysis.tables import load_tables
+        actions = np.array([np.nan] + list(Action), dtype=object)
+        for name, codes in load_tables(rules).items():
+            getattr(self, name)[:] = actions[codes]
+
+
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
-        hand_value = hand.value[0]
-        hand_is_soft = (hand.value[1] == "Soft")
-        hand_is_hard = (hand.value[1] == "Hard")
+        hand_value = hand.total
+        hand_is_soft = hand.is_soft
+        hand_is_hard = not hand_is_soft
         dealer_value = dealer_upcard.upcard_value
 
         # Pair-splitting decision 
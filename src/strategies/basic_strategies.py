@@ -1,15 +1,20 @@
-from cards import Card, Hand
+from cards import Card, Hand, RandomStream
 from game import Action
 from .strategy import Strategy
 
-import random
 
 class RandomStrategy(Strategy):
     """
     A strategy that randomly chooses between HIT and STAND.
     """
+    def __init__(self, rng: RandomStream | None = None) -> None:
+        self.rng: RandomStream = rng if rng is not None else RandomStream()
+
+    def bind_rng(self, rng: RandomStream) -> None:
+        self.rng = rng
+
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
-        return random.choice([Action.HIT, Action.STAND])
+        return Action.HIT if self.rng.random() < 0.5 else Action.STAND
 
 
 class AggressiveStrategy(Strategy):
@@ -18,7 +23,7 @@ class AggressiveStrategy(Strategy):
     """
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
         # aggressive strategy: always hit under 17, otherwise stand
-        if hand.value[0] < 17:
+        if hand.total < 17:
             return Action.HIT
         else:
             return Action.STAND
@@ -30,7 +35,7 @@ class SafeStrategy(Strategy):
     """
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
         # safe strategy: always hit under 12 Hard, otherwise stand
-        if hand.value[0] <12 or hand.value[1] == "Soft":
+        if hand.total < 12 or hand.is_soft:
             return Action.HIT
         else:
             return Action.STAND
@@ -53,16 +58,17 @@ class BasicStrategy(Strategy):
     The basic blackjack strategy, being an approximation of the perfect strategy.
     """
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
-        hand_value = hand.value[0]
-        hand_is_soft = (hand.value[1] == "Soft")
+        hand_value = hand.total
+        hand_is_soft = hand.is_soft
         dealer_upcard_value = dealer_upcard.upcard_value
 
         # Pair-splitting decision 
         # 8 and A always split, 2, 3, 6, 7, 9 split against weak dealer upcard 2-6
         if hand.can_split:
-            if hand.cards[0].value in [1, 8]:
+            pair_value = hand.cards[0].value
+            if pair_value == 1 or pair_value == 8:
                 return Action.SPLIT
-            elif hand.cards[0].value in [2, 3, 6, 7, 9] and dealer_upcard_value < 7:
+            elif pair_value in (2, 3, 6, 7, 9) and dealer_upcard_value < 7:
                 return Action.SPLIT
         
         # Soft hands
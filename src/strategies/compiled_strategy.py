@@ -0,0 +1,177 @@
+from cards import Card, Hand
+from game.action import Action
+from .strategy import Strategy
+
+import numpy as np
+
+# Canonical hand states. Hands that are not a pair are indexed by
+# (soft, can_double, total): ((soft * 2 + can_double) * NUM_TOTALS + total).
+# Pairs follow, indexed by the value of the paired card (Aces count as 1).
+NUM_TOTALS = 22
+PAIR_BASE = 4 * NUM_TOTALS
+NUM_STATES = PAIR_BASE + 11
+# Columns of the table, indexed directly by the dealer upcard value (2 to 11)
+NUM_UPCARDS = 12
+
+# One rank per card value, used to build representative hands
+_VALUE_RANKS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10')
+
+
+def state_index(total: int, soft: bool, can_double: bool, pair_value: int = 0) -> int:
+    """
+    Canonical index of a hand state.
+
+    Args:
+        total (int): Best total of the hand.
+        soft (bool): Whether the total counts an Ace as 11.
+        can_double (bool): Whether the hand has exactly two cards.
+        pair_value (int, optional): Value of the paired card if the hand is a pair, else 0.
+
+    Returns:
+        int: Row of the state in a compiled table.
+    """
+    if pair_value:
+        return PAIR_BASE + pair_value
+    return (soft * 2 + can_double) * NUM_TOTALS + total
+
+
+def hand_state(hand: Hand) -> int:
+    """
+    Canonical index of the state of a hand, see state_index().
+
+    Args:
+        hand (Hand): A hand the player still has to decide on (total below 21).
+
+    Returns:
+        int: Row of the hand's state in a compiled table.
+    """
+    if hand.can_split:
+        return PAIR_BASE + hand.cards[0].value
+    return (hand.is_soft * 2 + (len(hand.cards) == 2)) * NUM_TOTALS + hand.total
+
+
+def _hand(ranks) -> Hand:
+    hand = Hand()
+    hand.add_cards([Card(rank, 'Spades') for rank in ranks])
+    return hand
+
+
+def decision_hands():
+    """
+    Enumerate the hands a player can be asked to decide on.
+
+    The first two cards run over every ordered pair of ranks; further cards are
+    added in non-decreasing value order, one rank per value, while the total stays
+    below 21 (the game stands automatically from 21).
+
+    Yields:
+        Hand: A hand with a total below 21.
+    """
+    def extend(ranks, last_value):
+        hand = _hand(ranks)
+        if hand.total >= 21:
+            return
+        yield hand
+        for value in range(last_value, 11):
+            yield from extend(ranks + [_VALUE_RANKS[value - 1]], value)
+
+    for first in Card.RANKS:
+        for second in Card.RANKS:
+            yield from extend([first, second], 1)
+
+
+def representative_hands() -> dict[int, Hand]:
+    """
+    One hand for every reachable state.
+
+    Returns:
+        dict[int, Hand]: State index -> the first enumerated hand in that state.
+    """
+    hands = {}
+    for hand in decision_hands():
+        hands.setdefault(hand_state(hand), hand)
+    return hands
+
+
+def _upcards() -> list[Card]:
+    return [Card(rank, 'Hearts') for rank in _VALUE_RANKS]
+
+
+class CompiledStrategy(Strategy):
+    """
+    A deterministic strategy compiled into a flat table of action codes.
+
+    The wrapped strategy is asked once for every reachable hand state and dealer
+    upcard; afterwards every decision is a single lookup at
+    hand_state(hand) * NUM_UPCARDS + upcard value. The codes are kept as an int8
+    NumPy array (Action.value, 0 where no action is defined) for vectorized engines,
+    and as a list of Action members for the per-hand lookups of Game.
+
+    Compilation assumes the wrapped strategy decides from the state alone (total,
+    softness, pair, number of cards); verify() checks that on every decision hand.
+
+    Attributes:
+        strategy (Strategy): The compiled strategy.
+        codes (np.ndarray): int8 action codes, NUM_STATES * NUM_UPCARDS long.
+    """
+    def __init__(self, strategy: Strategy) -> None:
+        """
+        Initialize a new CompiledStrategy.
+
+        Args:
+            strategy (Strategy): A deterministic strategy.
+        """
+        self.strategy: Strategy = strategy
+        self.codes: np.ndarray = np.zeros(NUM_STATES * NUM_UPCARDS, dtype=np.int8)
+        self._actions: list[Action | None] = [None] * (NUM_STATES * NUM_UPCARDS)
+        upcards = _upcards()
+        for state, hand in representative_hands().items():
+            for upcard in upcards:
+                action = strategy.next_move(hand, upcard)
+                if isinstance(action, Action):
+                    index = state * NUM_UPCARDS + upcard.upcard_value
+                    self.codes[index] = action.value
+                    self._actions[index] = action
+
+    @property
+    def table(self) -> np.ndarray:
+        """The action codes as a (NUM_STATES, NUM_UPCARDS) view."""
+        return self.codes.reshape(NUM_STATES, NUM_UPCARDS)
+
+    def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
+        if hand.can_split:
+            state = PAIR_BASE + hand.cards[0].value
+        else:
+            state = (hand.is_soft * 2 + (len(hand.cards) == 2)) * NUM_TOTALS + hand.total
+        return self._actions[state * NUM_UPCARDS + dealer_upcard.upcard_value]
+
+    def verify(self) -> int:
+        """
+        Check that the compiled table agrees with the wrapped strategy on every
+        decision hand (see decision_hands()) against every upcard.
+
+        Returns:
+            int: Number of (hand, upcard) decisions checked.
+
+        Raises:
+            ValueError: If any decision differs, listing the first few.
+        """
+        upcards = _upcards()
+        checked = 0
+        mismatches = []
+        for hand in decision_hands():
+            for upcard in upcards:
+                expected = self.strategy.next_move(hand, upcard)
+                if not isinstance(expected, Action):
+                    expected = None
+                actual = self.next_move(hand, upcard)
+                if actual is not expected:
+                    mismatches.append(f"{hand} vs {upcard}: {expected} compiled as {actual}")
+                checked += 1
+        if mismatches:
+            raise ValueError(f"{len(mismatches)} decisions differ from {type(self.strategy).__name__}, "
+                             f"e.g. {mismatches[:3]}")
+        return checked
+
+    def __repr__(self) -> str:
+        return f"CompiledStrategy({type(self.strategy).__name__})"
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from math import floor
+
+import numpy as np
+
+from cards import Card, CountingSystem, Hand, RunningCount, Shoe
+from game.action import Action
+from .advanced_strategies import PerfectStrategy
+from .compiled_strategy import NUM_UPCARDS, NUM_TOTALS, PAIR_BASE, CompiledStrategy, state_index
+from .strategy import Strategy
+
+
+@dataclass(frozen=True)
+class Deviation:
+    """
+    An index play: a departure from the base strategy at some true counts.
+
+    The action is taken when the true count is at or above the index, or, for
+    deviations with above=False, strictly below it. A deviation on a total also
+    applies to pairs of that total that the base strategy does not split; one on a
+    pair (pair set) only applies to that pair. Doubling deviations only apply to
+    two-card hands.
+
+    Attributes:
+        total (int): Hand total (ignored for pair deviations).
+        upcard (int): Dealer upcard value, 2 to 11 (Ace as 11).
+        index (float): True count at which the play changes.
+        action (Action): Action taken past the index.
+        soft (bool): Whether the total is soft.
+        pair (int): Value of the paired card (Aces as 1), 0 for a total.
+        above (bool): Whether the action applies at or above the index, or below it.
+    """
+    total: int
+    upcard: int
+    index: float
+    action: Action
+    soft: bool = False
+    pair: int = 0
+    above: bool = True
+
+    def applies(self, true_count: float) -> bool:
+        """Whether the deviation is played at a true count."""
+        return true_count >= self.index if self.above else true_count < self.index
+
+
+# The Illustrious 18 for the Hi-Lo count, less insurance, which the game does not offer
+ILLUSTRIOUS_18: tuple[Deviation, ...] = (
+    Deviation(16, 10, 0, Action.STAND),
+    Deviation(15, 10, 4, Action.STAND),
+    Deviation(20, 5, 5, Action.SPLIT, pair=10),
+    Deviation(20, 6, 4, Action.SPLIT, pair=10),
+    Deviation(10, 10, 4, Action.DOUBLE_DOWN),
+    Deviation(12, 3, 2, Action.STAND),
+    Deviation(12, 2, 3, Action.STAND),
+    Deviation(11, 11, 1, Action.DOUBLE_DOWN),
+    Deviation(9, 2, 1, Action.DOUBLE_DOWN),
+    Deviation(10, 11, 4, Action.DOUBLE_DOWN),
+    Deviation(9, 7, 3, Action.DOUBLE_DOWN),
+    Deviation(16, 9, 5, Action.STAND),
+    Deviation(13, 2, -1, Action.HIT, above=False),
+    Deviation(12, 4, 0, Action.HIT, above=False),
+    Deviation(12, 5, -2, Action.HIT, above=False),
+    Deviation(12, 6, -1, Action.HIT, above=False),
+    Deviation(13, 3, -2, Action.HIT, above=False),
+)
+
+
+class DeviationStrategy(Strategy):
+    """
+    A base strategy with count-indexed deviations.
+
+    One table of action codes is compiled per true-count bucket when the strategy
+    is created, with every deviation played in that bucket written over the base
+    strategy's compiled table; a decision is then one lookup in the table of the
+    current bucket. Buckets are bucket_width wide, so deviation indices must be
+    multiples of it, and true counts beyond the range share the outermost buckets.
+
+    The true count comes from the count of the shoe the strategy is bound to (see
+    bind_shoe); an unbound strategy plays the bucket of true count 0.
+
+    Attributes:
+        base (CompiledStrategy): Base strategy, compiled.
+        deviations (tuple[Deviation, ...]): Index plays.
+        system (CountingSystem | str): Counting system of the indices.
+        min_count (int): Lowest bucket, in true counts.
+        max_count (int): Highest bucket, in true counts.
+        bucket_width (float): Width of a bucket, in true counts.
+        count (RunningCount | None): Count of the bound shoe.
+    """
+    def __init__(
+        self,
+        base: Strategy | None = None,
+        deviations: tuple[Deviation, ...] = ILLUSTRIOUS_18,
+        system: str | CountingSystem = "hi-lo",
+        min_count: int = -10,
+        max_count: int = 10,
+        bucket_width: float = 1.0
+    ) -> None:
+        """
+        Initialize a new DeviationStrategy.
+
+        Args:
+            base (Strategy | None, optional): Deterministic base strategy. Defaults to PerfectStrategy().
+            deviations (tuple[Deviation, ...], optional): Index plays. Defaults to ILLUSTRIOUS_18.
+            system (str | CountingSystem, optional): Counting system. Defaults to "hi-lo".
+            min_count (int, optional): Lowest true count bucket. Defaults to -10.
+            max_count (int, optional): Highest true count bucket. Defaults to 10.
+            bucket_width (float, optional): Width of a bucket. Defaults to 1.0.
+
+        Raises:
+            ValueError: If an index is not a multiple of bucket_width, or if a
+                deviation splits a hand that is not a pair.
+        """
+        if base is None:
+            base = PerfectStrategy()
+        self.base: CompiledStrategy = base if isinstance(base, CompiledStrategy) else CompiledStrategy(base)
+        self.deviations: tuple[Deviation, ...] = tuple(deviations)
+        self.system: str | CountingSystem = system
+        self.min_count: int = min_count
+        self.max_count: int = max_count
+        self.bucket_width: float = bucket_width
+        self.count: RunningCount | None = None
+        for deviation in self.deviations:
+            if deviation.index % bucket_width:
+                raise ValueError(f"Index {deviation.index} is not a multiple of the bucket width {bucket_width}.")
+        self._first_bucket: int = floor(min_count / bucket_width)
+        self._last_bucket: int = floor(max_count / bucket_width)
+        self._tables: list[list[Action | None]] = [
+            self._compile(bucket * bucket_width)
+            for bucket in range(self._first_bucket, self._last_bucket + 1)
+        ]
+
+    def _compile(self, true_count: float) -> list[Action | None]:
+        """Action table of the bucket starting at a true count."""
+        table = list(self.base._actions)
+        for deviation in self.deviations:
+            if deviation.applies(true_count):
+                for state in self._states(deviation):
+                    table[state * NUM_UPCARDS + deviation.upcard] = deviation.action
+        return table
+
+    def _states(self, deviation: Deviation) -> list[int]:
+        """Hand states a deviation applies to."""
+        if deviation.pair:
+            return [PAIR_BASE + deviation.pair]
+        if deviation.action == Action.SPLIT:
+            raise ValueError(f"Cannot split a total: {deviation}.")
+        states = [state_index(deviation.total, deviation.soft, True)]
+        if deviation.action != Action.DOUBLE_DOWN:
+            states.append(state_index(deviation.total, deviation.soft, False))
+        split = Action.SPLIT.value
+        for value in range(1, 11):
+            soft = value == 1
+            if (2 * value + 10 * soft, soft) == (deviation.total, deviation.soft):
+                state = PAIR_BASE + value
+                if self.base.codes[state * NUM_UPCARDS + deviation.upcard] != split:
+                    states.append(state)
+        return states
+
+    @property
+    def bucket_codes(self) -> np.ndarray:
+        """The compiled tables as int8 action codes, one row per bucket (0 where undefined)."""
+        return np.array([[action.value if action is not None else 0 for action in table]
+                         for table in self._tables], dtype=np.int8)
+
+    def bind_shoe(self, shoe: Shoe) -> None:
+        self.count = shoe.track(self.system)
+
+    def bucket(self, true_count: float) -> int:
+        """
+        Index in the compiled tables of the bucket of a true count.
+
+        Args:
+            true_count (float): The true count.
+
+        Returns:
+            int: Bucket index, from 0 for min_count.
+        """
+        bucket = floor(true_count / self.bucket_width)
+        return min(max(bucket, self._first_bucket), self._last_bucket) - self._first_bucket
+
+    def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
+        true_count = self.count.true_count if self.count is not None else 0.0
+        table = self._tables[self.bucket(true_count)]
+        if hand.can_split:
+            state = PAIR_BASE + hand.cards[0].value
+        else:
+            state = (hand.is_soft * 2 + (len(hand.cards) == 2)) * NUM_TOTALS + hand.total
+        return table[state * NUM_UPCARDS + dealer_upcard.upcard_value]
+
+    def __repr__(self) -> str:
+        name = self.system if isinstance(self.system, str) else self.system.name
+        return f"DeviationStrategy(base={type(self.base.strategy).__name__}, deviations={len(self.deviations)}, system={name!r})"
@@ -1,8 +1,41 @@
-from cards import Card, Hand
+from cards import Card, Hand, RandomStream, Shoe
 from game.action import Action
 from abc import ABC, abstractmethod
 
 class Strategy(ABC):
     @abstractmethod
     def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
-        pass
\ No newline at end of file
+        pass
+
+    def bind_rng(self, rng: RandomStream) -> None:
+        """
+        Give the strategy its own random stream; called by Game for every player.
+        Deterministic strategies ignore it.
+
+        Args:
+            rng (RandomStream): The stream to draw from.
+        """
+        pass
+
+    def bind_shoe(self, shoe: Shoe) -> None:
+        """
+        Give the strategy the shoe it is dealt from; called by Game for every player.
+        Strategies that count cards keep the counts they need, see Shoe.track.
+
+        Args:
+            shoe (Shoe): The game's shoe.
+        """
+        pass
+
+    def bet_size(self, bet_amount: float) -> float:
+        """
+        Choose the wager of the next round, before any card is dealt; called by Game
+        for every player. Defaults to the game's bet amount.
+
+        Args:
+            bet_amount (float): The game's bet amount for the round.
+
+        Returns:
+            float: The amount to wager.
+        """
+        return bet_amount
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from analysis.bankroll import NetDistribution, simulate_bankrolls
+from cards import RandomStream
+from engine import BatchSimulation, Simulation
+from game import Game, Player
+from strategies import BasicStrategy, PerfectStrategy
+
+def test_distribution_moments_and_sampling():
+    distribution = NetDistribution([1, -1, 1.5], [3, 6, 1])
+    assert list(distribution.values) == [-1, 1, 1.5]
+    assert distribution.mean == pytest.approx(-0.6 + 0.3 + 0.15)
+    samples = distribution.sample(RandomStream(0), (200_000,))
+    assert samples.mean() == pytest.approx(distribution.mean, abs=0.01)
+    assert distribution.n0 == pytest.approx(distribution.variance / distribution.mean ** 2)
+    with pytest.raises(ValueError):
+        NetDistribution([1, 2], [0.5])
+
+def test_distribution_from_simulations():
+    batch = BatchSimulation(PerfectStrategy(), seed=1).run(5000)
+    assert NetDistribution.from_result(batch).mean == pytest.approx(batch.ev)
+    game = Game(players=[Player("P", 0.0, BasicStrategy())], num_decks=2, verbose=False)
+    result = Simulation(game).run(2000, seed=3, record=True)
+    distribution = NetDistribution.from_result(result, "P")
+    assert distribution.mean == pytest.approx(result.players["P"].net / 2000)
+    with pytest.raises(ValueError):
+        NetDistribution.from_result(Simulation(game).run(10))
+
+def test_ruin_matches_gamblers_ruin():
+    # Winning 60% of even-money rounds, ruin from B units has probability (2/3)^B
+    distribution = NetDistribution([-1, 1], [0.4, 0.6])
+    report = simulate_bankrolls(distribution, [5, 10], [1, 2], rounds=1000, paths=20_000, seed=1)
+    assert report.ruin_probability[0, 0] == pytest.approx((2 / 3) ** 5, abs=0.01)
+    assert report.ruin_probability[1, 0] == pytest.approx((2 / 3) ** 10, abs=0.005)
+    # Cells with the same bankroll in bet units see the same paths
+    assert report.ruin_probability[0, 0] == report.ruin_probability[1, 1]
+    assert report.time_to_double[0, 0, 0] == report.time_to_double[1, 1, 0]
+    assert (report.drawdown[1, 1] == 2 * report.drawdown[0, 0]).all()
+    assert len(report.rows()) == 4
+
+def test_drawdown_and_doubling_of_a_sure_thing():
+    report = simulate_bankrolls(NetDistribution([1], [1]), 10, [1, 3], rounds=50, paths=10, seed=0)
+    assert (report.ruin_probability == 0).all() and (report.double_probability == 1).all()
+    assert (report.drawdown == 0).all()
+    assert report.time_to_double[0, 0, 0] == 10 and report.time_to_double[0, 1, 0] == 4
+    assert np.isnan(simulate_bankrolls(NetDistribution([-1], [1]), 10, 1, rounds=50, paths=5).time_to_double).all()
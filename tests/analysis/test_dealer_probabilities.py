@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from analysis import DealerProbabilities, LRUCache
+from cards import RandomStream, Shoe
+from game import Rules
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache and cache.get("a") == 1 and cache.get("b") is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (2, 1, 1, 2)
+    assert info.hit_rate == pytest.approx(2 / 3)
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+def test_composition_keys_are_shared():
+    dealer = DealerProbabilities(Rules(num_decks=2))
+    # Removing a 5 and a 9 leaves the composition of removing a 9 and a 5
+    first = dealer.distribution(6, (0, 0, 0, 0, 1, 0, 0, 0, 1, 0))
+    composition = dealer.composition(6, (0, 0, 0, 0, 1, 0, 0, 0, 1, 0))
+    assert dealer.for_composition(6, tuple(composition)) is first
+    info = dealer.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    with pytest.raises(ValueError):
+        dealer.distribution(6, (9, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+
+def test_for_shoe_matches_removed_cards_and_is_bounded():
+    rules = Rules(num_decks=1, dealer_hits_soft_17=False)
+    dealer = DealerProbabilities(rules, cache_size=50)
+    shoe = Shoe(num_decks=1, rng=RandomStream(4))
+    upcard, hole = shoe.draw_card(), shoe.draw_card()
+    player = [shoe.draw_card(), shoe.draw_card()]
+    removed = [0] * 10
+    for card in player:
+        removed[(card.upcard_value - 1) % 10] += 1
+    expected = dealer.distribution(upcard.upcard_value, tuple(removed))
+    assert np.allclose(dealer.for_shoe(upcard, shoe, hole_card=hole), expected)
+    for _ in range(100):
+        dealer.for_shoe(upcard, shoe)
+        shoe.draw_card()
+    info = dealer.cache_info()
+    assert info.size == 50 and info.evictions > 0
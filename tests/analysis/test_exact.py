@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from analysis import DEALER_OUTCOMES, DealerProbabilities, ExactEV
+from cards import Card, Hand
+from engine import BatchSimulation
+from game import Action, Rules
+from strategies import PerfectStrategy, Strategy
+
+BLACKJACK = DEALER_OUTCOMES.index("blackjack")
+
+class AlwaysSplit(Strategy):
+    def next_move(self, hand: Hand, dealer_upcard: Card) -> Action:
+        return Action.SPLIT
+
+@pytest.mark.parametrize("hits_soft_17", [True, False])
+def test_dealer_distributions_sum_to_one(hits_soft_17):
+    table = DealerProbabilities(Rules(num_decks=2, dealer_hits_soft_17=hits_soft_17)).table()
+    assert np.allclose(table[2:].sum(axis=1), 1.0)
+    # A dealer blackjack is possible under both rules, with an Ace or a ten up
+    assert (table[[10, 11], BLACKJACK] > 0).all()
+    assert (table[2:10, BLACKJACK] == 0).all()
+
+def test_dealer_blackjack_probability_is_exact():
+    dealer = DealerProbabilities(Rules(num_decks=1, dealer_hits_soft_17=False))
+    assert dealer.distribution(11)[BLACKJACK] == pytest.approx(16 / 51)
+    assert dealer.distribution(10)[BLACKJACK] == pytest.approx(4 / 51)
+    # Removing all four Aces makes a blackjack under a ten impossible
+    assert dealer.distribution(10, (4, 0, 0, 0, 0, 0, 0, 0, 0, 0))[BLACKJACK] == 0.0
+
+def test_action_evs():
+    exact = ExactEV(Rules(num_decks=6, dealer_hits_soft_17=False))
+    hard_20 = exact.action_evs([10, 10], 6)
+    assert hard_20[Action.STAND] > 0.6 and hard_20[Action.STAND] > hard_20[Action.HIT]
+    eights = exact.action_evs([8, 8], 7)
+    assert eights[Action.SPLIT] > eights[Action.STAND]
+    assert set(exact.action_evs([5, 4, 2], 6)) == {Action.STAND, Action.HIT}
+    assert exact.action_evs([1, 10], 6) == {}
+
+def test_strategy_with_invalid_action_is_rejected():
+    with pytest.raises(ValueError):
+        ExactEV(Rules(num_decks=1), AlwaysSplit()).hand_ev([2, 3], 10)
+
+def test_round_ev_agrees_with_batch_simulation():
+    rules = Rules(num_decks=1, dealer_hits_soft_17=False)
+    chart = ExactEV(rules, PerfectStrategy())
+    batch = BatchSimulation(PerfectStrategy(), rules=rules, seed=5).run(300_000)
+    assert abs(chart.round_ev() - batch.ev) < 4 * batch.standard_error
+    # Optimal play is at least as good as the chart
+    optimal = ExactEV(rules, dealer=chart.dealer)
+    for cards, upcard in (([10, 6], 10), ([1, 7], 9), ([9, 9], 7), ([5, 6], 11)):
+        assert optimal.hand_ev(cards, upcard) >= chart.hand_ev(cards, upcard) - 1e-12
@@ -0,0 +1,41 @@
+import pytest
+from analysis import ExactEV
+from analysis import tables
+from analysis.tables import TABLE_SHAPES, load_tables, rules_key
+from game import Action, Rules
+from strategies import CompiledStrategy, PerfectStrategy
+
+RULES = Rules(num_decks=1, dealer_hits_soft_17=False)
+
+@pytest.fixture(scope="module")
+def cache(tmp_path_factory):
+    # Shared by the tests of this module, so the tables are derived only once
+    directory = tmp_path_factory.mktemp("tables")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("BLACKJACK_SIM_CACHE", str(directory))
+        yield directory
+
+def test_rules_key_ignores_penetration():
+    assert rules_key(RULES) == rules_key(Rules(num_decks=1, dealer_hits_soft_17=False, penetration_threshold=0.5))
+    assert rules_key(RULES) != rules_key(Rules(num_decks=1, dealer_hits_soft_17=True))
+    assert rules_key(RULES) != rules_key(Rules(num_decks=1, dealer_hits_soft_17=False, blackjack_multiplier=1.2))
+
+def test_tables_are_cached_on_disk(cache, monkeypatch):
+    derived = load_tables(RULES)
+    assert {name: table.shape for name, table in derived.items()} == TABLE_SHAPES
+    assert len(list(cache.glob("tables-*.npz"))) == 1
+    def fail(*args, **kwargs):
+        raise AssertionError("tables recomputed")
+    monkeypatch.setattr(tables, "optimal_tables", fail)
+    cached = load_tables(RULES)
+    assert all((cached[name] == derived[name]).all() for name in TABLE_SHAPES)
+
+def test_derived_strategy_beats_the_chart(cache):
+    strategy = PerfectStrategy(rules=RULES)
+    assert strategy.split_table[8, 6] is Action.SPLIT
+    assert strategy.hard_double_allowed_table[11, 6] is Action.DOUBLE_DOWN
+    assert strategy.hard_double_forbidden_table[17, 10] is Action.STAND
+    assert CompiledStrategy(strategy).verify() > 0
+    derived = ExactEV(RULES, strategy)
+    chart = ExactEV(RULES, PerfectStrategy(), dealer=derived.dealer)
+    assert derived.round_ev() > chart.round_ev()
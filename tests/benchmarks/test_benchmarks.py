@@ -0,0 +1,33 @@
+from benchmarks import Benchmark, compare, load_history, measure, save_run
+from benchmarks.__main__ import main
+from benchmarks.cases import BENCHMARKS
+
+def test_every_benchmark_runs():
+    names = [benchmark.name for benchmark in BENCHMARKS]
+    assert len(names) == len(set(names))
+    for benchmark in BENCHMARKS:
+        benchmark.setup()()
+
+def test_measure_reports_ops_per_second():
+    measurement = measure(Benchmark("sum", lambda: lambda: sum(range(100)), ops=100), repeats=3, min_time=0.001)
+    assert len(measurement.samples) == 3 and measurement.ops_per_sec > 0
+    assert measurement.calls >= 1 and measurement.spread >= 0
+
+def test_history_flags_regressions_past_the_threshold(tmp_path):
+    path = tmp_path / "history.json"
+    fast = measure(Benchmark("op", lambda: lambda: None), repeats=2, min_time=0.001)
+    save_run(path, [fast], label="baseline")
+    assert [run["label"] for run in load_history(path)] == ["baseline"]
+    slow = type(fast)("op", [sample / 2 for sample in fast.samples], fast.calls)
+    (comparison,) = compare([slow], load_history(path)[0], threshold=0.1)
+    assert comparison.change == -0.5 and comparison.regressed
+    assert not compare([fast], load_history(path)[0], threshold=0.1)[0].regressed
+
+def test_command_line_compares_with_the_latest_run(tmp_path, capsys):
+    path = tmp_path / "history.json"
+    arguments = ["-k", "card.*", "--repeats", "1", "--min-time", "0.001", "--history", str(path)]
+    assert main(arguments + ["--save"]) == 0
+    # A zero threshold fails on any slowdown; a huge one never does
+    main(arguments + ["--threshold", "0"])
+    assert main(arguments + ["--threshold", "1e9"]) == 0
+    assert "against" in capsys.readouterr().out
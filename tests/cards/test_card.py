@@ -61,4 +61,32 @@ def test_deck_contents():
     # make sure each rank-suit pair is present
     for suit in Card.SUITS:
         for rank in Card.RANKS:
-            assert Card(rank, suit) in deck
\ No newline at end of file
+            assert Card(rank, suit) in deck
+
+def test_cards_are_interned():
+    assert Card("Q", "Clubs") is Card("Q", "Clubs")
+    deck = Card.create_deck()
+    assert all(Card(c.rank, c.suit) is c for c in deck)
+
+def test_codes_follow_fresh_deck_order():
+    deck = Card.create_deck()
+    assert [c.code for c in deck] == list(range(52))
+    assert all(Card.from_code(c.code) is c for c in deck)
+    assert Card.CODE_VALUES[Card("K", "Spades").code] == 10
+    assert Card.CODE_UPCARD_VALUES[Card("A", "Hearts").code] == 11
+
+def test_precomputed_attributes():
+    ace = Card("A", "Clubs")
+    assert ace.is_ace is True
+    assert ace.rank_index == Card.RANKS.index("A")
+    assert Card("7", "Clubs").is_ace is False
+
+def test_cards_are_immutable():
+    c = Card("5", "Hearts")
+    with pytest.raises(AttributeError):
+        c.rank = "6"
+
+def test_pickle_preserves_identity():
+    import pickle
+    c = Card("9", "Diamonds")
+    assert pickle.loads(pickle.dumps(c)) is c
@@ -0,0 +1,72 @@
+import pytest
+from cards import COUNTING_SYSTEMS, CountingSystem, RandomStream, Shoe, counting_system, register_counting_system
+from game import Game, Player
+from strategies import BasicStrategy
+
+def test_builtin_systems():
+    assert {"hi-lo", "ko", "omega-ii", "zen"} <= set(COUNTING_SYSTEMS)
+    for name in ("hi-lo", "omega-ii", "zen"):
+        assert COUNTING_SYSTEMS[name].balanced
+        assert sum(COUNTING_SYSTEMS[name].code_weights()) == 0
+    ko = counting_system("ko")
+    assert ko.imbalance == 4 and ko.initial_count(6) == -20 and ko.initial_count(1) == 0
+    with pytest.raises(ValueError):
+        counting_system("no-such-count")
+    with pytest.raises(ValueError):
+        CountingSystem("short", (1, 2, 3))
+
+def test_draws_update_counts_incrementally():
+    shoe = Shoe(num_decks=2, penetration_threshold=0.9, rng=RandomStream(3))
+    hi_lo, zen = shoe.track("hi-lo"), shoe.track(COUNTING_SYSTEMS["zen"])
+    assert shoe.track("hi-lo") is hi_lo
+    dealt = [shoe.draw_card() for _ in range(40)]
+    for count in (hi_lo, zen):
+        weights = count.system.weights
+        assert count.running == sum(weights[card.value - 1] for card in dealt)
+        assert count.true_count == pytest.approx(count.running / (shoe.remaining / 52))
+    # A count tracked mid-shoe includes the cards already dealt
+    omega = shoe.track("omega-ii")
+    assert omega.running == sum(COUNTING_SYSTEMS["omega-ii"].weights[card.value - 1] for card in dealt)
+
+def test_counts_restart_on_reshuffle():
+    shoe = Shoe(num_decks=1, penetration_threshold=0.5, rng=RandomStream(1))
+    count = shoe.track("ko")
+    while not shoe.needs_reshuffle:
+        shoe.draw_card()
+    # Due for a reshuffle: the count already reads as the fresh shoe's
+    assert count.running == 0 and count.decks_remaining == 1
+    card = shoe.draw_card()
+    assert shoe.shoe_index == 1
+    assert count.running == count.system.weights[card.value - 1]
+
+def test_user_defined_system():
+    aces = register_counting_system(CountingSystem("aces", (1, 0, 0, 0, 0, 0, 0, 0, 0, 0)))
+    try:
+        shoe = Shoe(num_decks=1, shuffle_on_init=False)
+        count = shoe.track("aces")
+        assert not aces.balanced and count.initial == 0
+        for _ in range(13):
+            shoe.draw_card()
+        assert count.running == 1
+    finally:
+        del COUNTING_SYSTEMS["aces"]
+
+class CountingBettor(BasicStrategy):
+    def bind_shoe(self, shoe):
+        self.count = shoe.track("hi-lo")
+        self.bets = []
+
+    def bet_size(self, bet_amount):
+        bet = bet_amount * (2 if self.count.true_count >= 1 else 1)
+        self.bets.append(bet)
+        return bet
+
+def test_strategies_see_counts_and_size_bets():
+    strategy = CountingBettor()
+    player = Player("P", 0.0, strategy)
+    game = Game(players=[player], num_decks=2, verbose=False, seed=4, counting_systems=("zen",))
+    assert set(game.shoe.counts) == {"zen", "hi-lo"}
+    for _ in range(200):
+        game.play_round()
+    assert set(strategy.bets) == {1.0, 2.0}
+    assert player.stats.wagered >= sum(strategy.bets)
@@ -104,3 +104,28 @@ def test_display_and_str():
     assert hand.display() == expected
     assert str(hand) == expected
 
+
+def test_running_state_tracks_cards():
+    hand = Hand()
+    hand.add_card(Card("A", "Spades"))
+    assert (hand.total, hand.hard_total, hand.is_soft) == (11, 1, True)
+    hand.add_card(Card("A", "Hearts"))
+    assert hand.can_split is True
+    assert (hand.total, hand.hard_total, hand.is_soft) == (12, 2, True)
+    hand.add_card(Card("K", "Clubs"))
+    assert hand.can_split is False
+    assert (hand.total, hand.hard_total, hand.is_soft) == (12, 12, False)
+    hand.add_card(Card("Q", "Clubs"))
+    assert hand.is_bust is True
+
+def test_reset_clears_running_state():
+    hand = Hand()
+    hand.add_cards([Card("A", "Hearts"), Card("K", "Clubs")])
+    assert hand.is_blackjack is True
+    hand.reset()
+    assert hand.value == (0, "Hard")
+    assert hand.is_blackjack is False
+    assert hand.can_split is False
+    hand.add_cards([Card("9", "Hearts"), Card("9", "Clubs")])
+    assert hand.value == (18, "Hard")
+    assert hand.can_split is True
@@ -0,0 +1,42 @@
+import pickle
+from array import array
+from cards import RandomStream
+
+def test_same_seed_same_draws():
+    assert [RandomStream(1).random() for _ in range(3)] == [RandomStream(1).random() for _ in range(3)]
+
+def test_child_does_not_depend_on_parent_draws():
+    parent = RandomStream(8)
+    expected = parent.child(4).random()
+    for _ in range(10):
+        parent.random()
+    parent.spawn(2)
+    assert parent.child(4).random() == expected
+    assert parent.child(5).random() != expected
+
+def test_spawned_streams_differ():
+    first, second = RandomStream(2).spawn(2)
+    assert first.random() != second.random()
+
+def test_spawned_and_child_streams_do_not_alias():
+    spawned = RandomStream(3).spawn(4)
+    children = [RandomStream(3).child(k) for k in range(4)]
+    assert all(a.random() != b.random() for a, b in zip(spawned, children))
+
+def test_random_is_served_in_blocks():
+    stream = RandomStream(0)
+    values = [stream.random() for _ in range(RandomStream.BLOCK_SIZE + 1)]
+    assert all(0.0 <= v < 1.0 for v in values)
+    assert len(set(values)) == len(values)
+
+def test_shuffle_permutes_byte_buffer_in_place():
+    buffer = array('B', range(52))
+    RandomStream(4).shuffle(buffer)
+    assert sorted(buffer) == list(range(52))
+    assert list(buffer) != list(range(52))
+
+def test_stream_survives_pickling():
+    stream = RandomStream(6)
+    stream.random()
+    restored = pickle.loads(pickle.dumps(stream))
+    assert restored.random() == stream.random()
@@ -1,6 +1,5 @@
 import pytest
-import random
-from cards import Card, Shoe
+from cards import Card, RandomStream, Shoe
 
 def test_invalid_num_decks_raises():
     with pytest.raises(ValueError):
@@ -39,15 +38,14 @@ def test_reset_restores_cards():
     assert len(shoe) == 52
     assert shoe.draw_card() == Card("2", "Hearts")
 
-def test_shuffle_uses_random_shuffle(monkeypatch):
-    shoe = Shoe(num_decks=1, shuffle_on_init=False, penetration_threshold=0.5)
-    called = False
-    def fake_shuffle(lst):
-        nonlocal called
-        called = True
-    monkeypatch.setattr(random, "shuffle", fake_shuffle)
-    shoe.shuffle()
-    assert called, "shuffle() should call random.shuffle"
+def test_shuffle_uses_injected_rng():
+    first = Shoe(num_decks=1, rng=RandomStream(5))
+    second = Shoe(num_decks=1, rng=RandomStream(5))
+    assert first.cards == second.cards
+    assert first.cards != Card.create_deck()
+    first.shuffle()
+    second.shuffle()
+    assert first.cards == second.cards
 
 def test_draw_card_reduces_remaining_and_returns_card():
     shoe = Shoe(num_decks=1, shuffle_on_init=False, penetration_threshold=0.5)
@@ -69,4 +67,64 @@ def test_draw_card_triggers_reset_when_penetration_threshold_met():
     # next draw should reset (to 52) then pop → len=51
     card = shoe.draw_card()
     assert card == Card("2", "Hearts")
-    assert len(shoe) == 51
\ No newline at end of file
+    assert len(shoe) == 51
+
+def test_draw_advances_cursor_without_copying():
+    shoe = Shoe(num_decks=8, shuffle_on_init=False, penetration_threshold=0.5)
+    buffer = shoe._buffer
+    for _ in range(10):
+        shoe.draw_card()
+    assert shoe._buffer is buffer
+    assert len(buffer) == 52 * 8
+    assert shoe.remaining == 52 * 8 - 10
+    assert shoe.penetration == pytest.approx(10 / (52 * 8))
+    assert shoe.cards[0] == Card("Q", "Hearts")
+
+def test_reset_without_shuffle_restores_order_after_shuffle():
+    shoe = Shoe(num_decks=1, shuffle_on_init=True, penetration_threshold=0.5)
+    shoe.draw_card()
+    shoe.reset(shuffle=False)
+    assert shoe.cards == Card.create_deck()
+
+def test_shuffle_keeps_dealt_cards_in_place():
+    shoe = Shoe(num_decks=1, shuffle_on_init=False, penetration_threshold=0.5)
+    dealt = [shoe.draw_card() for _ in range(3)]
+    shoe.shuffle()
+    assert len(shoe) == 49
+    assert sorted(c.code for c in shoe.cards) == list(range(3, 52))
+    assert [Card.from_code(c) for c in shoe._buffer[:3]] == dealt
+
+def test_jump_to_reproduces_a_later_shoe():
+    shoe = Shoe(num_decks=1, penetration_threshold=0.5, rng=RandomStream(3))
+    for _ in range(26 * 3 + 1):
+        shoe.draw_card()
+    assert shoe.shoe_index == 3
+    third_shoe = [Card.from_code(code) for code in shoe._buffer]
+
+    replay = Shoe(num_decks=1, penetration_threshold=0.5, rng=RandomStream(3))
+    replay.jump_to(3)
+    assert replay.shoe_index == 3
+    assert replay.cards == third_shoe
+
+def test_composition_counts_remaining_values():
+    shoe = Shoe(num_decks=1, shuffle_on_init=False)
+    assert shoe.composition() == (4,) * 9 + (16,)
+    # Unshuffled order starts 2, 3, ..., K, A of hearts
+    for _ in range(13):
+        shoe.draw_card()
+    assert shoe.composition() == (3,) * 9 + (12,)
+
+def test_composition_follows_draws_resets_and_restores():
+    shoe = Shoe(num_decks=2, penetration_threshold=0.5, rng=RandomStream(7))
+    def counted():
+        counts = [0] * 10
+        for card in shoe.cards:
+            counts[(card.upcard_value - 1) % 10] += 1
+        return tuple(counts)
+    for _ in range(150):
+        shoe.draw_card()
+        assert shoe.composition() == counted()
+    state = shoe.get_state()
+    replay = Shoe(num_decks=2, penetration_threshold=0.5)
+    replay.set_state(state)
+    assert replay.composition() == shoe.composition()
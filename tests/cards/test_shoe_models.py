@@ -0,0 +1,34 @@
+import pytest
+from cards import Card, ContinuousShuffler, InfiniteShoe, RandomStream, Shoe, shoe_model
+
+def test_continuous_shuffler_returns_cards_after_the_round():
+    machine = ContinuousShuffler(num_decks=1, rng=RandomStream(2))
+    count = machine.track("hi-lo")
+    drawn = [machine.draw_card() for _ in range(52)]
+    # Within a round the machine deals without replacement: exactly one deck
+    assert sorted(card.rank for card in drawn) == sorted(Card.RANKS * 4)
+    assert machine.remaining == 0 and count.running == 0
+    machine.end_round()
+    assert machine.remaining == 52 and machine.shoe_index == 1
+    assert machine.composition() == (4,) * 9 + (16,)
+    card = machine.draw_card()
+    assert count.running == count.weights[card.code]
+    assert sum(machine.composition()) == 51
+
+def test_infinite_shoe_is_reproducible_and_restorable():
+    first, second = InfiniteShoe(rng=RandomStream(5)), InfiniteShoe(rng=RandomStream(5))
+    assert [first.draw_card() for _ in range(5000)] == [second.draw_card() for _ in range(5000)]
+    state = first.get_state()
+    expected = [first.draw_card() for _ in range(10)]
+    second.set_state(state)
+    assert [second.draw_card() for _ in range(10)] == expected
+    assert first.remaining == 6 * 52 and not first.needs_reshuffle
+    # Reseeding through jump_to drops the pregenerated block
+    first.rng = RandomStream(5)
+    first.jump_to(0)
+    assert first.draw_card() == InfiniteShoe(rng=RandomStream(5)).draw_card()
+
+def test_shoe_model_lookup():
+    assert shoe_model("shoe") is Shoe and shoe_model("csm") is ContinuousShuffler
+    with pytest.raises(ValueError):
+        shoe_model("eight-deck")
@@ -0,0 +1,23 @@
+import copy
+
+import pytest
+from game import Game, Player
+from strategies import BasicStrategy, PerfectStrategy
+
+# Players of the games built by make_game, by name
+DEFAULT_PLAYERS = {"Basic": BasicStrategy, "Perfect": PerfectStrategy}
+
+@pytest.fixture
+def make_game():
+    """
+    Factory of small quiet games for the tests.
+
+    make_game(players, bankroll=0.0, num_decks=2, **kwargs) seats one player per
+    entry of players (name -> strategy class, or instance to copy; DEFAULT_PLAYERS
+    if omitted), each with a fresh strategy, and passes the other keywords on to Game.
+    """
+    def make(players=None, bankroll=0.0, num_decks=2, verbose=False, **kwargs):
+        seated = [Player(name, bankroll, strategy() if isinstance(strategy, type) else copy.deepcopy(strategy))
+                  for name, strategy in (players or DEFAULT_PLAYERS).items()]
+        return Game(players=seated, num_decks=num_decks, verbose=verbose, **kwargs)
+    return make
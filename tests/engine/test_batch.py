@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from engine.batch import BatchSimulation, action_codes
+from game import Action, Game, Player, Rules
+from strategies import BasicStrategy, CompiledStrategy, PerfectStrategy
+
+def test_action_codes_maps_actions_and_blanks():
+    table = np.full((2, 2), np.nan, dtype=object)
+    table[0, 0] = Action.SPLIT
+    table[1, 1] = Action.HIT
+    codes = action_codes(table)
+    assert codes.tolist() == [[Action.SPLIT.value, 0], [0, Action.HIT.value]]
+
+def test_requires_table_driven_strategy():
+    with pytest.raises(ValueError):
+        BatchSimulation(BasicStrategy())
+
+def test_same_seed_reproduces_results():
+    first = BatchSimulation(PerfectStrategy(), seed=7, batch_size=1000).run(5000)
+    second = BatchSimulation(PerfectStrategy(), seed=7, batch_size=1000).run(5000)
+    assert np.array_equal(first.net, second.net)
+    assert first.rounds == 5000
+
+def test_splits_and_doubles_happen():
+    result = BatchSimulation(PerfectStrategy(), seed=3).run(20000)
+    assert (result.hands > 1).any()
+    # Doubled hands and blackjacks show up as non-unit results
+    assert np.isin(2.0, result.net) and np.isin(1.5, result.net)
+
+@pytest.mark.parametrize("hits_soft_17", [True, False])
+def test_statistically_equivalent_to_game(hits_soft_17):
+    rules = Rules(num_decks=6, dealer_hits_soft_17=hits_soft_17)
+    batch = BatchSimulation(PerfectStrategy(), rules=rules, seed=11).run(300_000)
+
+    player = Player("Perfect", bankroll=0.0, strategy=PerfectStrategy())
+    game = Game(players=[player], dealer_hits_soft_17=hits_soft_17, num_decks=6,
+                verbose=False, seed=11)
+    nets = []
+    for _ in range(30_000):
+        before = player.bankroll
+        game.play_round()
+        nets.append(player.bankroll - before)
+    nets = np.array(nets)
+    game_se = nets.std(ddof=1) / len(nets) ** 0.5
+
+    tolerance = 4 * (batch.standard_error ** 2 + game_se ** 2) ** 0.5
+    assert abs(batch.ev - nets.mean()) < tolerance
+
+def test_accepts_compiled_strategy():
+    compiled = BatchSimulation(CompiledStrategy(PerfectStrategy()), seed=7, batch_size=1000).run(5000)
+    table_driven = BatchSimulation(PerfectStrategy(), seed=7, batch_size=1000).run(5000)
+    assert np.array_equal(compiled.net, table_driven.net)
+    assert BatchSimulation(CompiledStrategy(BasicStrategy()), seed=7).run(1000).rounds == 1000
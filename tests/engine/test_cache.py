@@ -0,0 +1,46 @@
+import pytest
+from engine import ResultCache, Simulation
+from engine.cache import run_key, strategy_fingerprint
+from strategies import DeviationStrategy, PerfectStrategy, RandomStrategy
+
+COUNTER = DeviationStrategy()
+
+PLAYERS = {"Random": RandomStrategy, "Counter": COUNTER}
+
+def test_repeat_run_is_served_from_the_cache(tmp_path, make_game):
+    cache = ResultCache(tmp_path)
+    first_game = make_game(PLAYERS)
+    first = Simulation(first_game).run(400, seed=3, cache=cache)
+    game = make_game(PLAYERS)
+    repeat = Simulation(game).run(400, seed=3, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert repeat.players["Counter"].as_dict() == first.players["Counter"].as_dict()
+    # The game is left as the run left it: bankrolls, tallies and the next rounds
+    assert [p.bankroll for p in game.players] == [p.bankroll for p in first_game.players]
+    first_game.play_round()
+    game.play_round()
+    assert [p.bankroll for p in game.players] == [p.bankroll for p in first_game.players]
+
+def test_longer_run_extends_the_cached_one(tmp_path, make_game):
+    cache = ResultCache(tmp_path)
+    Simulation(make_game(PLAYERS)).run(300, seed=5, cache=cache)
+    extended = Simulation(make_game(PLAYERS)).run(700, seed=5, cache=cache)
+    reference = Simulation(make_game(PLAYERS)).run(700, seed=5)
+    assert cache.extensions == 1 and extended.rounds == 700
+    for name in ("Random", "Counter"):
+        assert extended.players[name].as_dict() == pytest.approx(reference.players[name].as_dict())
+
+def test_key_covers_the_run_specification(make_game):
+    game = make_game(PLAYERS)
+    assert run_key(game, 1, 1) == run_key(make_game(PLAYERS), 1, 1)
+    assert run_key(game, 1, 1) != run_key(game, 2, 1)
+    assert run_key(game, 1, 1) != run_key(make_game(PLAYERS, bankroll=10.0), 1, 1)
+    assert strategy_fingerprint(PerfectStrategy()) == strategy_fingerprint(PerfectStrategy())
+    assert strategy_fingerprint(COUNTER) != strategy_fingerprint(DeviationStrategy(system="ko"))
+
+def test_eviction_keeps_the_cache_bounded(tmp_path, make_game):
+    cache = ResultCache(tmp_path, max_bytes=1)
+    Simulation(make_game(PLAYERS)).run(50, seed=1, cache=cache)
+    assert cache.size() == 0
+    with pytest.raises(ValueError):
+        Simulation(make_game(PLAYERS)).run(50, cache=cache)
@@ -0,0 +1,69 @@
+import pytest
+from engine import Simulation
+from engine.checkpoint import read_checkpoint
+from game import EventSink
+from strategies import DeviationStrategy, PerfectStrategy, RandomStrategy
+
+PLAYERS = {"Random": RandomStrategy, "Perfect": PerfectStrategy, "Counter": DeviationStrategy}
+
+class Crash(EventSink):
+    """Kills the run when a given round is settled."""
+    def __init__(self, round_index):
+        self.round_index = round_index
+
+    def handle(self, event):
+        if event.kind == "settle" and event.round == self.round_index:
+            raise RuntimeError("preempted")
+
+def test_resume_continues_bit_for_bit(tmp_path, make_game):
+    reference_game = make_game(PLAYERS, counting_systems=("ko",))
+    reference = Simulation(reference_game).run(1500, seed=3)
+
+    path = tmp_path / "run.ckpt"
+    game = make_game(PLAYERS, counting_systems=("ko",))
+    game.subscribe(Crash(1234))
+    with pytest.raises(RuntimeError):
+        Simulation(game).run(1500, seed=3, checkpoint=path, checkpoint_rounds=500)
+    assert read_checkpoint(path).completed == 1000
+
+    resumed = Simulation.resume(path)
+    assert resumed.rounds == 1500
+    for name, stats in reference.players.items():
+        assert resumed.players[name] == stats
+    # The finished run leaves a final checkpoint, and resuming it plays nothing more
+    assert read_checkpoint(path).completed == 1500
+    assert Simulation.resume(path).players == resumed.players
+
+def test_checkpointed_run_matches_plain_run(tmp_path, make_game):
+    plain = Simulation(make_game(PLAYERS, counting_systems=("ko",))).run(300, seed=8)
+    checkpointed = Simulation(make_game(PLAYERS, counting_systems=("ko",))).run(300, seed=8, checkpoint=tmp_path / "run.ckpt", checkpoint_seconds=0.01)
+    assert checkpointed.players == plain.players
+
+def test_rejects_corrupted_and_foreign_files(tmp_path, make_game):
+    path = tmp_path / "run.ckpt"
+    Simulation(make_game(PLAYERS, counting_systems=("ko",))).run(10, seed=1, checkpoint=path)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="corrupted"):
+        read_checkpoint(path)
+    path.write_text("not a checkpoint")
+    with pytest.raises(ValueError):
+        read_checkpoint(path)
+
+def test_checkpoints_require_an_in_process_run(tmp_path, make_game):
+    with pytest.raises(ValueError):
+        Simulation(make_game(PLAYERS, counting_systems=("ko",))).run(10, workers=2, checkpoint=tmp_path / "run.ckpt")
+
+def test_resume_continuous_shuffler(tmp_path):
+    from game import GameConfig, PlayerConfig, Rules
+    config = GameConfig(players=(PlayerConfig("P", strategy="PerfectStrategy"),),
+                        rules=Rules(num_decks=2, shoe_model="csm"), counting_systems=("hi-lo",))
+    reference = Simulation(config.build()).run(600, seed=8)
+    path = tmp_path / "csm.ckpt"
+    game = config.build()
+    game.subscribe(Crash(450))
+    with pytest.raises(RuntimeError):
+        Simulation(game).run(600, seed=8, checkpoint=path, checkpoint_rounds=200)
+    resumed = Simulation.resume(path)
+    assert resumed.players["P"].as_dict() == reference.players["P"].as_dict()
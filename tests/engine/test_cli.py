@@ -0,0 +1,81 @@
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import pytest
+from engine.cli import RunConfig, main
+from strategies import DeviationStrategy, PerfectStrategy
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+# Generous enough for a loaded CI machine; NumPy alone takes about this long to import.
+IMPORT_BUDGET = 0.25
+
+TOML_CONFIG = """
+rounds = 200
+seed = 5
+counting_systems = ["hi-lo"]
+
+[rules]
+num_decks = 2
+
+[[players]]
+name = "Perfect"
+strategy = "PerfectStrategy"
+
+[[players]]
+name = "Counter"
+strategy = { class = "DeviationStrategy", system = "hi-lo" }
+"""
+
+def test_toml_config_builds_the_game(tmp_path):
+    path = tmp_path / "run.toml"
+    path.write_text(TOML_CONFIG)
+    run = RunConfig.from_file(path)
+    assert run.rounds == 200 and run.seed == 5 and run.workers == 1
+    assert run.game.rules.num_decks == 2
+    game = run.game.build()
+    assert isinstance(game.players[0].strategy, PerfectStrategy)
+    assert isinstance(game.players[1].strategy, DeviationStrategy)
+
+def test_json_run_matches_toml_run(tmp_path, capsys):
+    toml_path = tmp_path / "run.toml"
+    toml_path.write_text(TOML_CONFIG)
+    json_path = tmp_path / "run.json"
+    json_path.write_text(json.dumps({
+        "rounds": 200, "seed": 5, "counting_systems": ["hi-lo"], "rules": {"num_decks": 2},
+        "players": [{"name": "Perfect", "strategy": "PerfectStrategy"},
+                    {"name": "Counter", "strategy": {"class": "DeviationStrategy", "system": "hi-lo"}}],
+    }))
+    assert main([str(toml_path), "--json"]) == 0
+    from_toml = json.loads(capsys.readouterr().out)
+    assert main([str(json_path), "--json"]) == 0
+    from_json = json.loads(capsys.readouterr().out)
+    assert from_toml == from_json
+    assert from_toml["rounds"] == 200 and set(from_toml["players"]) == {"Perfect", "Counter"}
+
+@pytest.mark.parametrize("text", [
+    'rounds = 10\n[rules]\nsurrender = true\n[[players]]\nname = "P"\n',
+    'rounds = 10\n[[players]]\nbankroll = 5.0\n',
+])
+def test_invalid_config_is_reported(tmp_path, text):
+    path = tmp_path / "run.toml"
+    path.write_text(text)
+    with pytest.raises(SystemExit):
+        main([str(path)])
+
+def test_import_time_budget():
+    # A fresh interpreter, so nothing is already cached in sys.modules.
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import engine.cli, game, strategies\n"
+        "from strategies import BasicStrategy\n"
+        "print(time.perf_counter() - start, 'numpy' in sys.modules)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True,
+                            text=True, check=True).stdout.split()
+    elapsed, numpy_loaded = float(output[0]), output[1] == "True"
+    assert not numpy_loaded
+    assert elapsed < IMPORT_BUDGET
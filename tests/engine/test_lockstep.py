@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from cards import RandomStream
+from engine import LockstepSimulation
+from game import Game, Player, Rules
+from strategies import BasicStrategy, CompiledStrategy, DeviationStrategy, PerfectStrategy
+
+RULES = Rules(num_decks=2, penetration_threshold=0.6)
+
+def seat_strategies():
+    return [CompiledStrategy(PerfectStrategy()), DeviationStrategy()]
+
+def test_requires_table_driven_strategy():
+    with pytest.raises(ValueError):
+        LockstepSimulation(BasicStrategy(), tables=2)
+
+def test_tables_replay_games_card_for_card():
+    tables, rounds = 4, 150
+    result = LockstepSimulation(seat_strategies(), tables=tables, rules=RULES,
+                                counting_systems=("ko",), seed=21).run(rounds)
+    assert result.net.shape == (rounds, tables, 2)
+    for table in range(tables):
+        players = [Player(f"seat{i}", bankroll=0.0, strategy=strategy)
+                   for i, strategy in enumerate(seat_strategies())]
+        game = Game(players=players, num_decks=2, penetration_threshold=0.6, verbose=False,
+                    rng=RandomStream(21).child(table), counting_systems=("ko",))
+        for round_index in range(rounds):
+            assert game.shoe.counts["ko"].true_count == result.true_counts["ko"][round_index, table]
+            before = [player.bankroll for player in players]
+            game.play_round()
+            nets = [player.bankroll - start for player, start in zip(players, before)]
+            assert nets == result.net[round_index, table].tolist()
+        assert game.shoe.shoe_index == result.shoes[table]
+
+def test_counts_match_the_dealt_cards_at_every_table():
+    simulation = LockstepSimulation(CompiledStrategy(PerfectStrategy()), tables=50, rules=RULES,
+                                    counting_systems=("hi-lo",), seed=4)
+    result = simulation.run(40)
+    # Tables go through their shoes at different paces
+    assert (result.shoes > 0).all() and len(np.unique(simulation.cursor)) > 1
+    weights = simulation.weights[0]
+    for table in range(simulation.tables):
+        dealt = simulation.ranks[table, :simulation.cursor[table]]
+        assert simulation.running[0, table] == pytest.approx(weights[dealt].sum())
+
+def test_seat_results_flatten_for_analysis():
+    result = LockstepSimulation(CompiledStrategy(PerfectStrategy()), tables=200, seed=9).run(50)
+    flat = result.for_seat(0)
+    assert flat.rounds == 200 * 50
+    assert flat.ev == pytest.approx(result.ev(0))
+    assert 0 < result.standard_error(0) < 0.1
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from engine import OutcomeRecorder, OutcomeTable, Simulation
+from game import Action, unpack_actions
+
+def test_recorder_grows_in_chunks(make_game):
+    game = make_game(seed=3)
+    game.recorder = OutcomeRecorder(chunk_size=16)
+    for _ in range(200):
+        game.play_round()
+    columns = game.recorder.columns()
+    hands = sum(player.stats.hands for player in game.players)
+    assert len(game.recorder) == hands
+    assert all(len(column) == hands for column in columns.values())
+
+def test_recorded_columns_match_statistics(make_game):
+    game = make_game(seed=3)
+    result = Simulation(game).run(1000, seed=4, record=True)
+    table = result.outcomes
+    for index, name in enumerate(("Basic", "Perfect")):
+        stats = result.players[name]
+        rows = table.for_player(name)
+        assert len(rows) == stats.hands
+        assert rows["net"].sum() == pytest.approx(stats.net)
+        assert rows["doubled"].sum() == stats.doubles
+        assert np.all(rows["player"] == index)
+    assert table["round"].min() == 0 and table["round"].max() == 999
+
+def test_round_statistics_match_player_statistics(make_game):
+    result = Simulation(make_game(seed=3)).run(800, seed=6, record=True)
+    stats = result.players["Perfect"]
+    rows = result.outcomes.for_player("Perfect")
+    assert len(rows.round_net()) == stats.rounds
+    assert rows.ev(per="round") == pytest.approx(stats.ev_per_round)
+    assert rows.standard_error(per="round") == pytest.approx(stats.standard_error)
+    low, high = rows.confidence_interval(0.95, per="round")
+    assert low < rows.ev(per="round") < high
+    with pytest.raises(ValueError):
+        rows.ev(per="shoe")
+
+def test_actions_are_packed_in_order(make_game):
+    game = make_game(seed=3)
+    game.recorder = OutcomeRecorder()
+    for _ in range(300):
+        game.play_round()
+    columns = game.recorder.columns()
+    for packed, doubled in zip(columns["actions"], columns["doubled"]):
+        actions = unpack_actions(int(packed))
+        assert doubled == (bool(actions) and actions[-1] is Action.DOUBLE_DOWN)
+
+def test_parallel_recording_is_merged(make_game):
+    result = Simulation(make_game(seed=3)).run(1000, workers=2, seed=8, record=True)
+    table = result.outcomes
+    assert len(table) == sum(stats.hands for stats in result.players.values())
+    assert len(np.unique(table["round"])) == 1000
+
+def test_concatenate_offsets_rounds(make_game):
+    game = make_game(seed=3)
+    game.recorder = OutcomeRecorder()
+    game.play_round()
+    table = OutcomeTable(game.recorder.columns(), ["Basic", "Perfect"])
+    combined = OutcomeTable.concatenate([table, table], [0, 1])
+    assert len(combined) == 2 * len(table)
+    assert set(combined["round"]) == {0, 1}
@@ -0,0 +1,84 @@
+import pytest
+from engine import Simulation
+from engine.simulation import plan_batch, shard_rounds, worker_streams
+from game import GameConfig, PlayerConfig
+from strategies import PerfectStrategy
+
+def test_shard_rounds_covers_all_rounds():
+    assert shard_rounds(10, 3) == [4, 3, 3]
+    assert sum(shard_rounds(1001, 4)) == 1001
+
+def test_worker_streams_are_reproducible_and_distinct():
+    entropy, streams = worker_streams(42, 4)
+    assert entropy == 42
+    first = [stream.random() for stream in streams]
+    assert [stream.random() for stream in worker_streams(42, 4)[1]] == first
+    assert len(set(first)) == 4
+
+def test_in_process_run_reports_tallies(make_game):
+    game = make_game()
+    result = Simulation(game).run(500, seed=1)
+    basic = result.players["Basic"]
+    assert result.rounds == 500 and basic.rounds == 500
+    assert basic.wins + basic.losses + basic.pushes == basic.hands
+    assert game.players[0].bankroll == pytest.approx(basic.net)
+    assert game.players[0].stats == basic
+
+def test_in_process_run_is_reproducible(make_game):
+    first = Simulation(make_game()).run(300, seed=9)
+    second = Simulation(make_game()).run(300, seed=9)
+    assert first.players["Perfect"] == second.players["Perfect"]
+
+def test_parallel_run_is_reproducible_and_merged(make_game):
+    game = make_game()
+    first = Simulation(game).run(2000, workers=2, seed=5)
+    second = Simulation(make_game()).run(2000, workers=2, seed=5)
+    assert first.rounds == 2000
+    for name in ("Basic", "Perfect"):
+        assert first.players[name] == second.players[name]
+        assert first.players[name].rounds == 2000
+    assert game.players[1].bankroll == pytest.approx(first.players["Perfect"].net)
+
+def test_game_config_round_trip(make_game):
+    game = make_game()
+    config = GameConfig.from_game(game)
+    rebuilt = config.build()
+    assert rebuilt.rules == game.rules
+    assert [p.name for p in rebuilt.players] == ["Basic", "Perfect"]
+    assert rebuilt.players[0].strategy is not game.players[0].strategy
+
+def test_player_config_resolves_strategy_names():
+    assert isinstance(PlayerConfig("p", strategy="PerfectStrategy").build().strategy, PerfectStrategy)
+    with pytest.raises(ValueError):
+        PlayerConfig("p", strategy="NoSuchStrategy").build()
+
+def test_plan_batch_projects_rounds_to_target():
+    # Halving the standard error takes four times the rounds
+    assert plan_batch(1000, 1.0, 0.2, target_se=0.1) == 1000
+    assert plan_batch(1000, 1.0, 0.125, target_se=0.1) == 563
+    assert plan_batch(1000, 2.0, float("inf"), time_left=0.5) == 250
+    assert plan_batch(1000, 1.0, 0.05, target_se=0.1) == 1000
+
+def test_run_until_requires_a_criterion(make_game):
+    with pytest.raises(ValueError):
+        Simulation(make_game()).run_until()
+    with pytest.raises(ValueError):
+        Simulation(make_game()).run_until(max_rounds=10, player="Nobody")
+
+def test_run_until_reaches_target_standard_error(make_game):
+    result = Simulation(make_game()).run_until(target_se=0.03, player="Perfect", seed=2)
+    estimate = result.estimates["Perfect"]
+    assert result.stop_reason == "precision"
+    assert estimate.standard_error <= 0.03 and estimate.batches >= 20
+    stats = result.players["Perfect"]
+    assert estimate.units == stats.hands
+    assert estimate.mean == pytest.approx(stats.net / stats.hands)
+    low, high = estimate.confidence_interval()
+    assert low < estimate.mean < high
+
+def test_run_until_stops_at_max_rounds_and_time_budget(make_game):
+    result = Simulation(make_game()).run_until(target_se=1e-6, max_rounds=1500, seed=3)
+    assert result.stop_reason == "max_rounds" and result.rounds == 1500
+    result = Simulation(make_game()).run_until(time_budget=0.2, seed=3)
+    assert result.stop_reason == "time"
+    assert result.players["Basic"].rounds == result.rounds
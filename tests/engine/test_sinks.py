@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from engine import (
+    ChunkSink, NpyChunkSink, NpzChunkSink, OutcomeReader, OutcomeRecorder, RunningMoments, Simulation, open_sink
+)
+from engine.sinks import write_manifest
+
+def test_running_moments_match_numpy():
+    samples = np.random.default_rng(0).normal(0.5, 2.0, 10_001)
+    moments = RunningMoments()
+    for batch in np.array_split(samples, 7):
+        moments.update(batch)
+    assert moments.count == len(samples)
+    assert moments.mean == pytest.approx(samples.mean())
+    assert moments.variance == pytest.approx(samples.var(ddof=1))
+    low, high = moments.confidence_interval()
+    assert low < moments.mean < high
+
+@pytest.mark.parametrize("sink_cls", [NpzChunkSink, NpyChunkSink])
+def test_chunks_round_trip(tmp_path, sink_cls, make_game):
+    game = make_game(seed=3)
+    game.recorder = OutcomeRecorder(chunk_size=50, sink=sink_cls(tmp_path))
+    for _ in range(300):
+        game.play_round()
+    game.recorder.close()
+    write_manifest(tmp_path, sink_cls.format, ["Basic", "Perfect"], [0])
+    reader = OutcomeReader(tmp_path)
+    hands = sum(player.stats.hands for player in game.players)
+    assert game.recorder.sink.chunks == -(-hands // 50)
+    assert len(reader) == hands
+    assert all(len(chunk["net"]) <= 50 for chunk in reader.chunks(["net"]))
+    assert reader.table()["net"].sum() == pytest.approx(sum(p.stats.net for p in game.players))
+    # Rounds straddling chunk boundaries are still summed as one round
+    for player in game.players:
+        moments = reader.moments(player.name, per="round")
+        assert moments.count == player.stats.rounds
+        assert moments.variance == pytest.approx(player.stats.variance_per_round)
+    with pytest.raises(TypeError):
+        game.recorder.columns()
+
+def test_chunks_past_the_name_padding_stay_in_round_order(tmp_path, make_game):
+    game = make_game(seed=3)
+    sink = NpyChunkSink(tmp_path)
+    sink.chunks = 99_995
+    game.recorder = OutcomeRecorder(chunk_size=20, sink=sink)
+    for _ in range(100):
+        game.play_round()
+    game.recorder.close()
+    assert sink.chunks > 100_000
+    write_manifest(tmp_path, "npy", ["Basic", "Perfect"], [0])
+    reader = OutcomeReader(tmp_path)
+    assert (np.diff(reader.table()["round"]) >= 0).all()
+    for player in game.players:
+        moments = reader.moments(player.name, per="round")
+        assert moments.count == player.stats.rounds
+        assert moments.variance == pytest.approx(player.stats.variance_per_round)
+
+def test_streamed_round_moments_match_statistics(tmp_path, make_game):
+    result = Simulation(make_game(seed=3)).run(700, seed=2, output=tmp_path, output_format="npy")
+    reader = result.outcomes
+    assert isinstance(reader, OutcomeReader)
+    for name, stats in result.players.items():
+        moments = reader.moments(name, per="round")
+        assert moments.count == stats.rounds
+        assert moments.mean == pytest.approx(stats.ev_per_round)
+        assert moments.variance == pytest.approx(stats.variance_per_round)
+        assert reader.moments(name).count == stats.hands
+    table = reader.table()
+    assert reader.moments(per="round").mean == pytest.approx(table.ev(per="round"))
+
+def test_parallel_run_writes_one_part_per_worker(tmp_path, make_game):
+    result = Simulation(make_game(seed=3)).run(1000, workers=2, seed=8, output=tmp_path, output_format="npz")
+    reader = result.outcomes
+    assert reader.round_offsets == [0, 500]
+    table = reader.table()
+    assert len(np.unique(table["round"])) == 1000
+    assert table.for_player("Basic")["net"].sum() == pytest.approx(result.players["Basic"].net)
+
+def test_open_sink_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink(tmp_path, "csv")
+
+def test_sinks_without_a_writer_are_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        ChunkSink(tmp_path)
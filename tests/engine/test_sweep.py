@@ -0,0 +1,40 @@
+import pytest
+from engine import Sweep
+from game import Rules
+
+GRID = {"num_decks": [1, 6], "blackjack_multiplier": [1.5, 1.2]}
+
+def test_cells_are_independent_of_workers_and_grid():
+    sweep = Sweep(GRID, ["PerfectStrategy", "BasicStrategy"], rounds=300, seed=4, chunk_rounds=100)
+    serial = sweep.run()
+    parallel = sweep.run(workers=2)
+    assert [cell.stats for cell in serial.cells] == [cell.stats for cell in parallel.cells]
+    assert len(serial.cells) == 8 and serial.cells[0].rules == Rules(num_decks=1, blackjack_multiplier=1.5)
+    # A cell is played the same inside a smaller grid
+    single = Sweep({"num_decks": [6]}, ["BasicStrategy"], rounds=300, seed=4, chunk_rounds=100,
+                   rules=Rules(blackjack_multiplier=1.2)).run()
+    assert single.cells[0].stats == serial.cells[-1].stats
+
+def test_rerun_skips_finished_cells(tmp_path):
+    store = tmp_path / "sweep.jsonl"
+    first = Sweep({"num_decks": [2]}, ["PerfectStrategy"], rounds=200, seed=1, chunk_rounds=64).run(store=store)
+    wider = Sweep({"num_decks": [2, 4]}, ["PerfectStrategy"], rounds=200, seed=1, chunk_rounds=64).run(store=store)
+    assert [cell.cached for cell in wider.cells] == [True, False]
+    assert wider.cells[0].stats == first.cells[0].stats
+    rows = wider.rows()
+    assert rows[1]["num_decks"] == 4 and rows[1]["rounds"] == 200 and "standard_error" in rows[1]
+    assert "ev/round" in wider.summary()
+
+def test_store_tells_strategies_and_counts_apart(tmp_path):
+    store = tmp_path / "sweep.jsonl"
+    Sweep({"num_decks": [2]}, {"player": "PerfectStrategy"}, rounds=50, seed=1).run(store=store)
+    relabelled = Sweep({"num_decks": [2]}, {"player": "BasicStrategy"}, rounds=50, seed=1).run(store=store)
+    counted = Sweep({"num_decks": [2]}, {"player": "PerfectStrategy"}, rounds=50, seed=1,
+                    counting_systems=("hi-lo",)).run(store=store)
+    assert not relabelled.cells[0].cached and not counted.cells[0].cached
+
+def test_invalid_grid_raises():
+    with pytest.raises(ValueError):
+        Sweep({"surrender": [True]}, ["PerfectStrategy"], rounds=10)
+    with pytest.raises(ValueError):
+        Sweep({"num_decks": [1]}, ["PerfectStrategy", "PerfectStrategy"], rounds=10)
@@ -58,9 +58,10 @@ def test_play_hits_on_soft_17_when_hitting_soft_17():
     shoe = Shoe(num_decks=1, shuffle_on_init=False)
     # Next draw would be 2♥, 3♥, 4♥, 5♥, ...
     dealer.play(shoe)
-    # Hand length goes from 2 → 6 and last card is 5♥
-    assert len(dealer.hand) == 6
-    assert dealer.hand.cards[-1] == Card("5", "Hearts")
+    # Soft 17 draws 2♥ and stands on soft 19
+    assert len(dealer.hand) == 3
+    assert dealer.hand.cards[-1] == Card("2", "Hearts")
+    assert dealer.hand.total == 19
 
 def test_repr_shows_hand_and_flag():
     # Seed a known hand so str(hand) is predictable
@@ -0,0 +1,54 @@
+import json
+from game import EVENT_KINDS, EventCounter, EventLogger, EventRecorder
+from strategies import BasicStrategy
+
+PLAYERS = {"A": BasicStrategy, "B": BasicStrategy}
+
+def test_path_follows_subscribers(make_game):
+    game = make_game(PLAYERS, seed=8)
+    assert game._play_round == game._play_round_fast
+    sink = EventCounter()
+    game.subscribe(sink)
+    assert game._play_round == game._play_round_traced
+    game.unsubscribe(sink)
+    assert game._play_round == game._play_round_fast
+
+def test_traced_rounds_play_the_same_game(make_game):
+    fast, traced = make_game(PLAYERS, seed=8), make_game(PLAYERS, seed=8)
+    traced.subscribe(EventRecorder())
+    for _ in range(300):
+        fast.play_round()
+        traced.play_round()
+    for a, b in zip(fast.players, traced.players):
+        assert a.stats == b.stats and a.bankroll == b.bankroll
+
+def test_events_describe_the_rounds(tmp_path, make_game):
+    game = make_game(PLAYERS, seed=8)
+    counter, recorder = EventCounter(), EventRecorder()
+    game.subscribe(counter)
+    game.subscribe(recorder)
+    for _ in range(200):
+        game.play_round()
+    assert set(counter.counts) <= set(EVENT_KINDS)
+    stats = [player.stats for player in game.players]
+    assert counter.counts["settle"] == sum(s.hands for s in stats)
+    assert counter.counts["split"] == sum(s.splits for s in stats)
+    assert counter.counts["double"] == counter.actions["DOUBLE_DOWN"] == sum(s.doubles for s in stats)
+    # Two cards to each player and to the dealer open every round
+    first = recorder.events[:6]
+    assert [event.kind for event in first] == ["deal"] * 6
+    assert [event.data["player"] for event in first] == ["A", "B", None] * 2
+    settle = recorder.of_kind("settle")
+    assert sum(event.data["net"] for event in settle) == sum(s.net for s in stats)
+    path = tmp_path / "trace.jsonl"
+    recorder.write_jsonl(path)
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(recorder.events)
+    assert [json.loads(line) for line in lines] == [event.to_dict() for event in recorder.events]
+
+def test_verbose_logs_events(capsys, make_game):
+    game = make_game(PLAYERS, seed=8, verbose=True)
+    assert isinstance(game.sinks[0], EventLogger)
+    game.play_round()
+    out = capsys.readouterr().out
+    assert "[round 0] deal player=A" in out and "settle" in out
@@ -0,0 +1,59 @@
+import pytest
+from array import array
+from cards import Card
+from game import Action, Game, Player, Rules
+from strategies import SplitStrategy, Strategy
+
+class DoubleStrategy(Strategy):
+    def next_move(self, hand, dealer_upcard):
+        return Action.DOUBLE_DOWN if len(hand) == 2 else Action.STAND
+
+def stack(game, cards):
+    # Put the given cards on top of an unshuffled one-deck shoe
+    codes = [Card(rank, suit).code for rank, suit in cards]
+    game.shoe._buffer[:len(codes)] = array('B', codes)
+
+def test_rules_property():
+    game = Game(players=[], dealer_hits_soft_17=False, num_decks=2,
+                penetration_threshold=0.5, blackjack_multiplier=1.2, verbose=False)
+    assert game.rules == Rules(num_decks=2, dealer_hits_soft_17=False,
+                               blackjack_multiplier=1.2, penetration_threshold=0.5)
+
+def test_won_double_pays_doubled_wager():
+    player = Player("Dee", bankroll=0.0, strategy=DoubleStrategy())
+    game = Game(players=[player], num_decks=1, shuffle_on_init=False, verbose=False)
+    # Unshuffled: player 2♥ 4♥, dealer 3♥ 5♥, player doubles on 6♥, dealer draws 7♥ 8♥ and busts
+    game.play_round()
+    assert player.bankroll == pytest.approx(2.0)
+
+def test_split_hands_are_settled_with_their_own_wager():
+    player = Player("Sam", bankroll=0.0, strategy=SplitStrategy())
+    game = Game(players=[player], num_decks=1, shuffle_on_init=False, verbose=False)
+    stack(game, [("8", "Hearts"), ("10", "Hearts"), ("8", "Diamonds"), ("6", "Hearts"),
+                 ("10", "Diamonds"), ("9", "Diamonds"), ("10", "Clubs")])
+    game.play_round()
+    assert [hand.total for hand in player.hands] == [18, 17]
+    # Both hands win one unit against the busted dealer
+    assert player.bankroll == pytest.approx(2.0)
+
+def test_reseed_reproduces_random_strategy_rounds():
+    from strategies import RandomStrategy
+    def play(game):
+        for _ in range(200):
+            game.play_round()
+        return game.players[0].bankroll
+    first = Game(players=[Player("R", 0.0, RandomStrategy())], verbose=False, seed=1)
+    second = Game(players=[Player("R", 0.0, RandomStrategy())], verbose=False)
+    second.reseed(1)
+    assert play(first) == play(second)
+
+@pytest.mark.parametrize("model", ["csm", "infinite"])
+def test_game_deals_from_shoe_model(model):
+    from game import GameConfig, PlayerConfig
+    config = GameConfig(players=(PlayerConfig("P", strategy="PerfectStrategy"),),
+                        rules=Rules(num_decks=2, shoe_model=model))
+    game = config.build()
+    for _ in range(100):
+        game.play_round()
+    assert game.rules.shoe_model == model and GameConfig.from_game(game).rules == config.rules
+    assert game.shoe.shoe_index == 100 and game.players[0].stats.hands >= 100
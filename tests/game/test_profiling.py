@@ -0,0 +1,39 @@
+from engine import Simulation
+from game import PHASES, EventCounter, GameProfile
+
+def test_profiling_counts_without_changing_results(make_game):
+    plain, profiled = make_game(num_decks=1, seed=5), make_game(num_decks=1, seed=5)
+    counter = EventCounter()
+    profiled.subscribe(counter)
+    profile = profiled.enable_profiling()
+    for _ in range(300):
+        plain.play_round()
+        profiled.play_round()
+    assert [p.stats for p in plain.players] == [p.stats for p in profiled.players]
+    assert profile.rounds == 300
+    assert len(profile.phase_ns) == len(PHASES) and all(elapsed > 0 for elapsed in profile.phase_ns)
+    assert sum(profile.next_move_calls.values()) == counter.counts["decision"]
+    assert set(profile.next_move_calls) == {"BasicStrategy", "PerfectStrategy"}
+    assert profile.splits == counter.counts["split"] and profile.doubles == counter.counts["double"]
+    assert profile.reshuffles == profiled.shoe.shoe_index > 0
+
+def test_disabling_restores_the_plain_path(make_game):
+    game = make_game(num_decks=1, seed=5)
+    game.enable_profiling()
+    game.play_round()
+    profile = game.disable_profiling()
+    game.play_round()
+    assert profile.rounds == 1 and game.profile is None
+    assert "decide" not in vars(game.players[0])
+
+def test_simulation_profile_report(make_game):
+    result = Simulation(make_game(num_decks=1, seed=5)).run(200, seed=2, profile=True)
+    report = result.profile.as_dict()
+    assert report["rounds"] == 200 and set(report["phases"]) == set(PHASES)
+    assert report["next_move"]["PerfectStrategy"]["calls"] > 0
+    summary = result.profile.summary()
+    assert "next_move[BasicStrategy]" in summary and "reshuffles" in summary
+
+def test_parallel_profiles_are_merged(make_game):
+    result = Simulation(make_game(num_decks=1, seed=5)).run(400, workers=2, seed=3, profile=True)
+    assert isinstance(result.profile, GameProfile) and result.profile.rounds == 400
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from cards import Card, Hand
+from game import Action, Game, Player
+from strategies import (
+    BasicStrategy, CompiledStrategy, PerfectStrategy, RandomStrategy, SafeStrategy, SplitStrategy
+)
+from strategies.compiled_strategy import NUM_STATES, NUM_UPCARDS, hand_state, representative_hands, state_index
+
+def make_hand(*ranks):
+    hand = Hand()
+    hand.add_cards([Card(rank, 'Clubs') for rank in ranks])
+    return hand
+
+def test_state_index_matches_hand_state():
+    assert hand_state(make_hand('8', '8')) == state_index(16, False, True, pair_value=8)
+    assert hand_state(make_hand('A', '6')) == state_index(17, True, True)
+    assert hand_state(make_hand('10', '4', '2')) == state_index(16, False, False)
+    assert hand_state(make_hand('K', 'Q')) == state_index(20, False, True)
+    assert all(0 <= state < NUM_STATES for state in representative_hands())
+
+@pytest.mark.parametrize("strategy_cls", [PerfectStrategy, BasicStrategy, SafeStrategy, SplitStrategy])
+def test_compiled_strategy_agrees_on_every_state(strategy_cls):
+    compiled = CompiledStrategy(strategy_cls())
+    assert compiled.verify() > 0
+    assert compiled.codes.dtype == np.int8
+    assert compiled.table.shape == (NUM_STATES, NUM_UPCARDS)
+
+def test_lookups_match_wrapped_strategy():
+    compiled = CompiledStrategy(PerfectStrategy())
+    upcard = Card('6', 'Hearts')
+    assert compiled.next_move(make_hand('A', '7'), upcard) is Action.DOUBLE_DOWN
+    assert compiled.next_move(make_hand('A', '3', '4'), upcard) is Action.STAND
+    assert compiled.next_move(make_hand('9', '9'), upcard) is Action.SPLIT
+
+def test_verify_rejects_random_strategy():
+    with pytest.raises(ValueError):
+        CompiledStrategy(RandomStrategy()).verify()
+
+def test_compiled_strategy_plays_the_same_game():
+    def play(strategy):
+        player = Player("P", 0.0, strategy)
+        game = Game(players=[player], num_decks=6, verbose=False, seed=12)
+        for _ in range(2000):
+            game.play_round()
+        return player.stats
+    assert play(CompiledStrategy(BasicStrategy())) == play(BasicStrategy())
@@ -0,0 +1,59 @@
+import pytest
+from cards import Card, Hand, Shoe
+from game import Action, Game, Player
+from strategies import ILLUSTRIOUS_18, CompiledStrategy, Deviation, DeviationStrategy, PerfectStrategy
+
+def make_hand(*ranks):
+    hand = Hand()
+    hand.add_cards([Card(rank, 'Clubs') for rank in ranks])
+    return hand
+
+TEN = Card('K', 'Hearts')
+
+def bound_at(strategy, low_cards):
+    # An unshuffled deck deals 2, 3, 4, ... first: each of the first five raises Hi-Lo by one
+    shoe = Shoe(num_decks=1, shuffle_on_init=False)
+    strategy.bind_shoe(shoe)
+    for _ in range(low_cards):
+        shoe.draw_card()
+    return strategy.count.true_count
+
+def test_unbound_strategy_plays_the_base_at_count_zero():
+    strategy = DeviationStrategy()
+    assert strategy.next_move(make_hand('10', '6'), TEN) is Action.STAND
+    assert strategy.next_move(make_hand('10', '5'), TEN) is Action.HIT
+
+def test_deviations_follow_the_true_count():
+    strategy = DeviationStrategy()
+    assert bound_at(strategy, 5) > 5
+    assert strategy.next_move(make_hand('10', '5'), TEN) is Action.STAND
+    assert strategy.next_move(make_hand('K', 'K'), Card('6', 'Hearts')) is Action.SPLIT
+    assert strategy.next_move(make_hand('5', '5'), Card('A', 'Hearts')) is Action.DOUBLE_DOWN
+    # Doubling deviations leave hands of three cards alone
+    assert strategy.next_move(make_hand('2', '3', '5'), Card('A', 'Hearts')) is Action.HIT
+    assert bound_at(strategy, 0) == 0
+    assert strategy.next_move(make_hand('K', 'K'), Card('6', 'Hearts')) is Action.STAND
+
+def test_user_indices_and_buckets():
+    deviations = (Deviation(16, 10, -0.5, Action.HIT, above=False), Deviation(18, 11, 2.5, Action.STAND, soft=True))
+    strategy = DeviationStrategy(deviations=deviations, bucket_width=0.5, min_count=-2, max_count=3)
+    assert len(strategy._tables) == 11
+    assert strategy.bucket(-7) == 0 and strategy.bucket(99) == 10
+    with pytest.raises(ValueError):
+        DeviationStrategy(deviations=deviations)
+    with pytest.raises(ValueError):
+        DeviationStrategy(deviations=(Deviation(16, 10, 0, Action.SPLIT),))
+
+def test_only_deviation_cells_change():
+    base = CompiledStrategy(PerfectStrategy())
+    strategy = DeviationStrategy(base)
+    changed = {i for table in strategy._tables for i, action in enumerate(table) if action is not base._actions[i]}
+    assert changed and len(changed) <= 4 * len(ILLUSTRIOUS_18)
+
+def test_plays_full_games():
+    player = Player("P", 0.0, DeviationStrategy())
+    game = Game(players=[player], num_decks=6, verbose=False, seed=2)
+    for _ in range(500):
+        game.play_round()
+    assert player.strategy.count is game.shoe.counts["hi-lo"]
+    assert player.stats.hands >= 500